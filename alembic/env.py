@@ -30,6 +30,15 @@ config.set_main_option("sqlalchemy.url", sqlalchemy_url)
 # target_metadata = mymodel.Base.metadata
 target_metadata = init_db.Base.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    # As partições de farm_plantation_season (app.db.partitioning) são criadas
+    # fora das migrações e não devem aparecer no autogenerate.
+    if type_ == "table" and reflected and name.startswith("farm_plantation_season_s"):
+        return False
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -53,6 +62,7 @@ def run_migrations_offline() -> None:
         url=url,
         target_metadata=target_metadata,
         literal_binds=True,
+        include_object=include_object,
         dialect_opts={"paramstyle": "named"},
     )
 
@@ -72,7 +82,9 @@ def run_migrations_online() -> None:
     with connectable.connect() as connection:
         context.configure(
             connection=connection,
-            target_metadata=target_metadata)
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
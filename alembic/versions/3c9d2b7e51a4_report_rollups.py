@@ -0,0 +1,68 @@
+"""Report rollups
+
+Revision ID: 3c9d2b7e51a4
+Revises: 7f547301aecc
+Create Date: 2026-10-18 10:12:41.118305
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c9d2b7e51a4"
+down_revision: Union[str, None] = "7f547301aecc"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "report_state_rollup",
+        sa.Column("state", sa.String(), nullable=False),
+        sa.Column("farms_total", sa.Integer(), nullable=False),
+        sa.Column("total_area", sa.Float(), nullable=False),
+        sa.Column("arable_area", sa.Float(), nullable=False),
+        sa.Column("vegetation_area", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("state"),
+    )
+    op.create_table(
+        "report_season_plantation_rollup",
+        sa.Column("state", sa.String(), nullable=False),
+        sa.Column("season_id", sa.Integer(), nullable=False),
+        sa.Column("plantation_id", sa.Integer(), nullable=False),
+        sa.Column("total_plantations", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("state", "season_id", "plantation_id"),
+    )
+
+    # Popula os rollups com os dados existentes
+    op.execute(
+        """
+        INSERT INTO report_state_rollup
+            (state, farms_total, total_area, arable_area, vegetation_area)
+        SELECT state, count(id), sum(total_area), sum(arable_area),
+               sum(vegetation_area)
+        FROM farms
+        GROUP BY state
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO report_season_plantation_rollup
+            (state, season_id, plantation_id, total_plantations)
+        SELECT farms.state, fps.season_id, fps.plantation_id, count(fps.id)
+        FROM farm_plantation_season AS fps
+        JOIN farms ON farms.id = fps.farm_id
+        GROUP BY farms.state, fps.season_id, fps.plantation_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("report_season_plantation_rollup")
+    op.drop_table("report_state_rollup")
@@ -0,0 +1,36 @@
+"""Shared data version
+
+Revision ID: 6b3f8e1c2d45
+Revises: b8e21f6d4a97
+Create Date: 2026-10-18 21:31:08.204417
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6b3f8e1c2d45"
+down_revision: Union[str, None] = "b8e21f6d4a97"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "data_version",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    # Linha única incrementada a cada escrita (app.db.session)
+    op.execute("INSERT INTO data_version (id, version) VALUES (1, 0)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("data_version")
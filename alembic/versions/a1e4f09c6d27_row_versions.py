@@ -0,0 +1,39 @@
+"""Row versions for farms and productors
+
+Revision ID: a1e4f09c6d27
+Revises: 3c9d2b7e51a4
+Create Date: 2026-10-18 11:02:17.540962
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a1e4f09c6d27"
+down_revision: Union[str, None] = "3c9d2b7e51a4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "farms",
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+    )
+    op.add_column(
+        "productors",
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("productors") as batch_op:
+        batch_op.drop_column("version")
+    with op.batch_alter_table("farms") as batch_op:
+        batch_op.drop_column("version")
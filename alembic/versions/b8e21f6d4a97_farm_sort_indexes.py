@@ -0,0 +1,69 @@
+"""Keyset indexes for farm list sort fields
+
+Revision ID: b8e21f6d4a97
+Revises: f7d3a2b8c640
+Create Date: 2026-10-19 09:12:40.527113
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8e21f6d4a97"
+down_revision: Union[str, None] = "f7d3a2b8c640"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# A paginação de GET /farm/ ordena por (campo, id); com o id no índice, a
+# ordenação por name, state e city também sai do índice, sem sort. O índice
+# de city ganha um nome novo para ser criado antes de remover o antigo. No
+# Postgres os índices são criados com CONCURRENTLY, fora da transação da
+# migração, para não bloquear escritas em farms.
+INDEXES = [
+    ("ix_farms_name", ["name", "id"]),
+    ("ix_farms_state", ["state", "id"]),
+    ("ix_farms_city_id", ["city", "id"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(
+                name,
+                "farms",
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        # Prefixo de ix_farms_city_id
+        op.drop_index(
+            "ix_farms_city",
+            table_name="farms",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_farms_city",
+            "farms",
+            ["city"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for name, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name="farms",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,54 @@
+"""Indexes for farm list filters and sorting
+
+Revision ID: c5f83a1d9e02
+Revises: a1e4f09c6d27
+Create Date: 2026-10-18 13:26:05.311842
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c5f83a1d9e02"
+down_revision: Union[str, None] = "a1e4f09c6d27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# No Postgres os índices são criados com CONCURRENTLY, fora da transação da
+# migração, para não bloquear escritas em farms.
+INDEXES = [
+    ("ix_farms_state_city", ["state", "city"]),
+    ("ix_farms_city", ["city"]),
+    ("ix_farms_productor_id", ["productor_id"]),
+    ("ix_farms_total_area", ["total_area", "id"]),
+    ("ix_farms_arable_area", ["arable_area", "id"]),
+    ("ix_farms_vegetation_area", ["vegetation_area", "id"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(
+                name,
+                "farms",
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name="farms",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,67 @@
+"""Unique (farm_id, plantation_id, season_id) on farm_plantation_season
+
+Revision ID: d2a7c4e9b613
+Revises: c5f83a1d9e02
+Create Date: 2026-10-18 14:08:52.907114
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d2a7c4e9b613"
+down_revision: Union[str, None] = "c5f83a1d9e02"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Remove duplicatas criadas por escritas concorrentes, mantendo a
+    # relação mais antiga, e recalcula o rollup de culturas sem elas.
+    op.execute(
+        """
+        DELETE FROM farm_plantation_season
+        WHERE id NOT IN (
+            SELECT min(id)
+            FROM farm_plantation_season
+            GROUP BY farm_id, plantation_id, season_id
+        )
+        """
+    )
+    op.execute("DELETE FROM report_season_plantation_rollup")
+    op.execute(
+        """
+        INSERT INTO report_season_plantation_rollup
+            (state, season_id, plantation_id, total_plantations)
+        SELECT farms.state, fps.season_id, fps.plantation_id, count(fps.id)
+        FROM farm_plantation_season AS fps
+        JOIN farms ON farms.id = fps.farm_id
+        GROUP BY farms.state, fps.season_id, fps.plantation_id
+        """
+    )
+    # No Postgres o índice é criado com CONCURRENTLY, depois do commit da
+    # limpeza acima, para não bloquear escritas em farm_plantation_season.
+    # Se uma duplicata for gravada nesse intervalo, o CREATE falha e deixa um
+    # índice INVALID: remova-o e rode a migração de novo.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ux_farm_plantation_season",
+            "farm_plantation_season",
+            ["farm_id", "plantation_id", "season_id"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ux_farm_plantation_season",
+            table_name="farm_plantation_season",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
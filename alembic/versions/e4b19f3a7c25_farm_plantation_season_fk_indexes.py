@@ -0,0 +1,51 @@
+"""Indexes on farm_plantation_season plantation_id and season_id
+
+Revision ID: e4b19f3a7c25
+Revises: d2a7c4e9b613
+Create Date: 2026-10-18 14:51:30.264719
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4b19f3a7c25"
+down_revision: Union[str, None] = "d2a7c4e9b613"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# No Postgres os índices são criados com CONCURRENTLY, fora da transação da
+# migração, para não bloquear escritas em farm_plantation_season.
+INDEXES = [
+    ("ix_farm_plantation_season_plantation_id", ["plantation_id"]),
+    ("ix_farm_plantation_season_season_id", ["season_id"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(
+                name,
+                "farm_plantation_season",
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name="farm_plantation_season",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
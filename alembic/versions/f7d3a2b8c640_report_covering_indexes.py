@@ -0,0 +1,79 @@
+"""Covering indexes for report aggregates
+
+Revision ID: f7d3a2b8c640
+Revises: e4b19f3a7c25
+Create Date: 2026-10-18 20:52:14.418305
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f7d3a2b8c640"
+down_revision: Union[str, None] = "e4b19f3a7c25"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# As chaves estrangeiras já têm índices (ix_farms_productor_id,
+# ux_farm_plantation_season para farm_id e e4b19f3a7c25 para plantation_id e
+# season_id). No Postgres os índices são criados com CONCURRENTLY, fora da
+# transação da migração, para não bloquear escritas em tabelas grandes.
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        # Criado em todos os bancos, como no modelo; o INCLUDE só vale no
+        # Postgres
+        op.create_index(
+            "ix_farms_state_areas",
+            "farms",
+            ["state"],
+            unique=False,
+            postgresql_include=["total_area", "arable_area", "vegetation_area"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_farm_plantation_season_season_plantation",
+            "farm_plantation_season",
+            ["season_id", "plantation_id"],
+            unique=False,
+            postgresql_include=["farm_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Prefixo do índice acima
+        op.drop_index(
+            "ix_farm_plantation_season_season_id",
+            table_name="farm_plantation_season",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_farm_plantation_season_season_id",
+            "farm_plantation_season",
+            ["season_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_farm_plantation_season_season_plantation",
+            table_name="farm_plantation_season",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_farms_state_areas",
+            table_name="farms",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
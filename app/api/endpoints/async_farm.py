@@ -0,0 +1,148 @@
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Body, Depends, Header, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import BULK_MAX_ITEMS
+from app.db.async_session import get_async_db
+from app.schemas.bulk import BulkResult
+from app.schemas.farm import (
+    Farm,
+    FarmCreate,
+    FarmFilters,
+    FarmPlantation,
+    FarmSeason,
+    FarmSortField,
+    SortOrder,
+)
+from app.schemas.farm_plantation_season import (
+    FarmPlantationSeason,
+    FarmPlantationSeasonBulkCreate,
+    FarmPlantationSeasonCreate,
+)
+from app.services.async_farm_service import AsyncFarmService
+from app.utils.etag import make_etag, raise_if_not_modified
+from app.utils.pagination import NEXT_CURSOR_RESPONSES, set_next_cursor
+from app.utils.serialization import rows_response
+
+router = APIRouter()
+
+
+@router.get("/", response_model=list[Farm], responses=NEXT_CURSOR_RESPONSES)
+async def list_farms(
+    *,
+    session: AsyncSession = Depends(get_async_db),
+    offset: int = 0,
+    limit: int = Query(default=100, le=100),
+    cursor: Optional[str] = None,
+    filters: FarmFilters = Depends(),
+    sort_by: FarmSortField = FarmSortField.id,
+    order: SortOrder = SortOrder.asc,
+    response: Response,
+):
+    farm_service = AsyncFarmService(db=session)
+    farms = await farm_service.list_farms(
+        offset=offset,
+        limit=limit,
+        cursor=cursor,
+        filters=filters,
+        sort_by=sort_by,
+        order=order,
+    )
+    sort_field = None if sort_by == FarmSortField.id else sort_by.value
+    set_next_cursor(response, farms, limit, sort_field=sort_field)
+    return rows_response(Farm, farms, response)
+
+
+@router.post("/", response_model=Farm)
+async def create_farm(
+    *,
+    farm: FarmCreate,
+    session: AsyncSession = Depends(get_async_db),
+):
+    farm_service = AsyncFarmService(db=session)
+    return await farm_service.create_farm(farm)
+
+
+@router.post("/bulk", response_model=BulkResult)
+async def create_farms(
+    *,
+    farms: Annotated[list[FarmCreate], Body(max_length=BULK_MAX_ITEMS)],
+    session: AsyncSession = Depends(get_async_db),
+):
+    farm_service = AsyncFarmService(db=session)
+    return await farm_service.create_farms(farms)
+
+
+@router.post("/bulk/add-plantation", response_model=BulkResult)
+async def add_plantations(
+    *,
+    farm_plantations: Annotated[
+        list[FarmPlantationSeasonBulkCreate], Body(max_length=BULK_MAX_ITEMS)
+    ],
+    session: AsyncSession = Depends(get_async_db),
+):
+    farm_service = AsyncFarmService(db=session)
+    return await farm_service.add_plantations(farm_plantations)
+
+
+@router.get("/{farm_id}", response_model=Farm)
+async def get_farm(
+    *,
+    farm_id: int,
+    session: AsyncSession = Depends(get_async_db),
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+):
+    farm_service = AsyncFarmService(db=session)
+    if if_none_match:
+        etag = await farm_service.get_farm_etag(farm_id)
+        if etag:
+            raise_if_not_modified(if_none_match, etag)
+    farm = await farm_service.get_farm_by_id(farm_id)
+    response.headers["ETag"] = make_etag("farm", farm.id, farm.version)
+    return farm
+
+
+@router.put("/{farm_id}", response_model=Farm)
+async def update_farm(
+    *,
+    session: AsyncSession = Depends(get_async_db),
+    farm_id: int,
+    farm: FarmCreate,
+):
+    farm_service = AsyncFarmService(db=session)
+    return await farm_service.update_farm(farm_id, farm)
+
+
+@router.put("/{farm_id}/add-plantation", response_model=FarmPlantationSeason)
+async def add_plantation(
+    *,
+    session: AsyncSession = Depends(get_async_db),
+    farm_id: int,
+    plantation_season: FarmPlantationSeasonCreate,
+):
+    farm_service = AsyncFarmService(db=session)
+    return await farm_service.add_plantation(farm_id, plantation_season)
+
+
+@router.delete("/{farm_id}", response_model=Farm)
+async def delete_farm(*, session: AsyncSession = Depends(get_async_db), farm_id: int):
+    farm_service = AsyncFarmService(db=session)
+    return await farm_service.remove_farm(farm_id)
+
+
+@router.get("/{farm_id}/plantations", response_model=list[FarmPlantation])
+async def get_farm_plantations(
+    *, farm_id: int, session: AsyncSession = Depends(get_async_db)
+):
+    farm_service = AsyncFarmService(db=session)
+    return await farm_service.get_farm_plantations(farm_id)
+
+
+@router.get("/{farm_id}/seasons", response_model=list[FarmSeason])
+async def get_farm_seasons(
+    *, farm_id: int, session: AsyncSession = Depends(get_async_db)
+):
+    farm_service = AsyncFarmService(db=session)
+    return await farm_service.get_farm_seasons(farm_id)
@@ -0,0 +1,66 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.async_session import get_async_db
+from app.schemas.plantation import Plantation, PlantationCreate
+from app.services.async_plantation_service import AsyncPlantationService
+from app.utils.pagination import NEXT_CURSOR_RESPONSES, set_next_cursor
+from app.utils.serialization import rows_response
+
+router = APIRouter()
+
+
+@router.get("/", response_model=list[Plantation], responses=NEXT_CURSOR_RESPONSES)
+async def list_plantations(
+    *,
+    session: AsyncSession = Depends(get_async_db),
+    offset: int = 0,
+    limit: int = Query(default=100, le=100),
+    cursor: Optional[str] = None,
+    response: Response,
+):
+    plantation_service = AsyncPlantationService(db=session)
+    plantations = await plantation_service.list_plantations(
+        offset=offset, limit=limit, cursor=cursor
+    )
+    set_next_cursor(response, plantations, limit)
+    return rows_response(Plantation, plantations, response)
+
+
+@router.post("/", response_model=Plantation)
+async def create_plantation(
+    *,
+    plantation: PlantationCreate,
+    session: AsyncSession = Depends(get_async_db),
+):
+    plantation_service = AsyncPlantationService(db=session)
+    return await plantation_service.create_plantation(plantation)
+
+
+@router.get("/{plantation_id}", response_model=Plantation)
+async def get_plantation(
+    *, plantation_id: int, session: AsyncSession = Depends(get_async_db)
+):
+    plantation_service = AsyncPlantationService(db=session)
+    return await plantation_service.get_plantation_by_id(plantation_id)
+
+
+@router.put("/{plantation_id}", response_model=Plantation)
+async def update_plantation(
+    *,
+    session: AsyncSession = Depends(get_async_db),
+    plantation_id: int,
+    plantation: PlantationCreate,
+):
+    plantation_service = AsyncPlantationService(db=session)
+    return await plantation_service.update_plantation(plantation_id, plantation)
+
+
+@router.delete("/{plantation_id}", response_model=Plantation)
+async def delete_plantation(
+    *, session: AsyncSession = Depends(get_async_db), plantation_id: int
+):
+    plantation_service = AsyncPlantationService(db=session)
+    return await plantation_service.remove_plantation(plantation_id)
@@ -0,0 +1,89 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.async_session import get_async_db
+from app.schemas.farm import Farm
+from app.schemas.productor import Productor, ProductorCreate
+from app.services.async_productor_service import AsyncProductorService
+from app.utils.etag import make_etag, raise_if_not_modified
+from app.utils.pagination import NEXT_CURSOR_RESPONSES, set_next_cursor
+from app.utils.serialization import rows_response
+
+router = APIRouter()
+
+
+@router.get("/", response_model=list[Productor], responses=NEXT_CURSOR_RESPONSES)
+async def list_productors(
+    *,
+    session: AsyncSession = Depends(get_async_db),
+    offset: int = 0,
+    limit: int = Query(default=100, le=100),
+    cursor: Optional[str] = None,
+    response: Response,
+):
+    productor_service = AsyncProductorService(session)
+    productors = await productor_service.list_productors(
+        offset=offset, limit=limit, cursor=cursor
+    )
+    set_next_cursor(response, productors, limit)
+    return rows_response(Productor, productors, response)
+
+
+@router.post("/", response_model=Productor)
+async def create_productor(
+    *,
+    productor: ProductorCreate,
+    session: AsyncSession = Depends(get_async_db),
+):
+    productor_service = AsyncProductorService(session)
+    return await productor_service.create_productor(productor)
+
+
+@router.get("/{productor_id}", response_model=Productor)
+async def get_productor(
+    *,
+    productor_id: int,
+    session: AsyncSession = Depends(get_async_db),
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+):
+    productor_service = AsyncProductorService(session)
+    if if_none_match:
+        etag = await productor_service.get_productor_etag(productor_id)
+        if etag:
+            raise_if_not_modified(if_none_match, etag)
+    productor = await productor_service.get_productor_by_id(productor_id)
+    response.headers["ETag"] = make_etag(
+        "productor", productor.id, productor.version)
+    return productor
+
+
+@router.put("/{productor_id}", response_model=Productor)
+async def update_productor(
+    *,
+    session: AsyncSession = Depends(get_async_db),
+    productor_id: int,
+    productor: ProductorCreate,
+):
+    productor_service = AsyncProductorService(session)
+    return await productor_service.update_productor(productor_id, productor)
+
+
+@router.delete("/{productor_id}", response_model=Productor)
+async def delete_productor(
+    *, session: AsyncSession = Depends(get_async_db), productor_id: int
+):
+    productor_service = AsyncProductorService(session)
+    return await productor_service.delete_productor(productor_id)
+
+
+@router.get("/{productor_id}/farms", response_model=list[Farm])
+async def get_productor_farms(
+    *, productor_id: int, session: AsyncSession = Depends(get_async_db)
+):
+    productor_service = AsyncProductorService(session)
+    return rows_response(
+        Farm, await productor_service.get_productor_farms(productor_id)
+    )
@@ -0,0 +1,130 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.endpoints.reports import check_report_etag
+from app.db.async_session import get_async_db
+from app.schemas.reports import (
+    DASHBOARD_SECTIONS,
+    Dashboard,
+    DashboardSection,
+    GroundUseStatistics,
+    PlantationStatistics,
+    StateStatistics,
+    TotalArea,
+    TotalFarms,
+)
+from app.services.async_reports_service import AsyncReportsService
+from app.utils.serialization import trusted_response
+
+router = APIRouter()
+
+
+@router.get("/total-farms", response_model=TotalFarms)
+async def get_total_farms(
+    *,
+    session: AsyncSession = Depends(get_async_db),
+    use_cache: bool = True,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+):
+    reports_service = AsyncReportsService(db=session, use_cache=use_cache)
+    check_report_etag(
+        await reports_service.data_version(), response, if_none_match)
+    return trusted_response(await reports_service.get_total_farms(), response)
+
+
+@router.get("/total-area", response_model=TotalArea)
+async def get_total_area(
+    *,
+    session: AsyncSession = Depends(get_async_db),
+    use_cache: bool = True,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+):
+    reports_service = AsyncReportsService(db=session, use_cache=use_cache)
+    check_report_etag(
+        await reports_service.data_version(), response, if_none_match)
+    return trusted_response(await reports_service.get_total_area(), response)
+
+
+@router.get("/state-statistics", response_model=list[StateStatistics])
+async def get_state_statistics(
+    *,
+    session: AsyncSession = Depends(get_async_db),
+    use_cache: bool = True,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+):
+    reports_service = AsyncReportsService(db=session, use_cache=use_cache)
+    check_report_etag(
+        await reports_service.data_version(), response, if_none_match)
+    return trusted_response(
+        await reports_service.get_state_statistics(), response
+    )
+
+
+@router.get("/plantation-statistics",
+            response_model=list[PlantationStatistics])
+async def get_plantation_statistics(
+    *,
+    session: AsyncSession = Depends(get_async_db),
+    use_cache: bool = True,
+    season_from: Optional[int] = None,
+    season_to: Optional[int] = None,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+):
+    reports_service = AsyncReportsService(db=session, use_cache=use_cache)
+    check_report_etag(
+        await reports_service.data_version(), response, if_none_match)
+    plantation_statistics = await reports_service.get_plantation_statistics(
+        season_from=season_from,
+        season_to=season_to,
+        year_from=year_from,
+        year_to=year_to,
+    )
+    return trusted_response(plantation_statistics, response)
+
+
+@router.get("/ground-use-statistics", response_model=GroundUseStatistics)
+async def get_ground_use_statistics(
+    *,
+    session: AsyncSession = Depends(get_async_db),
+    use_cache: bool = True,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+):
+    reports_service = AsyncReportsService(db=session, use_cache=use_cache)
+    check_report_etag(
+        await reports_service.data_version(), response, if_none_match)
+    return trusted_response(
+        await reports_service.get_ground_use_statistics(), response
+    )
+
+
+@router.get(
+    "/dashboard", response_model=Dashboard, response_model_exclude_none=True
+)
+async def get_dashboard(
+    *,
+    session: AsyncSession = Depends(get_async_db),
+    use_cache: bool = True,
+    sections: Optional[list[DashboardSection]] = Query(default=None),
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+):
+    reports_service = AsyncReportsService(db=session, use_cache=use_cache)
+    check_report_etag(
+        await reports_service.data_version(), response, if_none_match)
+    selected = (
+        tuple(sorted({section.value for section in sections}))
+        if sections
+        else DASHBOARD_SECTIONS
+    )
+    return trusted_response(
+        await reports_service.get_dashboard(selected), response
+    )
@@ -0,0 +1,64 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.async_session import get_async_db
+from app.schemas.season import Season, SeasonCreate
+from app.services.async_season_service import AsyncSeasonService
+from app.utils.pagination import NEXT_CURSOR_RESPONSES, set_next_cursor
+from app.utils.serialization import rows_response
+
+router = APIRouter()
+
+
+@router.get("/", response_model=list[Season], responses=NEXT_CURSOR_RESPONSES)
+async def list_seasons(
+    *,
+    session: AsyncSession = Depends(get_async_db),
+    offset: int = 0,
+    limit: int = Query(default=100, le=100),
+    cursor: Optional[str] = None,
+    response: Response,
+):
+    season_service = AsyncSeasonService(db=session)
+    seasons = await season_service.list_seasons(
+        offset=offset, limit=limit, cursor=cursor
+    )
+    set_next_cursor(response, seasons, limit)
+    return rows_response(Season, seasons, response)
+
+
+@router.post("/", response_model=Season)
+async def create_season(
+    *,
+    season: SeasonCreate,
+    session: AsyncSession = Depends(get_async_db),
+):
+    season_service = AsyncSeasonService(db=session)
+    return await season_service.create_season(season)
+
+
+@router.get("/{season_id}", response_model=Season)
+async def get_season(*, season_id: int, session: AsyncSession = Depends(get_async_db)):
+    season_service = AsyncSeasonService(db=session)
+    return await season_service.get_season_by_id(season_id)
+
+
+@router.put("/{season_id}", response_model=Season)
+async def update_season(
+    *,
+    session: AsyncSession = Depends(get_async_db),
+    season_id: int,
+    season: SeasonCreate,
+):
+    season_service = AsyncSeasonService(db=session)
+    return await season_service.update_season(season_id, season)
+
+
+@router.delete("/{season_id}", response_model=Season)
+async def delete_season(
+    *, session: AsyncSession = Depends(get_async_db), season_id: int
+):
+    season_service = AsyncSeasonService(db=session)
+    return await season_service.remove_season(season_id)
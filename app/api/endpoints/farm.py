@@ -1,28 +1,92 @@
-from fastapi import APIRouter, Depends, Query
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Body, Depends, Header, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from app.core.config import BULK_MAX_ITEMS
 from app.core.logger import logger
+from app.db.replica import get_read_db
 from app.db.session import get_db
-from app.schemas.farm import Farm, FarmCreate, FarmPlantation, FarmSeason
+from app.schemas.bulk import BulkResult
+from app.schemas.farm import (
+    ExportFormat,
+    Farm,
+    FarmCreate,
+    FarmFilters,
+    FarmPlantation,
+    FarmSeason,
+    FarmSortField,
+    SortOrder,
+)
 from app.schemas.farm_plantation_season import (
     FarmPlantationSeason,
+    FarmPlantationSeasonBulkCreate,
     FarmPlantationSeasonCreate,
 )
 from app.services.farm_service import FarmService
+from app.utils.etag import make_etag, raise_if_not_modified
+from app.utils.pagination import NEXT_CURSOR_RESPONSES, set_next_cursor
+from app.utils.serialization import rows_response
 
 router = APIRouter()
 session = get_db()
 
 
-@router.get("/", response_model=list[Farm])
+@router.get("/", response_model=list[Farm], responses=NEXT_CURSOR_RESPONSES)
 def list_farms(
     *,
-    session: Session = Depends(get_db),
+    session: Session = Depends(get_read_db),
     offset: int = 0,
     limit: int = Query(default=100, le=100),
+    cursor: Optional[str] = None,
+    filters: FarmFilters = Depends(),
+    sort_by: FarmSortField = FarmSortField.id,
+    order: SortOrder = SortOrder.asc,
+    response: Response,
+):
+    farm_service = FarmService(db=session)
+    farms = farm_service.list_farms(
+        offset=offset,
+        limit=limit,
+        cursor=cursor,
+        filters=filters,
+        sort_by=sort_by,
+        order=order,
+    )
+    sort_field = None if sort_by == FarmSortField.id else sort_by.value
+    set_next_cursor(response, farms, limit, sort_field=sort_field)
+    return rows_response(Farm, farms, response)
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv",
+}
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_farms(
+    *,
+    session: Session = Depends(get_read_db),
+    export_format: ExportFormat = Query(default=ExportFormat.ndjson, alias="format"),
+    filters: FarmFilters = Depends(),
+    include_productor: bool = False,
+    include_plantations: bool = False,
 ):
     farm_service = FarmService(db=session)
-    return farm_service.list_farms(offset=offset, limit=limit)
+    chunks = farm_service.export_farms(
+        export_format=export_format,
+        filters=filters,
+        include_productor=include_productor,
+        include_plantations=include_plantations,
+    )
+    filename = f"farms.{export_format.value}"
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.post("/", response_model=Farm)
@@ -35,10 +99,44 @@ def create_farm(
     return farm_service.create_farm(farm)
 
 
+@router.post("/bulk", response_model=BulkResult)
+def create_farms(
+    *,
+    farms: Annotated[list[FarmCreate], Body(max_length=BULK_MAX_ITEMS)],
+    session: Session = Depends(get_db),
+):
+    farm_service = FarmService(db=session)
+    return farm_service.create_farms(farms)
+
+
+@router.post("/bulk/add-plantation", response_model=BulkResult)
+def add_plantations(
+    *,
+    farm_plantations: Annotated[
+        list[FarmPlantationSeasonBulkCreate], Body(max_length=BULK_MAX_ITEMS)
+    ],
+    session: Session = Depends(get_db),
+):
+    farm_service = FarmService(db=session)
+    return farm_service.add_plantations(farm_plantations)
+
+
 @router.get("/{farm_id}", response_model=Farm)
-def get_farm(*, farm_id: int, session: Session = Depends(get_db)):
+def get_farm(
+    *,
+    farm_id: int,
+    session: Session = Depends(get_db),
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+):
     farm_service = FarmService(db=session)
-    return farm_service.get_farm_by_id(farm_id)
+    if if_none_match:
+        etag = farm_service.get_farm_etag(farm_id)
+        if etag:
+            raise_if_not_modified(if_none_match, etag)
+    farm = farm_service.get_farm_by_id(farm_id)
+    response.headers["ETag"] = make_etag("farm", farm.id, farm.version)
+    return farm
 
 
 @router.put("/{farm_id}", response_model=Farm)
@@ -1,8 +1,35 @@
 from fastapi import APIRouter
 
+from app.db.async_session import current_async_engine
+from app.db.pool import pool_status
+from app.db.replica import replica_router
+from app.db.session import engine
+from app.services.reports_service import reports_cache
+
 router = APIRouter()
 
 
 @router.get("/")
 def health_check():
     return {"status": "ok"}
+
+
+@router.get("/cache")
+def cache_stats():
+    return {"reports": reports_cache.stats()}
+
+
+@router.get("/pool")
+def pool_stats():
+    stats = {"sync": pool_status(engine.pool)}
+    async_engine = current_async_engine()
+    if async_engine is not None:
+        stats["async"] = pool_status(async_engine.pool)
+    if replica_router.engine is not None:
+        stats["replica"] = pool_status(replica_router.engine.pool)
+    return stats
+
+
+@router.get("/replica")
+def replica_stats():
+    return replica_router.stats()
@@ -1,24 +1,35 @@
-from fastapi import APIRouter, Depends, Query
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 
 from app.core.logger import logger
+from app.db.replica import get_read_db
 from app.db.session import get_db
 from app.schemas.plantation import Plantation, PlantationCreate
 from app.services.plantation_service import PlantationService
+from app.utils.pagination import NEXT_CURSOR_RESPONSES, set_next_cursor
+from app.utils.serialization import rows_response
 
 router = APIRouter()
 session = get_db()
 
 
-@router.get("/", response_model=list[Plantation])
+@router.get("/", response_model=list[Plantation], responses=NEXT_CURSOR_RESPONSES)
 def list_plantations(
     *,
-    session: Session = Depends(get_db),
+    session: Session = Depends(get_read_db),
     offset: int = 0,
     limit: int = Query(default=100, le=100),
+    cursor: Optional[str] = None,
+    response: Response,
 ):
     plantation_service = PlantationService(db=session)
-    return plantation_service.list_plantations(offset=offset, limit=limit)
+    plantations = plantation_service.list_plantations(
+        offset=offset, limit=limit, cursor=cursor
+    )
+    set_next_cursor(response, plantations, limit)
+    return rows_response(Plantation, plantations, response)
 
 
 @router.post("/", response_model=Plantation)
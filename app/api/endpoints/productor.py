@@ -1,25 +1,40 @@
-from fastapi import APIRouter, Depends, Query
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from sqlalchemy.orm import Session
 
+from app.db.replica import get_read_db
 from app.db.session import get_db
 from app.schemas.farm import Farm
-from app.schemas.productor import Productor, ProductorCreate
+from app.schemas.productor import ImportFormat, Productor, ProductorCreate
 from app.services.productor_service import ProductorService
+from app.utils.etag import make_etag, raise_if_not_modified
+from app.utils.pagination import NEXT_CURSOR_RESPONSES, set_next_cursor
+from app.utils.serialization import rows_response
+from app.utils.upload import spool_request_body
 
 router = APIRouter()
 
 
-@router.get("/", response_model=list[Productor])
+@router.get("/", response_model=list[Productor], responses=NEXT_CURSOR_RESPONSES)
 def list_productors(
     *,
-    session: Session = Depends(get_db),
+    session: Session = Depends(get_read_db),
     offset: int = 0,
     limit: int = Query(default=100, le=100),
+    cursor: Optional[str] = None,
+    response: Response,
 ):
     # tables = session.execute(text("SELECT name FROM sqlite_master WHERE type='table';")).fetchall()
     # print("Tabelas disponíveis na  LIST:", tables)
     productor_service = ProductorService(session)
-    return productor_service.list_productors(offset=offset, limit=limit)
+    productors = productor_service.list_productors(
+        offset=offset, limit=limit, cursor=cursor
+    )
+    set_next_cursor(response, productors, limit)
+    return rows_response(Productor, productors, response)
 
 
 @router.post("/", response_model=Productor)
@@ -34,10 +49,41 @@ def create_productor(
     return productor_service.create_productor(productor)
 
 
+@router.post("/import", response_class=StreamingResponse)
+async def import_productors(
+    *,
+    request: Request,
+    session: Session = Depends(get_db),
+    import_format: ImportFormat = Query(default=ImportFormat.ndjson, alias="format"),
+):
+    # O corpo é copiado para um arquivo temporário (em disco acima de 1 MB) e
+    # lido em lotes; o relatório é enviado à medida que cada lote é gravado.
+    source = await spool_request_body(request)
+    productor_service = ProductorService(session)
+    return StreamingResponse(
+        productor_service.import_productors(source, import_format),
+        media_type="application/x-ndjson",
+        background=BackgroundTask(source.close),
+    )
+
+
 @router.get("/{productor_id}", response_model=Productor)
-def get_productor(*, productor_id: int, session: Session = Depends(get_db)):
+def get_productor(
+    *,
+    productor_id: int,
+    session: Session = Depends(get_db),
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+):
     productor_service = ProductorService(session)
-    return productor_service.get_productor_by_id(productor_id)
+    if if_none_match:
+        etag = productor_service.get_productor_etag(productor_id)
+        if etag:
+            raise_if_not_modified(if_none_match, etag)
+    productor = productor_service.get_productor_by_id(productor_id)
+    response.headers["ETag"] = make_etag(
+        "productor", productor.id, productor.version)
+    return productor
 
 
 @router.put("/{productor_id}", response_model=Productor)
@@ -58,4 +104,4 @@ def delete_productor(*, session: Session = Depends(get_db), productor_id: int):
 def get_productor_farms(*, productor_id: int,
                         session: Session = Depends(get_db)):
     productor_service = ProductorService(session)
-    return productor_service.get_productor_farms(productor_id)
+    return rows_response(Farm, productor_service.get_productor_farms(productor_id))
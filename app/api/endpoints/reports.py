@@ -1,9 +1,15 @@
-from fastapi import APIRouter, Depends
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, Query, Response
 from sqlalchemy.orm import Session
 
 from app.core.logger import logger
+from app.db.replica import get_read_db
 from app.db.session import get_db
 from app.schemas.reports import (
+    DASHBOARD_SECTIONS,
+    Dashboard,
+    DashboardSection,
     GroundUseStatistics,
     PlantationStatistics,
     StateStatistics,
@@ -11,52 +17,117 @@ from app.schemas.reports import (
     TotalFarms,
 )
 from app.services.reports_service import ReportsService
+from app.utils.etag import make_etag, raise_if_not_modified
+from app.utils.serialization import trusted_response
 
 router = APIRouter()
 session = get_db()
 
 
+def check_report_etag(
+    version: int, response: Response, if_none_match: Optional[str]
+):
+    """
+    ETag dos relatórios, derivado da versão dos dados (a mesma em todos os
+    workers). Responde 304 antes de calcular ou serializar o relatório.
+    """
+    etag = make_etag("reports", version)
+    raise_if_not_modified(if_none_match, etag)
+    response.headers["ETag"] = etag
+
+
 @router.get("/total-farms", response_model=TotalFarms)
 def get_total_farms(
     *,
-    session: Session = Depends(get_db),
+    session: Session = Depends(get_read_db),
+    use_cache: bool = True,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
 ):
-    reports_service = ReportsService(db=session)
-    return reports_service.get_total_farms()
+    reports_service = ReportsService(db=session, use_cache=use_cache)
+    check_report_etag(reports_service.data_version(), response, if_none_match)
+    return trusted_response(reports_service.get_total_farms(), response)
 
 
 @router.get("/total-area", response_model=TotalArea)
 def get_total_area(
     *,
-    session: Session = Depends(get_db),
+    session: Session = Depends(get_read_db),
+    use_cache: bool = True,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
 ):
-    reports_service = ReportsService(db=session)
-    return reports_service.get_total_area()
+    reports_service = ReportsService(db=session, use_cache=use_cache)
+    check_report_etag(reports_service.data_version(), response, if_none_match)
+    return trusted_response(reports_service.get_total_area(), response)
 
 
 @router.get("/state-statistics", response_model=list[StateStatistics])
 def get_state_statistics(
     *,
-    session: Session = Depends(get_db),
+    session: Session = Depends(get_read_db),
+    use_cache: bool = True,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
 ):
-    reports_service = ReportsService(db=session)
-    return reports_service.get_state_statistics()
+    reports_service = ReportsService(db=session, use_cache=use_cache)
+    check_report_etag(reports_service.data_version(), response, if_none_match)
+    return trusted_response(reports_service.get_state_statistics(), response)
 
 
 @router.get("/plantation-statistics",
             response_model=list[PlantationStatistics])
 def get_plantation_statistics(
     *,
-    session: Session = Depends(get_db),
+    session: Session = Depends(get_read_db),
+    use_cache: bool = True,
+    season_from: Optional[int] = None,
+    season_to: Optional[int] = None,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
 ):
-    reports_service = ReportsService(db=session)
-    return reports_service.get_plantation_statistics()
+    reports_service = ReportsService(db=session, use_cache=use_cache)
+    check_report_etag(reports_service.data_version(), response, if_none_match)
+    plantation_statistics = reports_service.get_plantation_statistics(
+        season_from=season_from,
+        season_to=season_to,
+        year_from=year_from,
+        year_to=year_to,
+    )
+    return trusted_response(plantation_statistics, response)
 
 
 @router.get("/ground-use-statistics", response_model=GroundUseStatistics)
 def get_ground_use_statistics(
     *,
-    session: Session = Depends(get_db),
+    session: Session = Depends(get_read_db),
+    use_cache: bool = True,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+):
+    reports_service = ReportsService(db=session, use_cache=use_cache)
+    check_report_etag(reports_service.data_version(), response, if_none_match)
+    return trusted_response(reports_service.get_ground_use_statistics(), response)
+
+
+@router.get(
+    "/dashboard", response_model=Dashboard, response_model_exclude_none=True
+)
+def get_dashboard(
+    *,
+    session: Session = Depends(get_read_db),
+    use_cache: bool = True,
+    sections: Optional[list[DashboardSection]] = Query(default=None),
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
 ):
-    reports_service = ReportsService(db=session)
-    return reports_service.get_ground_use_statistics()
+    reports_service = ReportsService(db=session, use_cache=use_cache)
+    check_report_etag(reports_service.data_version(), response, if_none_match)
+    selected = (
+        tuple(sorted({section.value for section in sections}))
+        if sections
+        else DASHBOARD_SECTIONS
+    )
+    return trusted_response(reports_service.get_dashboard(selected), response)
@@ -1,24 +1,35 @@
-from fastapi import APIRouter, Depends, Query
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 
 from app.core.logger import logger
+from app.db.replica import get_read_db
 from app.db.session import get_db
 from app.schemas.season import Season, SeasonCreate
 from app.services.season_service import SeasonService
+from app.utils.pagination import NEXT_CURSOR_RESPONSES, set_next_cursor
+from app.utils.serialization import rows_response
 
 router = APIRouter()
 session = get_db()
 
 
-@router.get("/", response_model=list[Season])
+@router.get("/", response_model=list[Season], responses=NEXT_CURSOR_RESPONSES)
 def list_seasons(
     *,
-    session: Session = Depends(get_db),
+    session: Session = Depends(get_read_db),
     offset: int = 0,
     limit: int = Query(default=100, le=100),
+    cursor: Optional[str] = None,
+    response: Response,
 ):
     season_service = SeasonService(db=session)
-    return season_service.list_seasons(offset=offset, limit=limit)
+    seasons = season_service.list_seasons(
+        offset=offset, limit=limit, cursor=cursor
+    )
+    set_next_cursor(response, seasons, limit)
+    return rows_response(Season, seasons, response)
 
 
 @router.post("/", response_model=Season)
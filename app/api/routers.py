@@ -1,18 +1,83 @@
 from fastapi import APIRouter
 
-from app.api.endpoints import farm, health, plantation, productor, reports, season
-
-router = APIRouter()
-
-router.include_router(health.router, prefix="/health", tags=["health"])
-router.include_router(
-    productor.router,
-    prefix="/productor",
-    tags=["productor"])
-router.include_router(farm.router, prefix="/farm", tags=["farm"])
-router.include_router(
-    plantation.router,
-    prefix="/plantation",
-    tags=["plantation"])
-router.include_router(season.router, prefix="/season", tags=["season"])
-router.include_router(reports.router, prefix="/reports", tags=["reports"])
+from app.api.endpoints import (
+    async_farm,
+    async_plantation,
+    async_productor,
+    async_reports,
+    async_season,
+    farm,
+    health,
+    plantation,
+    productor,
+    reports,
+    season,
+)
+from app.core.config import DATABASE_ASYNC
+
+
+def _with_async_routes(sync_router: APIRouter, async_router: APIRouter) -> APIRouter:
+    """
+    Combina as rotas assíncronas com as síncronas que não têm versão
+    assíncrona (ex.: POST /productor/import e GET /farm/export). As rotas
+    ficam na ordem do router síncrono, para que /farm/export continue antes
+    de /farm/{farm_id}.
+    """
+    async_routes = {
+        (route.path, method): route
+        for route in async_router.routes
+        for method in route.methods
+    }
+    combined = APIRouter()
+    for route in sync_router.routes:
+        replacement = next(
+            (
+                async_routes[(route.path, method)]
+                for method in route.methods
+                if (route.path, method) in async_routes
+            ),
+            route,
+        )
+        if replacement not in combined.routes:
+            combined.routes.append(replacement)
+    combined.routes.extend(
+        route for route in async_router.routes if route not in combined.routes
+    )
+    return combined
+
+
+def build_router(async_database: bool = False) -> APIRouter:
+    """
+    Monta as rotas da API. Com ``async_database`` os endpoints usam a pilha
+    assíncrona (AsyncSession), exceto as rotas que só têm versão síncrona.
+    """
+    productor_router = productor.router
+    farm_router = farm.router
+    plantation_router = plantation.router
+    season_router = season.router
+    reports_router = reports.router
+    if async_database:
+        productor_router = _with_async_routes(productor.router, async_productor.router)
+        farm_router = _with_async_routes(farm.router, async_farm.router)
+        plantation_router = _with_async_routes(
+            plantation.router, async_plantation.router)
+        season_router = _with_async_routes(season.router, async_season.router)
+        reports_router = _with_async_routes(reports.router, async_reports.router)
+
+    router = APIRouter()
+    router.include_router(health.router, prefix="/health", tags=["health"])
+    router.include_router(
+        productor_router,
+        prefix="/productor",
+        tags=["productor"])
+    router.include_router(farm_router, prefix="/farm", tags=["farm"])
+    router.include_router(
+        plantation_router,
+        prefix="/plantation",
+        tags=["plantation"])
+    router.include_router(season_router, prefix="/season", tags=["season"])
+    router.include_router(reports_router, prefix="/reports", tags=["reports"])
+    return router
+
+
+router = build_router(DATABASE_ASYNC)
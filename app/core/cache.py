@@ -0,0 +1,156 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+
+class VersionedCache:
+    """
+    Cache LRU em memória cujas entradas são válidas enquanto a versão dos
+    dados não mudar (com TTL como limite de segurança). A versão é informada
+    a cada consulta ou, se omitida, obtida da função ``version``.
+
+    Misses concorrentes para a mesma chave são coalescidos: apenas uma
+    thread (ou task, em ``aget_or_compute``) calcula o valor e as demais
+    aguardam o resultado.
+    """
+
+    def __init__(
+        self,
+        version: Optional[Callable[[], int]] = None,
+        max_entries: int = 256,
+        ttl: float = 60.0,
+    ):
+        self._version = version
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+        self._inflight: dict[Hashable, threading.Event] = {}
+        self._async_inflight: dict[Hashable, asyncio.Event] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Any],
+        version: Optional[int] = None,
+    ) -> Any:
+        """
+        Retorna o valor em cache para ``key`` ou o calcula com ``compute``.
+
+        Args:
+            key (Hashable): Chave da entrada.
+            compute (Callable): Função que calcula o valor em caso de miss.
+            version (int): Versão atual dos dados (opcional).
+
+        Returns:
+            Any: O valor em cache ou recém-calculado.
+        """
+        if version is None:
+            version = self._version()
+        while True:
+            with self._lock:
+                if self._lookup(key, version):
+                    return self._entries[key][0]
+                waiter = self._inflight.get(key)
+                if waiter is None:
+                    waiter = threading.Event()
+                    self._inflight[key] = waiter
+                    self.misses += 1
+                    break
+                self.coalesced += 1
+
+            # Outra thread já está calculando esta chave: aguarda e verifica
+            # de novo (se ela falhar ou os dados mudarem, recalcula).
+            waiter.wait()
+
+        try:
+            value = compute()
+            self._store(key, value, version)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            waiter.set()
+
+    async def aget_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Any]],
+        version: int,
+    ) -> Any:
+        """
+        Versão assíncrona de ``get_or_compute``: os misses concorrentes
+        aguardam com ``asyncio.Event``, sem bloquear o event loop em que o
+        cálculo da primeira task ainda precisa rodar.
+
+        Args:
+            key (Hashable): Chave da entrada.
+            compute (Callable): Corrotina que calcula o valor em caso de miss.
+            version (int): Versão atual dos dados.
+
+        Returns:
+            Any: O valor em cache ou recém-calculado.
+        """
+        while True:
+            with self._lock:
+                if self._lookup(key, version):
+                    return self._entries[key][0]
+                waiter = self._async_inflight.get(key)
+                if waiter is None:
+                    waiter = asyncio.Event()
+                    self._async_inflight[key] = waiter
+                    self.misses += 1
+                    break
+                self.coalesced += 1
+            await waiter.wait()
+
+        try:
+            value = await compute()
+            self._store(key, value, version)
+            return value
+        finally:
+            with self._lock:
+                self._async_inflight.pop(key, None)
+            waiter.set()
+
+    def _lookup(self, key: Hashable, version: int) -> bool:
+        """Registra um hit se a entrada existir para esta versão (com o lock)."""
+        entry = self._entries.get(key)
+        if (
+            entry is not None
+            and entry[1] == version
+            and time.monotonic() - entry[2] < self.ttl
+        ):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True
+        return False
+
+    def _store(self, key: Hashable, value: Any, version: int):
+        with self._lock:
+            self._entries[key] = (value, version, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
@@ -5,3 +5,74 @@ from dotenv import load_dotenv
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+
+# Fonte dos relatórios: "live" (agrega farms/farm_plantation_season) ou
+# "rollup" (lê apenas as tabelas report_*_rollup)
+REPORTS_SOURCE = os.getenv("REPORTS_SOURCE", "live")
+
+# Cache em memória dos relatórios, invalidado pela versão global dos dados
+REPORTS_CACHE_ENABLED = os.getenv("REPORTS_CACHE_ENABLED", "true").lower() == "true"
+REPORTS_CACHE_MAX_ENTRIES = int(os.getenv("REPORTS_CACHE_MAX_ENTRIES", "256"))
+REPORTS_CACHE_TTL = float(os.getenv("REPORTS_CACHE_TTL", "60"))
+
+# Itens aceitos por requisição nos endpoints de lote (POST /farm/bulk e
+# /farm/bulk/add-plantation); acima disso a requisição recebe 422
+BULK_MAX_ITEMS = int(os.getenv("BULK_MAX_ITEMS", "10000"))
+
+# Importação de produtores: linhas por lote (uma consulta IN e um INSERT por
+# lote) e processos usados na validação dos CPF/CNPJ (0 ou 1 desliga o pool)
+PRODUCTOR_IMPORT_CHUNK_SIZE = int(os.getenv("PRODUCTOR_IMPORT_CHUNK_SIZE", "1000"))
+PRODUCTOR_IMPORT_WORKERS = int(
+    os.getenv("PRODUCTOR_IMPORT_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
+
+# Pilha assíncrona (AsyncEngine + asyncpg) para os endpoints de produtores,
+# culturas e safras. A URL assíncrona é derivada de DATABASE_URL quando
+# ASYNC_DATABASE_URL não é informada.
+DATABASE_ASYNC = os.getenv("DATABASE_ASYNC", "false").lower() == "true"
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")
+
+# Pool de conexões (QueuePool) das engines síncrona e assíncrona
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Segundos até uma conexão ser reciclada (-1 desliga)
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+# statement_timeout do Postgres em milissegundos (0 desliga)
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
+
+# Réplica de leitura opcional para relatórios, listagens e exportações
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+# Atraso máximo aceito da réplica, em segundos, antes de voltar ao primário
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("REPLICA_MAX_LAG_SECONDS", "5"))
+# Intervalo entre medições do atraso da réplica, em segundos
+REPLICA_LAG_CHECK_INTERVAL = float(os.getenv("REPLICA_LAG_CHECK_INTERVAL", "1"))
+# Por quantos segundos após uma escrita o cliente continua lendo do primário
+READ_AFTER_WRITE_SECONDS = float(os.getenv("READ_AFTER_WRITE_SECONDS", "5"))
+
+# Instrumentação de SQL por requisição: contagem de comandos, tempo no banco e
+# comando mais lento, registrados em log; SQL_STATS_HEADERS também os envia
+# nos cabeçalhos X-SQL-* da resposta.
+SQL_STATS_ENABLED = os.getenv("SQL_STATS_ENABLED", "true").lower() == "true"
+SQL_STATS_HEADERS = os.getenv("SQL_STATS_HEADERS", "false").lower() == "true"
+# Detecção de N+1 (comandos idênticos ou lazy loads repetidos na mesma
+# requisição): "off", "warn" (log) ou "raise" (falha a requisição; para
+# desenvolvimento e testes)
+SQL_N_PLUS_ONE = os.getenv("SQL_N_PLUS_ONE", "off").lower()
+SQL_N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "3"))
+
+# Inicialização rápida: não executa create_all na importação; em vez disso,
+# confere uma vez a revisão do Alembic, aquece o pool com DB_POOL_WARMUP
+# conexões e serve o openapi.json pré-gerado (OPENAPI_FILE).
+FAST_STARTUP = os.getenv("FAST_STARTUP", "false").lower() == "true"
+DB_POOL_WARMUP = int(os.getenv("DB_POOL_WARMUP", str(DB_POOL_SIZE)))
+OPENAPI_FILE = os.getenv("OPENAPI_FILE", "openapi.json")
+
+# Listagens e relatórios serializados direto com orjson (sem revalidar pelo
+# response_model). Desligue para voltar ao caminho padrão do FastAPI.
+FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "true").lower() == "true"
+
+# Listagens e buscas por ID (GET /farm/, /productor/, /plantation/, /season/)
+# lidas em SQLAlchemy Core, como linhas, sem montar objetos do ORM.
+CORE_READ_PATH = os.getenv("CORE_READ_PATH", "true").lower() == "true"
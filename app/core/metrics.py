@@ -0,0 +1,167 @@
+"""
+Métricas no formato do Prometheus, servidas em ``GET /metrics``.
+
+Com vários workers (uvicorn/gunicorn), defina ``PROMETHEUS_MULTIPROC_DIR``
+com um diretório vazio e gravável antes de iniciar o servidor: cada processo
+grava suas métricas em arquivos mmap nesse diretório e ``/metrics`` agrega
+os valores de todos eles.
+"""
+
+import os
+import time
+
+from fastapi import Request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+MULTIPROCESS = "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+# Intervalo mínimo, em segundos, entre atualizações dos gauges de pool e de
+# cache de um processo (feitas ao final das requisições)
+PROCESS_GAUGES_INTERVAL = 1.0
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "Requisições HTTP atendidas.",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Latência das requisições HTTP.",
+    ["method", "route"],
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Requisições HTTP em andamento.",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+REPORT_DURATION = Histogram(
+    "report_compute_duration_seconds",
+    "Tempo de cálculo dos relatórios (apenas quando não vêm do cache).",
+    ["report", "source"],
+)
+REPORT_CACHE_REQUESTS = Counter(
+    "report_cache_requests_total",
+    "Consultas ao cache de relatórios, por resultado (hit ou miss).",
+    ["report", "result"],
+)
+REPORT_CACHE_HIT_RATIO = Gauge(
+    "report_cache_hit_ratio",
+    "Proporção de hits do cache de relatórios no processo.",
+    multiprocess_mode="mostrecent",
+)
+
+DB_POOL_SIZE = Gauge(
+    "db_pool_size", "Tamanho configurado do pool.", ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_IN_USE = Gauge(
+    "db_pool_connections_in_use", "Conexões em uso.", ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_IN = Gauge(
+    "db_pool_connections_idle", "Conexões ociosas no pool.", ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow", "Conexões abertas além do tamanho do pool.", ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Espera por uma conexão do pool.",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+             1.0, 2.5, 5.0, 10.0, 30.0),
+)
+DB_POOL_OVERFLOW_EVENTS = Counter(
+    "db_pool_overflow_events_total", "Conexões abertas além do tamanho do pool."
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total", "Checkouts que falharam por timeout do pool."
+)
+
+_process_gauges_updated = float("-inf")
+
+
+def _route_label(request: Request) -> str:
+    # O template da rota (ex.: /api/v1/farm/{farm_id}) mantém a
+    # cardinalidade dos rótulos limitada. Em rotas de routers incluídos o
+    # FastAPI guarda o caminho completo no contexto efetivo da rota.
+    context = request.scope.get("fastapi", {}).get("effective_route_context")
+    if context is not None:
+        return context.path_format
+    route = request.scope.get("route")
+    return getattr(route, "path_format", "unmatched")
+
+
+def _refresh_process_gauges():
+    """Atualiza os gauges de pool e de cache deste processo."""
+    global _process_gauges_updated
+    now = time.monotonic()
+    if now - _process_gauges_updated < PROCESS_GAUGES_INTERVAL:
+        return
+    _process_gauges_updated = now
+
+    # Importados aqui: os módulos de banco e de serviços importam este módulo
+    from app.db.async_session import current_async_engine
+    from app.db.replica import replica_router
+    from app.db.session import engine
+    from app.services.reports_service import reports_cache
+
+    engines = {"primary": engine, "replica": replica_router.engine}
+    async_engine = current_async_engine()
+    if async_engine is not None:
+        engines["async"] = async_engine
+    for name, db_engine in engines.items():
+        pool = getattr(db_engine, "pool", None)
+        if pool is None or not hasattr(pool, "checkedout"):
+            continue
+        DB_POOL_SIZE.labels(name).set(pool.size())
+        DB_POOL_IN_USE.labels(name).set(pool.checkedout())
+        DB_POOL_CHECKED_IN.labels(name).set(pool.checkedin())
+        DB_POOL_OVERFLOW.labels(name).set(max(pool.overflow(), 0))
+    REPORT_CACHE_HIT_RATIO.set(reports_cache.stats()["hit_ratio"])
+
+
+async def metrics_middleware(request: Request, call_next):
+    """Conta as requisições e mede a latência por rota."""
+    in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(request.method)
+    in_progress.inc()
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = _route_label(request)
+        HTTP_REQUEST_DURATION.labels(request.method, route).observe(
+            time.perf_counter() - started)
+        HTTP_REQUESTS.labels(request.method, route, str(status)).inc()
+        in_progress.dec()
+        _refresh_process_gauges()
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Serializa as métricas (de todos os processos, no modo multiprocesso)."""
+    _refresh_process_gauges()
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int):
+    """Descarta os gauges "live" de um worker encerrado (modo multiprocesso)."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(pid)
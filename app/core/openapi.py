@@ -0,0 +1,66 @@
+"""
+Documento OpenAPI pré-gerado.
+
+Na inicialização rápida, o app serve o openapi.json versionado em vez de
+montá-lo na primeira requisição a /openapi.json. Depois de alterar rotas ou
+schemas, gere o arquivo novamente a partir da raiz do projeto:
+
+    python -m app.core.openapi
+"""
+
+import json
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.openapi.utils import get_openapi
+
+from app.core.config import OPENAPI_FILE
+from app.core.logger import logger
+
+
+def build_openapi(app: FastAPI) -> dict:
+    """Gera o documento OpenAPI a partir das rotas, ignorando o cache do app."""
+    schema = get_openapi(
+        title=app.title,
+        version=app.version,
+        openapi_version=app.openapi_version,
+        summary=app.summary,
+        description=app.description,
+        terms_of_service=app.terms_of_service,
+        contact=app.contact,
+        license_info=app.license_info,
+        routes=app.routes,
+        webhooks=app.webhooks.routes,
+        tags=app.openapi_tags,
+        servers=app.servers,
+        separate_input_output_schemas=app.separate_input_output_schemas,
+    )
+    return json.loads(json.dumps(schema))
+
+
+def load_openapi(app: FastAPI, path: str = OPENAPI_FILE) -> bool:
+    """Usa o documento salvo em ``path`` como o OpenAPI do app, se existir."""
+    path = Path(path)
+    if not path.is_file():
+        logger.warning(f"{path} não encontrado; o OpenAPI será gerado sob demanda.")
+        return False
+    app.openapi_schema = json.loads(path.read_text(encoding="utf-8"))
+    # O FastAPI regenera o documento quando as rotas mudam de versão; o
+    # documento carregado corresponde às rotas atuais.
+    if hasattr(app.router, "_get_routes_version"):
+        app._openapi_routes_version = app.router._get_routes_version()
+    return True
+
+
+def export_openapi(app: FastAPI, path: str = OPENAPI_FILE):
+    Path(path).write_text(
+        json.dumps(build_openapi(app), indent=4, ensure_ascii=False) + "\n",
+        encoding="utf-8",
+    )
+
+
+if __name__ == "__main__":
+    from main import app
+
+    export_openapi(app)
+    print(f"OpenAPI gravado em {OPENAPI_FILE}")
@@ -0,0 +1,60 @@
+from typing import Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.core.config import ASYNC_DATABASE_URL, DATABASE_URL
+from app.db.pool import engine_options
+
+# Driver assíncrono usado para cada backend da DATABASE_URL síncrona
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+_async_engine: Optional[AsyncEngine] = None
+
+
+def current_async_engine() -> Optional[AsyncEngine]:
+    """A AsyncEngine, se já tiver sido criada."""
+    return _async_engine
+
+# expire_on_commit=False: depois do commit os objetos continuam legíveis sem
+# um novo SELECT, que no modo assíncrono exigiria um await explícito.
+AsyncSessionLocal = async_sessionmaker(class_=AsyncSession, expire_on_commit=False)
+
+
+def to_async_url(url: str) -> str:
+    """Troca o driver síncrono da URL pelo driver assíncrono equivalente."""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise NotImplementedError(f"Dialeto não suportado: {backend}")
+    return url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(
+        hide_password=False
+    )
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Cria a AsyncEngine na primeira chamada, para que o asyncpg só seja
+    necessário quando a pilha assíncrona estiver habilitada.
+    """
+    global _async_engine
+    if _async_engine is None:
+        url = ASYNC_DATABASE_URL or to_async_url(DATABASE_URL)
+        _async_engine = create_async_engine(
+            url, **engine_options(url, async_driver=True))
+        AsyncSessionLocal.configure(bind=_async_engine)
+    return _async_engine
+
+
+async def get_async_db():
+    get_async_engine()
+    async with AsyncSessionLocal() as session:
+        yield session
@@ -0,0 +1,19 @@
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def dialect_insert(db: Session, table):
+    """
+    Retorna o construtor ``insert`` do dialeto da sessão, que expõe
+    ``on_conflict_do_update``/``on_conflict_do_nothing``.
+
+    Args:
+        db (Session): Sessão usada para descobrir o dialeto.
+        table: Modelo ou tabela alvo do INSERT.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(table)
+    if dialect == "sqlite":
+        return sqlite.insert(table)
+    raise NotImplementedError(f"Dialeto não suportado: {dialect}")
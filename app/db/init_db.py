@@ -1,7 +1,10 @@
+from app.db.models.data_version import DataVersion
 from app.db.models.farm import Farm
 from app.db.models.farm_plantation_season import FarmPlantationSeason
 from app.db.models.plantation import Plantation
 from app.db.models.productor import Productor
+from app.db.models.report_season_plantation_rollup import ReportSeasonPlantationRollup
+from app.db.models.report_state_rollup import ReportStateRollup
 from app.db.models.season import Season
 from app.db.session import Base, engine
 
@@ -0,0 +1,156 @@
+import json
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.config import (
+    SQL_N_PLUS_ONE,
+    SQL_N_PLUS_ONE_THRESHOLD,
+    SQL_STATS_ENABLED,
+    SQL_STATS_HEADERS,
+)
+from app.core.logger import logger
+
+# Tamanho máximo do SQL do comando mais lento nos logs e cabeçalhos
+SLOWEST_SQL_MAX_LENGTH = 200
+
+
+class NPlusOneError(RuntimeError):
+    """Levantada no modo SQL_N_PLUS_ONE=raise quando uma requisição tem N+1."""
+
+
+class RequestSqlStats:
+    """Comandos SQL executados durante uma requisição."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.slowest_time = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.statements = Counter()
+        self.lazy_loads = Counter()
+
+    def record(self, statement: str, duration: float):
+        self.count += 1
+        self.total_time += duration
+        self.statements[statement] += 1
+        if duration >= self.slowest_time:
+            self.slowest_time = duration
+            self.slowest_statement = statement
+
+    def n_plus_one_violations(
+        self, threshold: int = SQL_N_PLUS_ONE_THRESHOLD
+    ) -> list[str]:
+        """Comandos idênticos e lazy loads repetidos ``threshold`` vezes ou mais."""
+        violations = [
+            f"lazy load de {relationship} repetido {count} vezes"
+            for relationship, count in self.lazy_loads.items()
+            if count >= threshold
+        ]
+        violations.extend(
+            f"comando repetido {count} vezes: {_shorten(statement)}"
+            for statement, count in self.statements.items()
+            if count >= threshold
+        )
+        return violations
+
+    def as_dict(self) -> dict:
+        return {
+            "statements": self.count,
+            "db_time_ms": round(self.total_time * 1000, 3),
+            "slowest_ms": round(self.slowest_time * 1000, 3),
+            "slowest_statement": _shorten(self.slowest_statement),
+        }
+
+
+_current_stats: ContextVar[Optional[RequestSqlStats]] = ContextVar(
+    "request_sql_stats", default=None
+)
+
+
+def _shorten(statement: Optional[str]) -> Optional[str]:
+    if statement is None:
+        return None
+    statement = " ".join(statement.split())
+    if len(statement) > SLOWEST_SQL_MAX_LENGTH:
+        return statement[:SLOWEST_SQL_MAX_LENGTH] + "..."
+    return statement
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_timer(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("sql_stats_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    started = conn.info.get("sql_stats_started")
+    if stats is None or not started:
+        return
+    stats.record(statement, time.perf_counter() - started.pop())
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_lazy_load(orm_execute_state):
+    stats = _current_stats.get()
+    if (
+        stats is None
+        or not orm_execute_state.is_select
+        or orm_execute_state.lazy_loaded_from is None
+    ):
+        return
+    path = orm_execute_state.loader_strategy_path
+    relationship = str(path.path[-1]) if path else "?"
+    stats.lazy_loads[relationship] += 1
+
+
+async def sql_stats_middleware(request: Request, call_next):
+    """
+    Registra os comandos SQL de cada requisição: grava um log estruturado,
+    envia os cabeçalhos X-SQL-* (com SQL_STATS_HEADERS) e aplica a detecção
+    de N+1. Comandos executados durante o envio de respostas em streaming não
+    entram na contagem.
+    """
+    if not SQL_STATS_ENABLED:
+        return await call_next(request)
+
+    stats = RequestSqlStats()
+    token = _current_stats.set(stats)
+    try:
+        response = await call_next(request)
+    finally:
+        _current_stats.reset(token)
+
+    violations = (
+        stats.n_plus_one_violations() if SQL_N_PLUS_ONE in ("warn", "raise") else []
+    )
+    payload = {
+        "method": request.method,
+        "path": request.url.path,
+        "status_code": response.status_code,
+        **stats.as_dict(),
+    }
+    if violations:
+        payload["n_plus_one"] = violations
+        logger.warning(f"sql_stats {json.dumps(payload, ensure_ascii=False)}")
+        if SQL_N_PLUS_ONE == "raise":
+            raise NPlusOneError(
+                f"N+1 em {request.method} {request.url.path}: {violations}")
+    else:
+        logger.info(f"sql_stats {json.dumps(payload, ensure_ascii=False)}")
+
+    if SQL_STATS_HEADERS:
+        response.headers["X-SQL-Count"] = str(stats.count)
+        response.headers["X-SQL-Time-Ms"] = f"{stats.total_time * 1000:.3f}"
+        response.headers["X-SQL-Slowest-Ms"] = f"{stats.slowest_time * 1000:.3f}"
+        if violations:
+            response.headers["X-SQL-N-Plus-One"] = str(len(violations))
+    return response
@@ -0,0 +1,19 @@
+from sqlalchemy import DDL, BigInteger, Column, Integer, event
+
+from app.db.session import Base
+
+
+class DataVersion(Base):
+    __tablename__ = "data_version"
+
+    # Linha única (id = 1) com a versão global dos dados, incrementada na
+    # mesma transação de cada escrita e lida por todos os workers
+    id = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+
+
+event.listen(
+    DataVersion.__table__,
+    "after_create",
+    DDL("INSERT INTO data_version (id, version) VALUES (1, 0)"),
+)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Float, ForeignKey, Integer, String
+from sqlalchemy import Column, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from app.db.session import Base
@@ -15,6 +15,9 @@ class Farm(Base):
     arable_area = Column(Float, nullable=False)
     vegetation_area = Column(Float, nullable=False)
 
+    # Incrementada a cada UPDATE pelo ORM; base do ETag da fazenda
+    version = Column(Integer, nullable=False, server_default="1")
+
     productor_id = Column(Integer, ForeignKey("productors.id"))
     productor = relationship("Productor", back_populates="farms")
 
@@ -22,3 +25,26 @@ class Farm(Base):
     farm_plantations = relationship(
         "FarmPlantationSeason",
         back_populates="farm")
+
+    __mapper_args__ = {"version_id_col": version}
+
+    # Índices dos filtros e ordenações de GET /farm/; os de ordenação incluem
+    # o id para servir a paginação por cursor ordenada pelo campo. No Postgres,
+    # ix_farms_state_areas cobre os agregados por estado dos relatórios
+    # (index-only scan); nos demais bancos o INCLUDE é ignorado e ele fica só
+    # em state, mas é criado igual para o autogenerate não acusar diferença.
+    __table_args__ = (
+        Index("ix_farms_state_city", "state", "city"),
+        Index("ix_farms_name", "name", "id"),
+        Index("ix_farms_state", "state", "id"),
+        Index("ix_farms_city_id", "city", "id"),
+        Index("ix_farms_productor_id", "productor_id"),
+        Index("ix_farms_total_area", "total_area", "id"),
+        Index("ix_farms_arable_area", "arable_area", "id"),
+        Index("ix_farms_vegetation_area", "vegetation_area", "id"),
+        Index(
+            "ix_farms_state_areas",
+            "state",
+            postgresql_include=["total_area", "arable_area", "vegetation_area"],
+        ),
+    )
@@ -1,4 +1,6 @@
-from sqlalchemy import Column, ForeignKey, Integer
+from sqlalchemy import Column, ForeignKey, Index, Integer, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import relationship
 
 from app.db.session import Base
@@ -19,3 +21,64 @@ class FarmPlantationSeason(Base):
     farm = relationship("Farm", back_populates="farm_plantations")
     plantation = relationship("Plantation", back_populates="farm_plantations")
     season = relationship("Season", back_populates="farm_plantations")
+
+    # Uma cultura só pode ser cadastrada uma vez por safra em cada fazenda;
+    # o índice único também atende às buscas por farm_id. Os demais servem
+    # às verificações de dependência antes de remover culturas e safras; o de
+    # (season_id, plantation_id) também cobre a estatística de culturas por
+    # safra, e no Postgres inclui farm_id para as junções por estado.
+    __table_args__ = (
+        Index(
+            "ux_farm_plantation_season",
+            "farm_id",
+            "plantation_id",
+            "season_id",
+            unique=True,
+        ),
+        Index("ix_farm_plantation_season_plantation_id", "plantation_id"),
+        Index(
+            "ix_farm_plantation_season_season_plantation",
+            "season_id",
+            "plantation_id",
+            postgresql_include=["farm_id"],
+        ),
+    )
+
+
+# Quando particionada (app.db.partitioning), a tabela tem uma partição por
+# safra, criada junto com a safra (ver app.db.models.season)
+def partition_name(season_id: int) -> str:
+    return f"{FarmPlantationSeason.__tablename__}_s{int(season_id)}"
+
+
+def partition_ddl(
+    season_id: int, parent: str = FarmPlantationSeason.__tablename__
+) -> str:
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(season_id)} "
+        f"PARTITION OF {parent} FOR VALUES IN ({int(season_id)})"
+    )
+
+
+def is_partitioned(connection: Connection) -> bool:
+    if connection.dialect.name != "postgresql":
+        return False
+    return bool(
+        connection.execute(
+            text(
+                "SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass(:table)"
+            ),
+            {"table": FarmPlantationSeason.__tablename__},
+        ).scalar()
+    )
+
+
+def is_missing_partition(error: DBAPIError) -> bool:
+    """
+    Indica se o erro é o "no partition of relation ... found for row" do
+    Postgres (check_violation), levantado ao inserir em uma safra sem
+    partição.
+    """
+    orig = error.orig
+    return getattr(orig, "pgcode", None) == "23514" and "no partition" in str(orig)
@@ -11,5 +11,9 @@ class Productor(Base):
     name = Column(String, nullable=False)
     cpf_cnpj = Column(String, unique=True, nullable=False)
     birthdate = Column(Date, nullable=False)
+    # Incrementada a cada UPDATE pelo ORM; base do ETag do produtor
+    version = Column(Integer, nullable=False, server_default="1")
 
     farms = relationship("Farm", back_populates="productor")
+
+    __mapper_args__ = {"version_id_col": version}
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, String
+
+from app.db.session import Base
+
+
+class ReportSeasonPlantationRollup(Base):
+    __tablename__ = "report_season_plantation_rollup"
+
+    # Contagem de culturas por estado, safra e cultura. O estado permite
+    # derivar as culturas distintas por estado sem varrer as fazendas.
+    state = Column(String, primary_key=True)
+    season_id = Column(Integer, primary_key=True)
+    plantation_id = Column(Integer, primary_key=True)
+    total_plantations = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Float, Integer, String
+
+from app.db.session import Base
+
+
+class ReportStateRollup(Base):
+    __tablename__ = "report_state_rollup"
+
+    # Totais por estado mantidos incrementalmente pelo FarmRepository
+    state = Column(String, primary_key=True)
+    farms_total = Column(Integer, nullable=False, default=0)
+    total_area = Column(Float, nullable=False, default=0)
+    arable_area = Column(Float, nullable=False, default=0)
+    vegetation_area = Column(Float, nullable=False, default=0)
@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, event, text
 from sqlalchemy.orm import relationship
 
+from app.db.models.farm_plantation_season import is_partitioned, partition_ddl
 from app.db.session import Base
 
 
@@ -14,3 +15,13 @@ class Season(Base):
     farm_plantations = relationship(
         "FarmPlantationSeason",
         back_populates="season")
+
+
+# Registrado junto com o modelo para valer em qualquer processo que crie
+# safras (API, FAST_STARTUP, scripts e workers), não só nos que importam
+# app.db.partitioning
+@event.listens_for(Season, "after_insert")
+def _create_season_partition(mapper, connection, season):
+    """Cria a partição da nova safra, se farm_plantation_season estiver particionada."""
+    if is_partitioned(connection):
+        connection.execute(text(partition_ddl(season.id)))
@@ -0,0 +1,52 @@
+from sqlalchemy import tuple_
+
+
+def keyset_page(
+    query,
+    id_column,
+    offset: int = 0,
+    limit: int = 100,
+    after: tuple = None,
+    sort_column=None,
+    descending: bool = False,
+):
+    """
+    Pagina uma consulta ordenada pela coluna de ordenação e pelo ID. Aceita
+    tanto uma Query do ORM quanto um ``select()`` (usado pelos repositórios
+    assíncronos) e devolve a consulta pronta para ser executada.
+
+    Com ``after`` (a chave ``(id,)`` ou ``(valor_ordenacao, id)`` da última
+    linha lida) a página começa logo após essa linha (keyset), de modo que
+    páginas profundas custam o mesmo que a primeira. Sem ele, ``offset`` é
+    usado para compatibilidade.
+    """
+    if sort_column is None or sort_column is id_column:
+        columns = [id_column]
+    else:
+        columns = [sort_column, id_column]
+
+    query = query.order_by(
+        *(column.desc() if descending else column.asc() for column in columns)
+    )
+    if after is not None:
+        key = tuple_(*columns) if len(columns) > 1 else columns[0]
+        value = tuple_(*after) if len(columns) > 1 else after[0]
+        query = query.filter(key < value if descending else key > value)
+    elif offset:
+        query = query.offset(offset)
+    return query.limit(limit)
+
+
+def paginate(
+    query,
+    id_column,
+    offset: int = 0,
+    limit: int = 100,
+    after: tuple = None,
+    sort_column=None,
+    descending: bool = False,
+):
+    """Executa a página montada por ``keyset_page`` sobre uma Query do ORM."""
+    return keyset_page(
+        query, id_column, offset, limit, after, sort_column, descending
+    ).all()
@@ -0,0 +1,473 @@
+"""
+Particionamento opcional (Postgres) de farm_plantation_season por safra.
+
+A tabela é particionada por lista de ``season_id``, com uma partição por
+safra. Consultas filtradas por safra (ex.: ``season_from``/``season_to`` da
+estatística de culturas) leem só as partições das safras pedidas, e safras
+antigas podem ser desanexadas ou arquivadas sem bloquear a partição da safra
+corrente.
+
+    python -m app.db.partitioning status
+    python -m app.db.partitioning convert      # tabela comum -> particionada
+    python -m app.db.partitioning revert       # particionada -> tabela comum
+    python -m app.db.partitioning detach 3     # desanexa a partição da safra 3
+    python -m app.db.partitioning archive 3    # desanexa e move para o schema archive
+"""
+
+import argparse
+import sys
+import time
+from typing import Callable
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.core.logger import logger
+from app.db.models.farm_plantation_season import (
+    FarmPlantationSeason,
+    is_partitioned,
+    partition_ddl,
+    partition_name,
+)
+from app.db.repositories.report_rollup_repository import ReportRollupRepository
+from app.db.session import engine
+
+TABLE = FarmPlantationSeason.__tablename__
+NEW_TABLE = f"{TABLE}_new"
+ARCHIVE_SCHEMA = "archive"
+
+# Espera máxima pelos locks da criação da tabela nova e da troca,
+# tentativas e intervalo base entre elas (segundos, multiplicado pela
+# tentativa)
+SWAP_LOCK_TIMEOUT_MS = 2000
+SWAP_RETRIES = 5
+SWAP_RETRY_DELAY = 1.0
+
+# Linhas copiadas por transação
+COPY_BATCH_SIZE = 10000
+
+# Função e trigger que replicam na tabela nova as escritas feitas durante a
+# cópia
+SYNC_FUNCTION = f"{NEW_TABLE}_sync"
+SYNC_TRIGGER = f"{NEW_TABLE}_sync"
+
+# lock_not_available (lock_timeout) e deadlock_detected
+LOCK_FAILURE_CODES = {"55P03", "40P01"}
+
+# Chaves estrangeiras recriadas na tabela nova (nome, coluna, tabela referida)
+FOREIGN_KEYS = [
+    (f"{TABLE}_farm_id_fkey", "farm_id", "farms"),
+    (f"{TABLE}_plantation_id_fkey", "plantation_id", "plantations"),
+    (f"{TABLE}_season_id_fkey", "season_id", "seasons"),
+]
+
+
+def _index_statements(table: str) -> list[tuple[str, str]]:
+    """
+    CREATE INDEX dos índices do modelo sobre ``table``, com nomes
+    temporários. Retorna pares (comando, nome definitivo).
+    """
+    statements = []
+    for index in sorted(FarmPlantationSeason.__table__.indexes, key=lambda i: i.name):
+        columns = ", ".join(column.name for column in index.columns)
+        sql = (
+            f"CREATE {'UNIQUE ' if index.unique else ''}INDEX {index.name}_new "
+            f"ON {table} ({columns})"
+        )
+        include = index.dialect_options["postgresql"]["include"]
+        if include:
+            sql += f" INCLUDE ({', '.join(include)})"
+        statements.append((sql, index.name))
+    return statements
+
+
+def cleanup_statements() -> list[str]:
+    """
+    Comandos que removem o trigger, a função e a tabela nova de uma
+    conversão interrompida. O trigger sai antes da tabela: sem ela, ele
+    faria falhar as escritas em farm_plantation_season.
+    """
+    return [
+        f"DROP TRIGGER IF EXISTS {SYNC_TRIGGER} ON {TABLE}",
+        f"DROP FUNCTION IF EXISTS {SYNC_FUNCTION}()",
+        f"DROP TABLE IF EXISTS {NEW_TABLE}",
+    ]
+
+
+def build_statements(partitioned: bool) -> list[str]:
+    """
+    Comandos que criam a tabela nova, ainda vazia, com a chave primária, as
+    chaves estrangeiras e os índices. Com a tabela vazia, criá-los é
+    imediato, e a cópia não precisa de um CREATE INDEX que bloquearia as
+    escritas replicadas pelo trigger.
+    """
+    primary_key = "(id, season_id)" if partitioned else "(id)"
+    statements = cleanup_statements() + [
+        f"CREATE TABLE {NEW_TABLE} (LIKE {TABLE} INCLUDING DEFAULTS)"
+        + (" PARTITION BY LIST (season_id)" if partitioned else ""),
+        # A chave do particionamento precisa fazer parte da chave primária
+        f"ALTER TABLE {NEW_TABLE} ADD CONSTRAINT {NEW_TABLE}_pkey "
+        f"PRIMARY KEY {primary_key}",
+    ]
+    statements += [
+        f"ALTER TABLE {NEW_TABLE} ADD CONSTRAINT {name} FOREIGN KEY ({column}) "
+        f"REFERENCES {target} (id)"
+        for name, column, target in FOREIGN_KEYS
+    ]
+    statements += [sql for sql, _ in _index_statements(NEW_TABLE)]
+    return statements
+
+
+def sync_statements(partitioned: bool) -> list[str]:
+    """
+    Função e trigger que replicam na tabela nova cada INSERT, UPDATE e
+    DELETE feito na atual enquanto as linhas são copiadas. Na conversão
+    para particionada, a partição de uma safra cadastrada nesse intervalo é
+    criada com a primeira linha dela.
+    """
+    create_partition = (
+        f"""
+                IF to_regclass('{TABLE}_s' || NEW.season_id) IS NULL THEN
+                    EXECUTE format(
+                        'CREATE TABLE IF NOT EXISTS {TABLE}_s%s '
+                        'PARTITION OF {NEW_TABLE} FOR VALUES IN (%s)',
+                        NEW.season_id, NEW.season_id);
+                END IF;"""
+        if partitioned
+        else ""
+    )
+    return [
+        f"""
+        CREATE FUNCTION {SYNC_FUNCTION}() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                DELETE FROM {NEW_TABLE} WHERE id = OLD.id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN{create_partition}
+                INSERT INTO {NEW_TABLE} SELECT (NEW).* ON CONFLICT DO NOTHING;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        f"CREATE TRIGGER {SYNC_TRIGGER} AFTER INSERT OR UPDATE OR DELETE "
+        f"ON {TABLE} FOR EACH ROW EXECUTE FUNCTION {SYNC_FUNCTION}()",
+    ]
+
+
+# Um lote da cópia, em uma transação curta e sem lock de tabela: as linhas
+# do lote ficam com FOR SHARE só até o commit, para que um DELETE
+# concorrente espere a cópia e seja replicado pelo trigger, em vez de a
+# linha voltar na tabela nova. Linhas já replicadas pelo trigger são
+# ignoradas (ON CONFLICT). Retorna o maior id do lote, ou NULL no fim.
+COPY_BATCH = f"""
+    WITH batch AS (
+        SELECT * FROM {TABLE}
+        WHERE id > :after
+        ORDER BY id
+        LIMIT :batch_size
+        FOR SHARE
+    ), copied AS (
+        INSERT INTO {NEW_TABLE} SELECT * FROM batch ON CONFLICT DO NOTHING
+    )
+    SELECT max(id) FROM batch
+"""
+
+
+# Locks da troca, tomados no início da transação e nessa ordem. O de seasons
+# impede que uma safra criada durante a troca fique sem partição.
+SWAP_LOCKS = [
+    "LOCK TABLE seasons IN SHARE MODE",
+    f"LOCK TABLE {TABLE} IN ACCESS EXCLUSIVE MODE",
+]
+
+
+def swap_statements(sequence: str) -> list[str]:
+    """
+    Comandos da troca das tabelas, depois de ``SWAP_LOCKS``: passam a
+    sequência do id para a tabela nova, trocam os nomes e removem a função
+    de replicação (o trigger sai com a tabela antiga). Com as escritas já
+    replicadas pelo trigger, nenhuma linha é copiada sob o lock exclusivo.
+    """
+    statements = [
+        # A sequência do id passa para a tabela nova; sem isso, o DROP abaixo
+        # a removeria junto com a tabela antiga.
+        f"ALTER SEQUENCE {sequence} OWNED BY {NEW_TABLE}.id",
+        f"DROP TABLE {TABLE}",
+        f"ALTER TABLE {NEW_TABLE} RENAME TO {TABLE}",
+        f"ALTER INDEX {NEW_TABLE}_pkey RENAME TO {TABLE}_pkey",
+    ]
+    statements += [
+        f"ALTER INDEX {name}_new RENAME TO {name}"
+        for _, name in _index_statements(NEW_TABLE)
+    ]
+    statements.append(f"DROP FUNCTION {SYNC_FUNCTION}()")
+    return statements
+
+
+def detach_statement(season_id: int, concurrently: bool) -> str:
+    return (
+        f"ALTER TABLE {TABLE} DETACH PARTITION {partition_name(season_id)}"
+        + (" CONCURRENTLY" if concurrently else "")
+    )
+
+
+def list_partitions(connection: Connection) -> list[dict]:
+    """Partições anexadas, com os limites e a estimativa de linhas."""
+    partitions = connection.execute(
+        text(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid), "
+            "child.reltuples::bigint "
+            "FROM pg_inherits "
+            "JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = to_regclass(:table) "
+            "ORDER BY child.relname"
+        ),
+        {"table": TABLE},
+    )
+    return [
+        {"partition": name, "bounds": bounds, "rows": max(rows, 0)}
+        for name, bounds, rows in partitions
+    ]
+
+
+def _require_postgres(engine: Engine):
+    if engine.dialect.name != "postgresql":
+        raise NotImplementedError(
+            "O particionamento de farm_plantation_season requer Postgres"
+        )
+
+
+def _create_new_partitions(connection: Connection):
+    """Cria na tabela nova as partições das safras cadastradas."""
+    season_ids = connection.execute(text("SELECT id FROM seasons")).scalars().all()
+    for season_id in season_ids:
+        connection.execute(text(partition_ddl(season_id, parent=NEW_TABLE)))
+
+
+def _is_lock_failure(error: OperationalError) -> bool:
+    return getattr(error.orig, "pgcode", None) in LOCK_FAILURE_CODES
+
+
+def _run_with_lock_retries(
+    engine: Engine,
+    step: str,
+    run: Callable[[Connection], None],
+    lock_timeout_ms: int,
+    retries: int,
+):
+    """
+    Executa ``run`` em uma transação que espera no máximo ``lock_timeout_ms``
+    por cada lock, repetindo até ``retries`` vezes se não o conseguir.
+    """
+    for attempt in range(1, retries + 1):
+        try:
+            with engine.begin() as connection:
+                connection.execute(text(f"SET LOCAL lock_timeout = {int(lock_timeout_ms)}"))
+                run(connection)
+            return
+        except OperationalError as error:
+            if not _is_lock_failure(error) or attempt == retries:
+                raise
+            logger.warning(
+                f"{step} de {TABLE} sem lock (tentativa {attempt}/{retries}): {error.orig}"
+            )
+            time.sleep(SWAP_RETRY_DELAY * attempt)
+
+
+def _copy_rows(engine: Engine, batch_size: int) -> int:
+    """
+    Copia as linhas para a tabela nova em lotes, cada um em uma transação.
+
+    Returns:
+        int: Número de lotes copiados.
+    """
+    after, batches = 0, 0
+    while True:
+        with engine.begin() as connection:
+            last_id = connection.execute(
+                text(COPY_BATCH), {"after": after, "batch_size": batch_size}
+            ).scalar()
+        if last_id is None:
+            return batches
+        batches += 1
+        after = last_id
+
+
+def _swap(
+    engine: Engine,
+    partitioned: bool,
+    lock_timeout_ms: int = SWAP_LOCK_TIMEOUT_MS,
+    retries: int = SWAP_RETRIES,
+    batch_size: int = COPY_BATCH_SIZE,
+):
+    """
+    Recria farm_plantation_season no formato pedido sem bloquear as escritas
+    durante a cópia:
+
+    1. cria a tabela nova, vazia e já com os índices, e o trigger que
+       replica nela as escritas feitas na atual a partir desse momento;
+    2. copia as linhas existentes em lotes, cada um em uma transação curta;
+    3. troca as tabelas com lock exclusivo, sem copiar nada sob ele.
+
+    Os passos 1 e 3 esperam no máximo ``lock_timeout_ms`` pelos locks e são
+    repetidos até ``retries`` vezes; se algum passo falhar, o trigger e a
+    tabela nova são removidos e a tabela atual continua em uso.
+    """
+    _require_postgres(engine)
+    with engine.connect() as connection:
+        if is_partitioned(connection) == partitioned:
+            logger.info("farm_plantation_season já está no formato pedido")
+            return
+        sequence = connection.execute(
+            text("SELECT pg_get_serial_sequence(:table, 'id')"), {"table": TABLE}
+        ).scalar()
+
+    def build(connection: Connection):
+        for statement in build_statements(partitioned):
+            connection.execute(text(statement))
+        if partitioned:
+            _create_new_partitions(connection)
+        for statement in sync_statements(partitioned):
+            connection.execute(text(statement))
+
+    def swap(connection: Connection):
+        for statement in SWAP_LOCKS:
+            connection.execute(text(statement))
+        if partitioned:
+            # Safras cadastradas depois da cópia e ainda sem linhas
+            _create_new_partitions(connection)
+        for statement in swap_statements(sequence):
+            connection.execute(text(statement))
+
+    try:
+        _run_with_lock_retries(
+            engine, "Criação da tabela nova", build, lock_timeout_ms, retries)
+        batches = _copy_rows(engine, batch_size)
+        logger.info(f"{TABLE} copiada em {batches} lotes")
+        _run_with_lock_retries(engine, "Troca", swap, lock_timeout_ms, retries)
+    except Exception:
+        with engine.begin() as connection:
+            for statement in cleanup_statements():
+                connection.execute(text(statement))
+        raise
+
+    with engine.connect() as connection:
+        connection.execute(text(f"ANALYZE {TABLE}"))
+        connection.commit()
+
+
+def convert(engine: Engine):
+    """Converte farm_plantation_season em tabela particionada por safra."""
+    _swap(engine, partitioned=True)
+
+
+def revert(engine: Engine):
+    """
+    Volta farm_plantation_season a uma tabela comum, com as linhas das
+    partições anexadas (as desanexadas ou arquivadas ficam de fora).
+    """
+    _swap(engine, partitioned=False)
+
+
+def detach(engine: Engine, season_id: int, concurrently: bool = None) -> str:
+    """
+    Desanexa a partição de uma safra, que passa a ser uma tabela comum fora
+    dos relatórios. Com ``concurrently`` (padrão a partir do Postgres 14) a
+    operação não bloqueia leituras e escritas nas outras partições; sem ele,
+    o lock exclusivo sobre a tabela principal dura apenas a troca do
+    catálogo.
+
+    As chaves estrangeiras da partição desanexada são removidas, para que o
+    histórico arquivado não impeça remover fazendas ou culturas, e o rollup
+    de culturas da safra é apagado, como se as linhas tivessem sido
+    removidas.
+
+    Returns:
+        str: Nome da tabela desanexada.
+    """
+    _require_postgres(engine)
+    name = partition_name(season_id)
+    with engine.connect() as connection:
+        if concurrently is None:
+            concurrently = connection.dialect.server_version_info >= (14,)
+        # DETACH ... CONCURRENTLY não pode rodar dentro de uma transação
+        if concurrently:
+            connection = connection.execution_options(isolation_level="AUTOCOMMIT")
+        connection.execute(text(detach_statement(season_id, concurrently)))
+        connection.commit()
+
+    with Session(engine) as session:
+        foreign_keys = session.execute(
+            text(
+                "SELECT conname FROM pg_constraint "
+                "WHERE conrelid = to_regclass(:table) AND contype = 'f'"
+            ),
+            {"table": name},
+        ).scalars().all()
+        for foreign_key in foreign_keys:
+            session.execute(text(f'ALTER TABLE {name} DROP CONSTRAINT "{foreign_key}"'))
+        ReportRollupRepository(session).remove_season(season_id)
+        session.commit()
+    logger.info(f"Partição {name} desanexada")
+    return name
+
+
+def archive(engine: Engine, season_id: int, concurrently: bool = None) -> str:
+    """
+    Desanexa a partição de uma safra e a move para o schema ``archive``.
+
+    Returns:
+        str: Nome qualificado da tabela arquivada.
+    """
+    name = detach(engine, season_id, concurrently)
+    with engine.begin() as connection:
+        connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}"))
+        connection.execute(text(f"ALTER TABLE {name} SET SCHEMA {ARCHIVE_SCHEMA}"))
+    logger.info(f"Partição {name} arquivada em {ARCHIVE_SCHEMA}.{name}")
+    return f"{ARCHIVE_SCHEMA}.{name}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status", help="lista as partições")
+    commands.add_parser("convert", help="converte em tabela particionada")
+    commands.add_parser("revert", help="volta a tabela comum")
+    for command in ("detach", "archive"):
+        subparser = commands.add_parser(command)
+        subparser.add_argument("season_id", type=int)
+        subparser.add_argument(
+            "--no-concurrently",
+            dest="concurrently",
+            action="store_false",
+            default=None,
+            help="desanexa sem CONCURRENTLY (obrigatório antes do Postgres 14)",
+        )
+    args = parser.parse_args()
+
+    if args.command == "convert":
+        convert(engine)
+    elif args.command == "revert":
+        revert(engine)
+    elif args.command == "detach":
+        detach(engine, args.season_id, args.concurrently)
+    elif args.command == "archive":
+        archive(engine, args.season_id, args.concurrently)
+
+    with engine.connect() as connection:
+        if not is_partitioned(connection):
+            print(f"{TABLE} não é particionada")
+            return 0
+        for partition in list_partitions(connection):
+            print(
+                f"{partition['partition']:<40} {partition['bounds']:<24} "
+                f"~{partition['rows']} linhas"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+import statistics
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import (
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_STATEMENT_TIMEOUT_MS,
+)
+from app.core.metrics import (
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_OVERFLOW_EVENTS,
+    DB_POOL_TIMEOUTS,
+)
+
+# Quantidade de esperas recentes usadas no cálculo dos percentis
+RECENT_WAITS = 1000
+
+# Marcada pelo evento "connect" quando o checkout em andamento abriu uma
+# conexão nova com o banco
+_opened_connection: ContextVar[bool] = ContextVar("opened_connection", default=False)
+
+
+def _mark_opened_connection(dbapi_connection, connection_record):
+    _opened_connection.set(True)
+
+
+class PoolMetrics:
+    """Contadores de espera por conexão, overflow e timeouts de um pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.overflow_events = 0
+        self.timeouts = 0
+        self._recent_waits = deque(maxlen=RECENT_WAITS)
+
+    def record_checkout(self, wait: float):
+        DB_POOL_CHECKOUT_WAIT.observe(wait)
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self._recent_waits.append(wait)
+
+    def record_overflow(self):
+        DB_POOL_OVERFLOW_EVENTS.inc()
+        with self._lock:
+            self.overflow_events += 1
+
+    def record_timeout(self):
+        DB_POOL_TIMEOUTS.inc()
+        with self._lock:
+            self.timeouts += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            recent = sorted(self._recent_waits)
+            return {
+                "checkouts": self.checkouts,
+                "overflow_events": self.overflow_events,
+                "timeouts": self.timeouts,
+                "wait_ms": {
+                    "avg": round(self.total_wait / self.checkouts * 1000, 3)
+                    if self.checkouts else 0.0,
+                    "max": round(self.max_wait * 1000, 3),
+                    "p50": round(recent[len(recent) // 2] * 1000, 3) if recent else 0.0,
+                    "p99": round(
+                        statistics.quantiles(recent, n=100)[98] * 1000, 3
+                    ) if len(recent) > 1 else 0.0,
+                },
+            }
+
+
+class _InstrumentedPoolMixin:
+    """
+    Mede o tempo de espera de cada checkout e conta overflows e timeouts,
+    só com a API pública do pool: ``connect()``, o evento ``connect`` e
+    ``overflow()``.
+    """
+
+    def __init__(self, *args, max_overflow: int = 10, **kwargs):
+        super().__init__(*args, max_overflow=max_overflow, **kwargs)
+        self.metrics = PoolMetrics()
+        self.max_overflow = max_overflow
+        # O recreate() copia os eventos para o novo pool
+        if not event.contains(self, "connect", _mark_opened_connection):
+            event.listen(self, "connect", _mark_opened_connection)
+
+    def connect(self):
+        token = _opened_connection.set(False)
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+            opened = _opened_connection.get()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        finally:
+            _opened_connection.reset(token)
+        self.metrics.record_checkout(time.perf_counter() - started)
+        # overflow() começa em -pool_size: acima de zero a conexão é extra
+        if opened and self.overflow() > 0:
+            self.metrics.record_overflow()
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def engine_options(url: str, async_driver: bool = False) -> dict:
+    """
+    Argumentos de ``create_engine``/``create_async_engine`` com o pool
+    configurado em ``app/core/config.py``.
+
+    Args:
+        url (str): URL do banco.
+        async_driver (bool): Se a engine usa asyncpg em vez de psycopg2.
+    """
+    url = make_url(url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # SQLite em memória: cada conexão seria um banco diferente
+        return {}
+
+    options = {
+        "poolclass": InstrumentedAsyncQueuePool if async_driver else InstrumentedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+    if url.get_backend_name() == "postgresql" and DB_STATEMENT_TIMEOUT_MS > 0:
+        if async_driver:
+            options["connect_args"] = {
+                "server_settings": {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}
+            }
+        else:
+            options["connect_args"] = {
+                "options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"
+            }
+    return options
+
+
+def pool_status(pool) -> dict:
+    """Ocupação atual do pool e, se instrumentado, as métricas acumuladas."""
+    status = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            in_use=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=getattr(pool, "max_overflow", None),
+            timeout=pool.timeout(),
+        )
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update(metrics.stats())
+    return status
@@ -0,0 +1,44 @@
+"""
+Reconstrói e verifica as tabelas de rollup dos relatórios.
+
+    python -m app.db.rebuild_rollups            # reconstrói e verifica
+    python -m app.db.rebuild_rollups --verify   # apenas verifica
+"""
+
+import argparse
+import sys
+
+from sqlalchemy.orm import Session
+
+from app.core.logger import logger
+from app.db.init_db import engine
+from app.db.repositories.report_rollup_repository import ReportRollupRepository
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="apenas compara os rollups com as tabelas de origem",
+    )
+    args = parser.parse_args()
+
+    with Session(engine) as session:
+        rollup_repo = ReportRollupRepository(session)
+        if not args.verify:
+            logger.info("Reconstruindo rollups dos relatórios")
+            rollup_repo.rebuild()
+
+        mismatches = rollup_repo.verify()
+        for mismatch in mismatches:
+            logger.error(f"Rollup divergente: {mismatch}")
+        if mismatches:
+            return 1
+
+    logger.info("Rollups dos relatórios consistentes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
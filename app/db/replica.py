@@ -0,0 +1,140 @@
+import threading
+import time
+from typing import Optional
+
+from fastapi import Depends, Request
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.config import (
+    DATABASE_REPLICA_URL,
+    READ_AFTER_WRITE_SECONDS,
+    REPLICA_LAG_CHECK_INTERVAL,
+    REPLICA_MAX_LAG_SECONDS,
+)
+from app.core.logger import logger
+from app.db.pool import engine_options
+from app.db.session import get_db
+
+# Cookie gravado após uma escrita: até o instante indicado, as leituras do
+# cliente vão para o primário e enxergam a própria escrita.
+READ_PRIMARY_COOKIE = "read_primary_until"
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+POSTGRES_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() "
+    "THEN 0 ELSE COALESCE(EXTRACT(EPOCH FROM now() - "
+    "pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+class ReplicaRouter:
+    """
+    Decide se uma leitura pode ir para a réplica: ela precisa estar
+    configurada, o cliente não pode ter escrito recentemente e o atraso de
+    replicação (medido no máximo uma vez por ``check_interval``) precisa
+    estar abaixo de ``max_lag``.
+    """
+
+    def __init__(
+        self,
+        engine: Optional[Engine] = None,
+        max_lag: float = REPLICA_MAX_LAG_SECONDS,
+        check_interval: float = REPLICA_LAG_CHECK_INTERVAL,
+    ):
+        self.engine = engine
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._lag: Optional[float] = None
+        self._checked_at = float("-inf")
+        self.replica_reads = 0
+        self.primary_fallbacks = 0
+
+    def measure_lag(self) -> float:
+        """Atraso de replicação em segundos (0 para bancos sem replicação)."""
+        with self.engine.connect() as connection:
+            if connection.dialect.name != "postgresql":
+                return 0.0
+            return float(connection.execute(POSTGRES_LAG_QUERY).scalar() or 0)
+
+    def lag(self) -> Optional[float]:
+        """Último atraso medido, ou None se a réplica não respondeu."""
+        with self._lock:
+            if time.monotonic() - self._checked_at < self.check_interval:
+                return self._lag
+            self._checked_at = time.monotonic()
+        try:
+            lag = self.measure_lag()
+        except Exception as exc:
+            logger.error(f"Falha ao medir o atraso da réplica: {exc}")
+            lag = None
+        with self._lock:
+            self._lag = lag
+        return lag
+
+    def use_replica(self, request: Request) -> bool:
+        if self.engine is None:
+            return False
+        read_primary_until = request.cookies.get(READ_PRIMARY_COOKIE)
+        try:
+            if read_primary_until and float(read_primary_until) > time.time():
+                return False
+        except ValueError:
+            pass
+        lag = self.lag()
+        if lag is None or lag > self.max_lag:
+            self.primary_fallbacks += 1
+            return False
+        self.replica_reads += 1
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.engine is not None,
+            "lag_seconds": self._lag,
+            "max_lag_seconds": self.max_lag,
+            "replica_reads": self.replica_reads,
+            "primary_fallbacks": self.primary_fallbacks,
+        }
+
+
+replica_engine = (
+    create_engine(DATABASE_REPLICA_URL, **engine_options(DATABASE_REPLICA_URL))
+    if DATABASE_REPLICA_URL
+    else None
+)
+replica_router = ReplicaRouter(replica_engine)
+
+
+def get_read_db(request: Request, db: Session = Depends(get_db)):
+    """
+    Sessão para rotas somente leitura: usa a réplica quando possível e, caso
+    contrário, a sessão do primário (que só abre conexão se for usada).
+    """
+    if not replica_router.use_replica(request):
+        yield db
+        return
+    # info["replica"] identifica a origem da leitura (ex.: na chave do cache
+    # dos relatórios, para não servir ao primário um resultado da réplica)
+    with Session(replica_router.engine, info={"replica": True}) as session:
+        yield session
+
+
+async def read_after_write_middleware(request: Request, call_next):
+    """Marca o cliente para ler do primário logo após uma escrita bem-sucedida."""
+    response = await call_next(request)
+    if (
+        replica_router.engine is not None
+        and request.method in WRITE_METHODS
+        and response.status_code < 400
+    ):
+        response.set_cookie(
+            READ_PRIMARY_COOKIE,
+            str(time.time() + READ_AFTER_WRITE_SECONDS),
+            max_age=max(1, int(READ_AFTER_WRITE_SECONDS)),
+            httponly=True,
+        )
+    return response
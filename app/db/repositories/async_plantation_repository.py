@@ -0,0 +1,70 @@
+from sqlalchemy import delete, exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.farm_plantation_season import FarmPlantationSeason
+from app.db.models.plantation import Plantation
+from app.db.pagination import keyset_page
+from app.schemas.plantation import PlantationCreate
+
+
+class AsyncPlantationRepository:
+    """Versão assíncrona de PlantationRepository, com as mesmas consultas."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_plantation(self, plantation: PlantationCreate):
+        db_plantation = Plantation(
+            name=plantation.name, description=plantation.description
+        )
+        self.db.add(db_plantation)
+        await self.db.commit()
+        return db_plantation
+
+    async def get_plantation_by_id(self, plantation_id: int):
+        return await self.db.get(Plantation, plantation_id)
+
+    async def list_plantations(
+        self, offset: int = 0, limit: int = 100, after: tuple = None
+    ):
+        stmt = keyset_page(
+            select(Plantation), Plantation.id, offset=offset, limit=limit, after=after
+        )
+        return (await self.db.scalars(stmt)).all()
+
+    async def update_plantation(self, plantation_id: int,
+                                plantation: PlantationCreate):
+        db_plantation = await self.get_plantation_by_id(plantation_id)
+        if db_plantation:
+            db_plantation.name = plantation.name
+            db_plantation.description = plantation.description
+            await self.db.commit()
+        return db_plantation
+
+    async def plantation_exists(self, plantation_id: int) -> bool:
+        return await self.db.scalar(
+            select(exists().where(Plantation.id == plantation_id)))
+
+    async def remove_plantation(self, plantation_id: int):
+        """
+        Remove a cultura com um único DELETE ... RETURNING, desde que ela não
+        esteja cadastrada em fazendas.
+
+        Returns:
+            Plantation | None: A cultura removida, ou None se ela não existir
+                               ou tiver registros relacionados.
+        """
+        stmt = (
+            delete(Plantation)
+            .where(
+                Plantation.id == plantation_id,
+                ~exists().where(FarmPlantationSeason.plantation_id == Plantation.id),
+            )
+            .returning(Plantation)
+        )
+        plantation = (await self.db.scalars(stmt)).first()
+        if plantation is None:
+            return None
+        self.db.expunge(plantation)
+        await self.db.commit()
+        return plantation
@@ -0,0 +1,91 @@
+from sqlalchemy import delete, exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.db.models.farm import Farm
+from app.db.models.productor import Productor
+from app.db.pagination import keyset_page
+from app.schemas.productor import ProductorCreate
+
+
+class AsyncProductorRepository:
+    """Versão assíncrona de ProductorRepository, com as mesmas consultas."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def productor_exists(self, productor_id: int) -> bool:
+        return await self.db.scalar(
+            select(exists().where(Productor.id == productor_id)))
+
+    async def create_productor(self, productor: ProductorCreate):
+        db_productor = Productor(
+            name=productor.name,
+            cpf_cnpj=productor.cpf_cnpj,
+            birthdate=productor.birthdate,
+        )
+        self.db.add(db_productor)
+        await self.db.commit()
+        return db_productor
+
+    async def get_productor_by_id(self, productor_id: int):
+        return await self.db.get(Productor, productor_id)
+
+    async def get_productor_with_farms(self, productor_id: int):
+        """Busca o produtor com as fazendas carregadas (SELECT ... IN)."""
+        stmt = (
+            select(Productor)
+            .options(selectinload(Productor.farms))
+            .where(Productor.id == productor_id)
+        )
+        return (await self.db.scalars(stmt)).first()
+
+    async def get_productor_version(self, productor_id: int):
+        return await self.db.scalar(
+            select(Productor.version).where(Productor.id == productor_id)
+        )
+
+    async def list_productors(
+        self, offset: int = 0, limit: int = 100, after: tuple = None
+    ):
+        stmt = keyset_page(
+            select(Productor), Productor.id, offset=offset, limit=limit, after=after
+        )
+        return (await self.db.scalars(stmt)).all()
+
+    async def update_productor(self, productor_id: int, productor: ProductorCreate):
+        db_productor = await self.get_productor_by_id(productor_id)
+        if db_productor:
+            db_productor.name = productor.name
+            db_productor.cpf_cnpj = productor.cpf_cnpj
+            db_productor.birthdate = productor.birthdate
+            await self.db.commit()
+        return db_productor
+
+    async def remove_productor(self, productor_id: int):
+        """
+        Remove o produtor com um único DELETE ... RETURNING, desde que ele não
+        tenha fazendas.
+
+        Returns:
+            Productor | None: O produtor removido, ou None se ele não existir
+                              ou tiver fazendas relacionadas.
+        """
+        stmt = (
+            delete(Productor)
+            .where(
+                Productor.id == productor_id,
+                ~exists().where(Farm.productor_id == Productor.id),
+            )
+            .returning(Productor)
+        )
+        productor = (await self.db.scalars(stmt)).first()
+        if productor is None:
+            return None
+        self.db.expunge(productor)
+        await self.db.commit()
+        return productor
+
+    async def get_productor_by_cpf_cnpj(self, cpf_cnpj: str):
+        return await self.db.scalar(
+            select(Productor).where(Productor.cpf_cnpj == cpf_cnpj))
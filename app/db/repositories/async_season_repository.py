@@ -0,0 +1,67 @@
+from sqlalchemy import delete, exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.farm_plantation_season import FarmPlantationSeason
+from app.db.models.season import Season
+from app.db.pagination import keyset_page
+from app.schemas.season import SeasonCreate
+
+
+class AsyncSeasonRepository:
+    """Versão assíncrona de SeasonRepository, com as mesmas consultas."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def season_exists(self, season_id: int) -> bool:
+        return await self.db.scalar(select(exists().where(Season.id == season_id)))
+
+    async def create_season(self, season: SeasonCreate):
+        db_season = Season(
+            description=season.description,
+            year=season.year,
+        )
+        self.db.add(db_season)
+        await self.db.commit()
+        return db_season
+
+    async def get_season_by_id(self, season_id: int):
+        return await self.db.get(Season, season_id)
+
+    async def list_seasons(self, offset: int = 0, limit: int = 100, after: tuple = None):
+        stmt = keyset_page(
+            select(Season), Season.id, offset=offset, limit=limit, after=after
+        )
+        return (await self.db.scalars(stmt)).all()
+
+    async def update_season(self, season_id: int, season: SeasonCreate):
+        db_season = await self.get_season_by_id(season_id)
+        if db_season:
+            db_season.description = season.description
+            db_season.year = season.year
+            await self.db.commit()
+        return db_season
+
+    async def remove_season(self, season_id: int):
+        """
+        Remove a safra com um único DELETE ... RETURNING, desde que ela não
+        tenha culturas cadastradas.
+
+        Returns:
+            Season | None: A safra removida, ou None se ela não existir ou
+                           tiver registros relacionados.
+        """
+        stmt = (
+            delete(Season)
+            .where(
+                Season.id == season_id,
+                ~exists().where(FarmPlantationSeason.season_id == Season.id),
+            )
+            .returning(Season)
+        )
+        season = (await self.db.scalars(stmt)).first()
+        if season is None:
+            return None
+        self.db.expunge(season)
+        await self.db.commit()
+        return season
@@ -0,0 +1,97 @@
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.orm import Session
+
+from app.db.models.farm import Farm
+from app.db.models.plantation import Plantation
+from app.db.models.productor import Productor
+from app.db.models.season import Season
+from app.db.pagination import keyset_page
+from app.db.repositories.farm_repository import FarmRepository
+from app.schemas.farm import FarmFilters, FarmSortField, SortOrder
+
+FARMS = Farm.__table__
+PRODUCTORS = Productor.__table__
+PLANTATIONS = Plantation.__table__
+SEASONS = Season.__table__
+
+
+class CoreReadRepository:
+    """
+    Listagens e buscas por ID em SQLAlchemy Core, só para leitura.
+
+    As consultas selecionam as colunas das tabelas (não os modelos) e
+    devolvem objetos ``Row``: sem instâncias do ORM, identity map ou estado
+    de alteração. As linhas têm os mesmos atributos que os modelos e são
+    serializadas pelos mesmos schemas de resposta. As buscas por ID usam
+    ``lambda_stmt``, que guarda o comando compilado e só troca o parâmetro.
+
+    Os métodos têm os mesmos nomes dos métodos de leitura dos repositórios
+    do ORM usados pelos serviços; escritas continuam nos repositórios do ORM.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _page(self, stmt, id_column, **pagination):
+        return self.db.execute(keyset_page(stmt, id_column, **pagination)).all()
+
+    def get_farm_by_id(self, farm_id: int):
+        stmt = lambda_stmt(lambda: select(FARMS).where(FARMS.c.id == farm_id))
+        return self.db.execute(stmt).first()
+
+    def list_farms(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        after: tuple = None,
+        filters: FarmFilters = None,
+        sort_by: FarmSortField = FarmSortField.id,
+        order: SortOrder = SortOrder.asc,
+    ):
+        stmt = select(FARMS)
+        if filters is not None:
+            stmt = FarmRepository.apply_filters(stmt, filters, FARMS.c)
+        return self._page(
+            stmt,
+            FARMS.c.id,
+            offset=offset,
+            limit=limit,
+            after=after,
+            sort_column=FARMS.c[FarmSortField(sort_by).value],
+            descending=SortOrder(order) == SortOrder.desc,
+        )
+
+    def get_productor_by_id(self, productor_id: int):
+        stmt = lambda_stmt(
+            lambda: select(PRODUCTORS).where(PRODUCTORS.c.id == productor_id)
+        )
+        return self.db.execute(stmt).first()
+
+    def list_productors(self, offset: int = 0, limit: int = 100, after: tuple = None):
+        return self._page(
+            select(PRODUCTORS), PRODUCTORS.c.id, offset=offset, limit=limit, after=after
+        )
+
+    def get_plantation_by_id(self, plantation_id: int):
+        stmt = lambda_stmt(
+            lambda: select(PLANTATIONS).where(PLANTATIONS.c.id == plantation_id)
+        )
+        return self.db.execute(stmt).first()
+
+    def list_plantations(self, offset: int = 0, limit: int = 100, after: tuple = None):
+        return self._page(
+            select(PLANTATIONS),
+            PLANTATIONS.c.id,
+            offset=offset,
+            limit=limit,
+            after=after,
+        )
+
+    def get_season_by_id(self, season_id: int):
+        stmt = lambda_stmt(lambda: select(SEASONS).where(SEASONS.c.id == season_id))
+        return self.db.execute(stmt).first()
+
+    def list_seasons(self, offset: int = 0, limit: int = 100, after: tuple = None):
+        return self._page(
+            select(SEASONS), SEASONS.c.id, offset=offset, limit=limit, after=after
+        )
@@ -1,10 +1,22 @@
-from sqlalchemy import distinct, func
-from sqlalchemy.orm import Session
+from collections import defaultdict
 
+from sqlalchemy import delete, distinct, exists, func, insert, literal, select, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload
+
+from app.db.dialects import dialect_insert
 from app.db.models.farm import Farm
-from app.db.models.farm_plantation_season import FarmPlantationSeason
+from app.db.models.farm_plantation_season import (
+    FarmPlantationSeason,
+    is_missing_partition,
+)
+from app.db.models.plantation import Plantation
+from app.db.models.productor import Productor
+from app.db.models.season import Season
+from app.db.pagination import paginate
 from app.db.repositories.productor_repository import ProductorRepository
-from app.schemas.farm import FarmCreate
+from app.db.repositories.report_rollup_repository import ReportRollupRepository
+from app.schemas.farm import FarmCreate, FarmFilters, FarmSortField, SortOrder
 from app.schemas.farm_plantation_season import FarmPlantationSeasonCreate
 
 
@@ -12,6 +24,7 @@ class FarmRepository:
     def __init__(self, db: Session):
         self.db = db
         self.productor_repo = ProductorRepository(db)
+        self.rollup_repo = ReportRollupRepository(db)
 
     def create_farm(self, farm: FarmCreate):
         db_farm = Farm(
@@ -24,46 +37,319 @@ class FarmRepository:
             productor_id=farm.productor_id,
         )
         self.db.add(db_farm)
+        self.rollup_repo.apply_farm_delta(
+            farm.state, 1, farm.total_area, farm.arable_area, farm.vegetation_area
+        )
         self.db.commit()
         self.db.refresh(db_farm)
         return db_farm
 
+    def create_farms(self, farms: list[FarmCreate], chunk_size: int = 1000):
+        """
+        Insere as fazendas com um INSERT de várias linhas por lote e atualiza
+        os rollups com um delta agregado por estado, em uma única transação.
+
+        Returns:
+            list[int]: IDs das fazendas criadas, na ordem recebida.
+        """
+        farm_ids = []
+        for start in range(0, len(farms), chunk_size):
+            rows = [farm.model_dump() for farm in farms[start:start + chunk_size]]
+            # O RETURNING de um INSERT de várias linhas não garante a ordem.
+            # Em vez de um comando por linha (sort_by_parameter_order, no
+            # SQLite), o RETURNING traz também os valores inseridos e cada
+            # linha recebe o ID de uma linha devolvida com os mesmos valores;
+            # linhas idênticas são intercambiáveis.
+            columns = list(rows[0])
+            stmt = insert(Farm.__table__).returning(
+                Farm.__table__.c.id, *(Farm.__table__.c[column] for column in columns)
+            )
+            ids_by_values = defaultdict(list)
+            for farm_id, *values in self.db.execute(stmt, rows):
+                ids_by_values[tuple(values)].append(farm_id)
+            farm_ids.extend(
+                ids_by_values[tuple(row[column] for column in columns)].pop()
+                for row in rows
+            )
+
+        state_deltas = {}
+        for farm in farms:
+            delta = state_deltas.setdefault(farm.state, [0, 0.0, 0.0, 0.0])
+            delta[0] += 1
+            delta[1] += farm.total_area
+            delta[2] += farm.arable_area
+            delta[3] += farm.vegetation_area
+        for state, delta in state_deltas.items():
+            self.rollup_repo.apply_farm_delta(state, *delta)
+
+        self.db.commit()
+        return farm_ids
+
     def add_plantation(
         self, farm_id: int, plantation_season: FarmPlantationSeasonCreate
     ):
-        new_farm_plantation_season = FarmPlantationSeason(
-            farm_id=farm_id,
-            plantation_id=plantation_season.plantation_id,
-            season_id=plantation_season.season_id,
+        """
+        Insere a relação em um único comando (INSERT ... SELECT ... ON
+        CONFLICT DO NOTHING RETURNING). O SELECT só produz a linha se a
+        fazenda, a cultura e a safra existirem, e o índice único descarta
+        duplicatas, inclusive entre escritas concorrentes.
+
+        Returns:
+            FarmPlantationSeason | None: A relação criada, ou None se alguma
+                                         referência não existir ou se a
+                                         relação já estiver cadastrada.
+        """
+        plantation_id = plantation_season.plantation_id
+        season_id = plantation_season.season_id
+        source = select(
+            literal(farm_id), literal(plantation_id), literal(season_id)
+        ).where(
+            exists().where(Farm.id == farm_id),
+            exists().where(Plantation.id == plantation_id),
+            exists().where(Season.id == season_id),
+        )
+        stmt = (
+            dialect_insert(self.db, FarmPlantationSeason)
+            .from_select(["farm_id", "plantation_id", "season_id"], source)
+            .on_conflict_do_nothing(
+                index_elements=["farm_id", "plantation_id", "season_id"]
+            )
+            .returning(FarmPlantationSeason)
         )
-        self.db.add(new_farm_plantation_season)
+        try:
+            new_farm_plantation_season = self.db.scalars(stmt).first()
+        except IntegrityError as error:
+            self.db.rollback()
+            if is_missing_partition(error):
+                # Tabela particionada sem partição para a safra: não é um
+                # problema de referência, o chamador trata à parte
+                raise
+            # Referência removida por uma transação concorrente
+            return None
+        if new_farm_plantation_season is None:
+            return None
+
+        self.rollup_repo.apply_plantation_delta(farm_id, plantation_id, season_id)
+        # O RETURNING já trouxe todas as colunas; desanexar o objeto evita que
+        # o commit o expire e force um SELECT ao serializar a resposta.
+        self.db.expunge(new_farm_plantation_season)
         self.db.commit()
-        self.db.refresh(new_farm_plantation_season)
         return new_farm_plantation_season
 
-    def farm_plantation_exists(
+    def get_plantation_references(
         self, farm_id: int, plantation_season: FarmPlantationSeasonCreate
     ):
-        db_farm_plantation = (
-            self.db.query(FarmPlantationSeason)
-            .filter(
+        """
+        Indica, em uma única consulta, se a fazenda, a cultura e a safra
+        existem e se a relação entre elas já está cadastrada.
+        """
+        return self.db.query(
+            exists().where(Farm.id == farm_id).label("farm"),
+            exists()
+            .where(Plantation.id == plantation_season.plantation_id)
+            .label("plantation"),
+            exists().where(Season.id == plantation_season.season_id).label("season"),
+            exists()
+            .where(
                 FarmPlantationSeason.farm_id == farm_id,
                 FarmPlantationSeason.plantation_id == plantation_season.plantation_id,
                 FarmPlantationSeason.season_id == plantation_season.season_id,
             )
-            .first()
+            .label("farm_plantation"),
+        ).one()
+
+    def get_existing_farm_ids(self, farm_ids, chunk_size: int = 1000) -> set[int]:
+        """Retorna quais dos IDs informados existem, com uma consulta por lote."""
+        farm_ids = list(farm_ids)
+        existing = set()
+        for start in range(0, len(farm_ids), chunk_size):
+            rows = self.db.query(Farm.id).filter(
+                Farm.id.in_(farm_ids[start:start + chunk_size]))
+            existing.update(farm_id for (farm_id,) in rows)
+        return existing
+
+    def get_existing_farm_plantations(self, keys, chunk_size: int = 1000):
+        """
+        Retorna quais das chaves (farm_id, plantation_id, season_id)
+        informadas já estão cadastradas, com uma consulta por lote.
+        """
+        keys = list(keys)
+        key_columns = tuple_(
+            FarmPlantationSeason.farm_id,
+            FarmPlantationSeason.plantation_id,
+            FarmPlantationSeason.season_id,
         )
-        return db_farm_plantation is not None
+        existing = set()
+        for start in range(0, len(keys), chunk_size):
+            rows = self.db.query(
+                FarmPlantationSeason.farm_id,
+                FarmPlantationSeason.plantation_id,
+                FarmPlantationSeason.season_id,
+            ).filter(key_columns.in_(keys[start:start + chunk_size]))
+            existing.update(tuple(row) for row in rows)
+        return existing
+
+    def add_plantations(self, keys: list[tuple], chunk_size: int = 1000):
+        """
+        Insere as relações (farm_id, plantation_id, season_id) com um INSERT
+        de várias linhas por lote, atualizando os rollups de cada lote com um
+        único upsert agregado. Relações gravadas por uma escrita concorrente
+        são ignoradas pelo índice único (ON CONFLICT DO NOTHING).
+
+        Returns:
+            dict[tuple, int]: ID de cada relação efetivamente criada.
+        """
+        ids = {}
+        for start in range(0, len(keys), chunk_size):
+            rows = [
+                {"farm_id": farm_id, "plantation_id": plantation_id, "season_id": season_id}
+                for farm_id, plantation_id, season_id in keys[start:start + chunk_size]
+            ]
+            stmt = (
+                dialect_insert(self.db, FarmPlantationSeason.__table__)
+                .values(rows)
+                .on_conflict_do_nothing(
+                    index_elements=["farm_id", "plantation_id", "season_id"]
+                )
+                .returning(
+                    FarmPlantationSeason.farm_id,
+                    FarmPlantationSeason.plantation_id,
+                    FarmPlantationSeason.season_id,
+                    FarmPlantationSeason.id,
+                )
+            )
+            chunk_ids = {tuple(row[:3]): row[3] for row in self.db.execute(stmt)}
+            self.rollup_repo.apply_plantation_rows(list(chunk_ids.values()))
+            ids.update(chunk_ids)
+        self.db.commit()
+        return ids
 
     def get_farm_by_id(self, farm_id: int):
         return self.db.query(Farm).filter(Farm.id == farm_id).first()
 
-    def list_farms(self, offset: int = 0, limit: int = 100):
-        return self.db.query(Farm).offset(offset).limit(limit).all()
+    def get_farm_with_plantations(self, farm_id: int):
+        """
+        Busca a fazenda com as relações de cultura/safra, as culturas e as
+        safras carregadas na mesma consulta (LEFT OUTER JOINs).
+        """
+        farm_plantations = joinedload(Farm.farm_plantations)
+        return (
+            self.db.query(Farm)
+            .options(
+                farm_plantations.joinedload(FarmPlantationSeason.plantation),
+                farm_plantations.joinedload(FarmPlantationSeason.season),
+            )
+            .filter(Farm.id == farm_id)
+            .first()
+        )
+
+    def get_farm_version(self, farm_id: int):
+        return self.db.query(Farm.version).filter(Farm.id == farm_id).scalar()
+
+    def list_farms(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        after: tuple = None,
+        filters: FarmFilters = None,
+        sort_by: FarmSortField = FarmSortField.id,
+        order: SortOrder = SortOrder.asc,
+    ):
+        query = self.db.query(Farm)
+        if filters is not None:
+            query = self.apply_filters(query, filters)
+        return paginate(
+            query,
+            Farm.id,
+            offset=offset,
+            limit=limit,
+            after=after,
+            sort_column=getattr(Farm, FarmSortField(sort_by).value),
+            descending=SortOrder(order) == SortOrder.desc,
+        )
+
+    def stream_farms(
+        self,
+        filters: FarmFilters = None,
+        include_productor: bool = False,
+        include_plantations: bool = False,
+        batch_size: int = 1000,
+    ):
+        """
+        Lê as fazendas em lotes (``yield_per``), sem montar objetos do ORM,
+        para exportações que não devem carregar a tabela inteira na memória.
+
+        Returns:
+            Query: Linhas com as colunas da fazenda e, opcionalmente, o nome e
+                   o CPF/CNPJ do produtor e os nomes das culturas.
+        """
+        query = self.db.query(
+            Farm.id,
+            Farm.name,
+            Farm.city,
+            Farm.state,
+            Farm.total_area,
+            Farm.arable_area,
+            Farm.vegetation_area,
+            Farm.productor_id,
+        )
+        if include_productor:
+            query = query.add_columns(
+                Productor.name.label("productor_name"),
+                Productor.cpf_cnpj.label("productor_cpf_cnpj"),
+            ).outerjoin(Productor, Farm.productor)
+        if include_plantations:
+            farm_plantations = (
+                select(FarmPlantationSeason.farm_id, Plantation.name)
+                .join(Plantation, FarmPlantationSeason.plantation)
+                .distinct()
+                .subquery()
+            )
+            plantation_names = (
+                select(
+                    farm_plantations.c.farm_id,
+                    func.aggregate_strings(farm_plantations.c.name, ";").label(
+                        "plantations"
+                    ),
+                )
+                .group_by(farm_plantations.c.farm_id)
+                .subquery()
+            )
+            query = query.add_columns(plantation_names.c.plantations).outerjoin(
+                plantation_names, plantation_names.c.farm_id == Farm.id
+            )
+        if filters is not None:
+            query = self.apply_filters(query, filters)
+        return query.order_by(Farm.id).yield_per(batch_size)
+
+    @staticmethod
+    def apply_filters(query, filters: FarmFilters, columns=Farm):
+        """
+        Aplica os filtros de listagem. ``columns`` pode ser o modelo ou as
+        colunas da tabela (``Farm.__table__.c``), usadas pelo caminho de
+        leitura em Core.
+        """
+        if filters.state is not None:
+            query = query.filter(columns.state == filters.state)
+        if filters.city is not None:
+            query = query.filter(columns.city == filters.city)
+        if filters.productor_id is not None:
+            query = query.filter(columns.productor_id == filters.productor_id)
+        for column in (
+            columns.total_area, columns.arable_area, columns.vegetation_area
+        ):
+            minimum = getattr(filters, f"min_{column.key}")
+            maximum = getattr(filters, f"max_{column.key}")
+            if minimum is not None:
+                query = query.filter(column >= minimum)
+            if maximum is not None:
+                query = query.filter(column <= maximum)
+        return query
 
     def update_farm(self, farm_id: int, farm: FarmCreate):
         db_farm = self.get_farm_by_id(farm_id)
         if db_farm:
+            self.rollup_repo.apply_farm_update(db_farm, farm)
             db_farm.name = farm.name
             db_farm.city = farm.city
             db_farm.state = farm.state
@@ -75,11 +361,33 @@ class FarmRepository:
             self.db.refresh(db_farm)
         return db_farm
 
+    def farm_exists(self, farm_id: int) -> bool:
+        return self.db.query(exists().where(Farm.id == farm_id)).scalar()
+
     def remove_farm(self, farm_id: int):
-        farm = self.get_farm_by_id(farm_id)
-        if farm:
-            self.db.delete(farm)
-            self.db.commit()
+        """
+        Remove a fazenda com um único DELETE ... RETURNING, desde que ela não
+        tenha culturas cadastradas (NOT EXISTS sobre o índice de farm_id).
+
+        Returns:
+            Farm | None: A fazenda removida, ou None se ela não existir ou
+                         tiver registros relacionados.
+        """
+        stmt = (
+            delete(Farm)
+            .where(
+                Farm.id == farm_id,
+                ~exists().where(FarmPlantationSeason.farm_id == Farm.id),
+            )
+            .returning(Farm)
+        )
+        farm = self.db.scalars(stmt).first()
+        if farm is None:
+            return None
+        self.rollup_repo.apply_farm_removal(farm)
+        # Desanexada, a fazenda removida continua legível após o commit
+        self.db.expunge(farm)
+        self.db.commit()
         return farm
 
     def get_total_farms(self):
@@ -138,3 +446,57 @@ class FarmRepository:
             .all()
         )
         return results
+
+    def get_state_aggregates(self):
+        """
+        Agrega, em uma única consulta agrupada, o total de fazendas, as somas
+        de área e o total de culturas distintas de cada estado.
+
+        Returns:
+            dict: Linhas agregadas indexadas pela sigla do estado.
+        """
+        state_plantations = (
+            self.db.query(
+                Farm.state.label("state"),
+                func.count(distinct(FarmPlantationSeason.plantation_id)).label(
+                    "plantations_total"
+                ),
+            )
+            .join(FarmPlantationSeason, Farm.farm_plantations)
+            .group_by(Farm.state)
+            .subquery()
+        )
+        results = (
+            self.db.query(
+                Farm.state,
+                func.count(Farm.id).label("farms_total"),
+                func.sum(Farm.total_area).label("total_area"),
+                func.sum(Farm.arable_area).label("arable_area"),
+                func.sum(Farm.vegetation_area).label("vegetation_area"),
+                func.coalesce(state_plantations.c.plantations_total, 0).label(
+                    "plantations_total"
+                ),
+            )
+            .outerjoin(state_plantations, state_plantations.c.state == Farm.state)
+            .group_by(Farm.state, state_plantations.c.plantations_total)
+            .order_by(Farm.state)
+            .all()
+        )
+        return {row.state: row for row in results}
+
+    def get_global_aggregates(self):
+        """
+        Calcula os totais globais (fazendas, áreas e culturas distintas) em
+        uma única linha.
+        """
+        plantations_total = select(
+            func.count(distinct(FarmPlantationSeason.plantation_id))
+        ).scalar_subquery()
+        return self.db.query(
+            func.count(Farm.id).label("farms_total"),
+            func.coalesce(func.sum(Farm.total_area), 0).label("total_area"),
+            func.coalesce(func.sum(Farm.arable_area), 0).label("arable_area"),
+            func.coalesce(func.sum(Farm.vegetation_area), 0).label(
+                "vegetation_area"),
+            plantations_total.label("plantations_total"),
+        ).one()
@@ -1,8 +1,10 @@
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import BigInteger, cast, delete, exists, func
+from sqlalchemy.orm import Session, joinedload
 
 from app.db.models.farm_plantation_season import FarmPlantationSeason
 from app.db.models.plantation import Plantation
+from app.db.models.season import Season
+from app.db.pagination import paginate
 from app.schemas.plantation import PlantationCreate
 
 
@@ -23,8 +25,40 @@ class PlantationRepository:
         return self.db.query(Plantation).filter(
             Plantation.id == plantation_id).first()
 
-    def list_plantations(self, offset: int = 0, limit: int = 100):
-        return self.db.query(Plantation).offset(offset).limit(limit).all()
+    def get_plantation_with_seasons(self, plantation_id: int):
+        """
+        Busca a cultura com as relações de fazenda/safra e as safras
+        carregadas na mesma consulta (LEFT OUTER JOINs).
+        """
+        return (
+            self.db.query(Plantation)
+            .options(
+                joinedload(Plantation.farm_plantations).joinedload(
+                    FarmPlantationSeason.season
+                )
+            )
+            .filter(Plantation.id == plantation_id)
+            .first()
+        )
+
+    def get_existing_plantation_ids(self, plantation_ids, chunk_size: int = 1000) -> set[int]:
+        """Retorna quais dos IDs informados existem, com uma consulta por lote."""
+        plantation_ids = list(plantation_ids)
+        existing = set()
+        for start in range(0, len(plantation_ids), chunk_size):
+            rows = self.db.query(Plantation.id).filter(
+                Plantation.id.in_(plantation_ids[start:start + chunk_size]))
+            existing.update(plantation_id for (plantation_id,) in rows)
+        return existing
+
+    def list_plantations(self, offset: int = 0, limit: int = 100, after: tuple = None):
+        return paginate(
+            self.db.query(Plantation),
+            Plantation.id,
+            offset=offset,
+            limit=limit,
+            after=after,
+        )
 
     def update_plantation(self, plantation_id: int,
                           plantation: PlantationCreate):
@@ -36,38 +70,78 @@ class PlantationRepository:
             self.db.refresh(db_plantation)
         return db_plantation
 
+    def plantation_exists(self, plantation_id: int) -> bool:
+        return self.db.query(
+            exists().where(Plantation.id == plantation_id)).scalar()
+
     def remove_plantation(self, plantation_id: int):
-        plantation = self.get_plantation_by_id(plantation_id)
-        if plantation:
-            self.db.delete(plantation)
-            self.db.commit()
-        return plantation
+        """
+        Remove a cultura com um único DELETE ... RETURNING, desde que ela não
+        esteja cadastrada em fazendas (NOT EXISTS sobre o índice de
+        plantation_id).
 
-    def get_plantations_statistics(self):
-        results = (
-            self.db.query(
-                FarmPlantationSeason.season_id,
-                FarmPlantationSeason.plantation_id,
-                func.count(FarmPlantationSeason.plantation_id).label(
-                    "total_plantations"
-                ),
-            )
-            .group_by(
-                FarmPlantationSeason.season_id, FarmPlantationSeason.plantation_id
+        Returns:
+            Plantation | None: A cultura removida, ou None se ela não existir
+                               ou tiver registros relacionados.
+        """
+        stmt = (
+            delete(Plantation)
+            .where(
+                Plantation.id == plantation_id,
+                ~exists().where(FarmPlantationSeason.plantation_id == Plantation.id),
             )
-            .all()
+            .returning(Plantation)
         )
-        return results
+        plantation = self.db.scalars(stmt).first()
+        if plantation is None:
+            return None
+        self.db.expunge(plantation)
+        self.db.commit()
+        return plantation
 
-    def get_plantations_total_by_season(self):
-        seasons_plantation_total = (
-            self.db.query(
-                FarmPlantationSeason.season_id,
-                func.count(FarmPlantationSeason.plantation_id).label(
-                    "total_plantations"
-                ),
+    def get_plantations_statistics(
+        self,
+        season_from: int = None,
+        season_to: int = None,
+        year_from: int = None,
+        year_to: int = None,
+    ):
+        """
+        Conta as culturas por safra e o total de cada safra em uma única
+        consulta, usando uma função de janela particionada por safra.
+
+        Returns:
+            Query: Linhas (season_id, plantation_id, total_plantations,
+                   season_plantations_total) ordenadas por safra.
+        """
+        total_plantations = func.count(FarmPlantationSeason.id)
+        query = self.db.query(
+            FarmPlantationSeason.season_id,
+            FarmPlantationSeason.plantation_id,
+            total_plantations.label("total_plantations"),
+            # No Postgres, sum() de inteiros devolve numeric (Decimal)
+            cast(
+                func.sum(total_plantations).over(partition_by=FarmPlantationSeason.season_id),
+                BigInteger,
+            ).label("season_plantations_total"),
+        )
+        if season_from is not None:
+            query = query.filter(FarmPlantationSeason.season_id >= season_from)
+        if season_to is not None:
+            query = query.filter(FarmPlantationSeason.season_id <= season_to)
+        if year_from is not None or year_to is not None:
+            query = query.join(Season, FarmPlantationSeason.season)
+            if year_from is not None:
+                query = query.filter(Season.year >= year_from)
+            if year_to is not None:
+                query = query.filter(Season.year <= year_to)
+
+        return (
+            query.group_by(
+                FarmPlantationSeason.season_id, FarmPlantationSeason.plantation_id
+            )
+            .order_by(
+                FarmPlantationSeason.season_id, FarmPlantationSeason.plantation_id
             )
-            .group_by(FarmPlantationSeason.season_id)
-            .all()
+            .yield_per(1000)
         )
-        return seasons_plantation_total
@@ -1,7 +1,11 @@
+from sqlalchemy import delete, exists
 from sqlalchemy.orm import Session
 
 from app.core.logger import logger
+from app.db.dialects import dialect_insert
+from app.db.models.farm import Farm
 from app.db.models.productor import Productor
+from app.db.pagination import paginate
 from app.schemas.productor import ProductorCreate
 
 
@@ -16,6 +20,50 @@ class ProductorRepository:
         )
         return productor is not None
 
+    def get_existing_productor_ids(
+        self, productor_ids, chunk_size: int = 1000
+    ) -> set[int]:
+        """Retorna quais dos IDs informados existem, com uma consulta por lote."""
+        productor_ids = list(productor_ids)
+        existing = set()
+        for start in range(0, len(productor_ids), chunk_size):
+            rows = self.db.query(Productor.id).filter(
+                Productor.id.in_(productor_ids[start:start + chunk_size]))
+            existing.update(productor_id for (productor_id,) in rows)
+        return existing
+
+    def get_existing_cpf_cnpjs(self, cpf_cnpjs) -> set[str]:
+        """Retorna, em uma única consulta, quais dos CPF/CNPJ informados existem."""
+        if not cpf_cnpjs:
+            return set()
+        rows = self.db.query(Productor.cpf_cnpj).filter(
+            Productor.cpf_cnpj.in_(cpf_cnpjs))
+        return {cpf_cnpj for (cpf_cnpj,) in rows}
+
+    def create_productors(self, productors: list[dict]) -> dict[str, int]:
+        """
+        Insere os produtores com INSERTs de várias linhas. Linhas cujo
+        CPF/CNPJ já exista (inclusive por uma escrita concorrente) são
+        descartadas pelo ON CONFLICT DO NOTHING.
+
+        Returns:
+            dict[str, int]: ID de cada produtor criado, pelo CPF/CNPJ.
+        """
+        if not productors:
+            return {}
+        stmt = (
+            dialect_insert(self.db, Productor.__table__)
+            .on_conflict_do_nothing(index_elements=[Productor.cpf_cnpj])
+            .returning(Productor.cpf_cnpj, Productor.id)
+        )
+        # Com uma lista de parâmetros o SQLAlchemy agrupa as linhas em INSERTs
+        # de vários VALUES ("insertmanyvalues") sem recompilar o comando a
+        # cada lote, como aconteceria com .values(lista).
+        rows = self.db.execute(stmt, productors)
+        created = {cpf_cnpj: productor_id for cpf_cnpj, productor_id in rows}
+        self.db.commit()
+        return created
+
     def create_productor(self, productor: ProductorCreate):
         db_productor = Productor(
             name=productor.name,
@@ -31,8 +79,21 @@ class ProductorRepository:
         return self.db.query(Productor).filter(
             Productor.id == productor_id).first()
 
-    def list_productors(self, offset: int = 0, limit: int = 100):
-        return self.db.query(Productor).offset(offset).limit(limit).all()
+    def get_productor_version(self, productor_id: int):
+        return (
+            self.db.query(Productor.version)
+            .filter(Productor.id == productor_id)
+            .scalar()
+        )
+
+    def list_productors(self, offset: int = 0, limit: int = 100, after: tuple = None):
+        return paginate(
+            self.db.query(Productor),
+            Productor.id,
+            offset=offset,
+            limit=limit,
+            after=after,
+        )
 
     def update_productor(self, productor_id: int, productor: ProductorCreate):
         db_productor = self.get_productor_by_id(productor_id)
@@ -45,10 +106,27 @@ class ProductorRepository:
         return db_productor
 
     def remove_productor(self, productor_id: int):
-        productor = self.get_productor_by_id(productor_id)
-        if productor:
-            self.db.delete(productor)
-            self.db.commit()
+        """
+        Remove o produtor com um único DELETE ... RETURNING, desde que ele não
+        tenha fazendas (NOT EXISTS sobre o índice de farms.productor_id).
+
+        Returns:
+            Productor | None: O produtor removido, ou None se ele não existir
+                              ou tiver fazendas relacionadas.
+        """
+        stmt = (
+            delete(Productor)
+            .where(
+                Productor.id == productor_id,
+                ~exists().where(Farm.productor_id == Productor.id),
+            )
+            .returning(Productor)
+        )
+        productor = self.db.scalars(stmt).first()
+        if productor is None:
+            return None
+        self.db.expunge(productor)
+        self.db.commit()
         return productor
 
     def get_productor_by_cpf_cnpj(self, cpf_cnpj: str):
@@ -0,0 +1,377 @@
+import math
+
+from sqlalchemy import BigInteger, cast, delete, distinct, func, literal, select
+from sqlalchemy.orm import Session
+
+from app.db.dialects import dialect_insert
+from app.db.models.farm import Farm
+from app.db.models.farm_plantation_season import FarmPlantationSeason
+from app.db.models.report_season_plantation_rollup import ReportSeasonPlantationRollup
+from app.db.models.report_state_rollup import ReportStateRollup
+from app.db.models.season import Season
+from app.schemas.farm import FarmCreate
+
+
+class ReportRollupRepository:
+    """
+    Mantém e lê as tabelas de rollup dos relatórios.
+
+    Os métodos de escrita não fazem commit: são chamados pelo FarmRepository
+    antes do commit, para que o rollup seja atualizado na mesma transação da
+    escrita que o originou. Os métodos de leitura têm os mesmos nomes dos
+    métodos de FarmRepository/PlantationRepository usados pelo ReportsService.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    # Escrita incremental
+
+    def apply_farm_delta(
+        self,
+        state: str,
+        farms: int,
+        total_area: float,
+        arable_area: float,
+        vegetation_area: float,
+    ):
+        stmt = dialect_insert(self.db, ReportStateRollup).values(
+            state=state,
+            farms_total=farms,
+            total_area=total_area,
+            arable_area=arable_area,
+            vegetation_area=vegetation_area,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ReportStateRollup.state],
+            set_={
+                "farms_total": ReportStateRollup.farms_total + stmt.excluded.farms_total,
+                "total_area": ReportStateRollup.total_area + stmt.excluded.total_area,
+                "arable_area": ReportStateRollup.arable_area + stmt.excluded.arable_area,
+                "vegetation_area": ReportStateRollup.vegetation_area
+                + stmt.excluded.vegetation_area,
+            },
+        )
+        self.db.execute(stmt)
+
+    def apply_farm_update(self, db_farm: Farm, farm: FarmCreate):
+        """Aplica a diferença entre o estado atual da fazenda e os novos dados."""
+        if db_farm.state == farm.state:
+            self.apply_farm_delta(
+                farm.state,
+                0,
+                farm.total_area - db_farm.total_area,
+                farm.arable_area - db_farm.arable_area,
+                farm.vegetation_area - db_farm.vegetation_area,
+            )
+            return
+
+        self.apply_farm_delta(
+            db_farm.state,
+            -1,
+            -db_farm.total_area,
+            -db_farm.arable_area,
+            -db_farm.vegetation_area,
+        )
+        self.apply_farm_delta(
+            farm.state, 1, farm.total_area, farm.arable_area, farm.vegetation_area
+        )
+        self.move_farm_plantations(db_farm.id, db_farm.state, farm.state)
+
+    def apply_farm_removal(self, db_farm: Farm):
+        self.apply_farm_delta(
+            db_farm.state,
+            -1,
+            -db_farm.total_area,
+            -db_farm.arable_area,
+            -db_farm.vegetation_area,
+        )
+
+    def apply_plantation_delta(
+        self, farm_id: int, plantation_id: int, season_id: int, delta: int = 1
+    ):
+        """Soma ``delta`` à contagem da cultura na safra, no estado da fazenda."""
+        source = select(
+            Farm.state,
+            literal(season_id),
+            literal(plantation_id),
+            literal(delta),
+        ).where(Farm.id == farm_id)
+        self._upsert_plantations(source)
+
+    def apply_plantation_rows(self, farm_plantation_ids: list[int]):
+        """Soma as relações fazenda/cultura/safra informadas, já gravadas."""
+        if not farm_plantation_ids:
+            return
+        source = (
+            select(
+                Farm.state,
+                FarmPlantationSeason.season_id,
+                FarmPlantationSeason.plantation_id,
+                func.count(FarmPlantationSeason.id),
+            )
+            .join(Farm, FarmPlantationSeason.farm)
+            .where(FarmPlantationSeason.id.in_(farm_plantation_ids))
+            .group_by(
+                Farm.state,
+                FarmPlantationSeason.season_id,
+                FarmPlantationSeason.plantation_id,
+            )
+        )
+        self._upsert_plantations(source)
+
+    def move_farm_plantations(self, farm_id: int, old_state: str, new_state: str):
+        """Transfere as culturas de uma fazenda de um estado para outro."""
+        for state, sign in ((old_state, -1), (new_state, 1)):
+            source = (
+                select(
+                    literal(state),
+                    FarmPlantationSeason.season_id,
+                    FarmPlantationSeason.plantation_id,
+                    sign * func.count(FarmPlantationSeason.id),
+                )
+                .where(FarmPlantationSeason.farm_id == farm_id)
+                .group_by(
+                    FarmPlantationSeason.season_id, FarmPlantationSeason.plantation_id
+                )
+            )
+            self._upsert_plantations(source)
+
+    def remove_season(self, season_id: int):
+        """Remove as culturas de uma safra (ex.: partição arquivada)."""
+        self.db.execute(
+            delete(ReportSeasonPlantationRollup).where(
+                ReportSeasonPlantationRollup.season_id == season_id
+            )
+        )
+
+    def _upsert_plantations(self, source):
+        stmt = dialect_insert(self.db, ReportSeasonPlantationRollup).from_select(
+            ["state", "season_id", "plantation_id", "total_plantations"], source
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                ReportSeasonPlantationRollup.state,
+                ReportSeasonPlantationRollup.season_id,
+                ReportSeasonPlantationRollup.plantation_id,
+            ],
+            set_={
+                "total_plantations": ReportSeasonPlantationRollup.total_plantations
+                + stmt.excluded.total_plantations
+            },
+        )
+        self.db.execute(stmt)
+
+    # Reconstrução e verificação
+
+    def _live_state_rows(self):
+        return select(
+            Farm.state,
+            func.count(Farm.id),
+            func.sum(Farm.total_area),
+            func.sum(Farm.arable_area),
+            func.sum(Farm.vegetation_area),
+        ).group_by(Farm.state)
+
+    def _live_plantation_rows(self):
+        return (
+            select(
+                Farm.state,
+                FarmPlantationSeason.season_id,
+                FarmPlantationSeason.plantation_id,
+                func.count(FarmPlantationSeason.id),
+            )
+            .join(Farm, FarmPlantationSeason.farm)
+            .group_by(
+                Farm.state,
+                FarmPlantationSeason.season_id,
+                FarmPlantationSeason.plantation_id,
+            )
+        )
+
+    def rebuild(self):
+        """Recalcula os rollups do zero a partir de farms e farm_plantation_season."""
+        self.db.execute(delete(ReportStateRollup))
+        self.db.execute(delete(ReportSeasonPlantationRollup))
+        self.db.execute(
+            ReportStateRollup.__table__.insert().from_select(
+                ["state", "farms_total", "total_area", "arable_area", "vegetation_area"],
+                self._live_state_rows(),
+            )
+        )
+        self.db.execute(
+            ReportSeasonPlantationRollup.__table__.insert().from_select(
+                ["state", "season_id", "plantation_id", "total_plantations"],
+                self._live_plantation_rows(),
+            )
+        )
+        self.db.commit()
+
+    def verify(self) -> list[str]:
+        """
+        Compara os rollups com os valores recalculados a partir das tabelas
+        de origem.
+
+        Returns:
+            list[str]: Descrição de cada divergência encontrada (vazia se
+                       os rollups estiverem consistentes).
+        """
+        mismatches = []
+
+        expected_states = {
+            row[0]: row[1:] for row in self.db.execute(self._live_state_rows())
+        }
+        actual_states = {
+            row.state: (
+                row.farms_total,
+                row.total_area,
+                row.arable_area,
+                row.vegetation_area,
+            )
+            for row in self.db.query(ReportStateRollup).filter(
+                ReportStateRollup.farms_total != 0
+            )
+        }
+        for state in expected_states.keys() | actual_states.keys():
+            expected = expected_states.get(state, (0, 0, 0, 0))
+            actual = actual_states.get(state, (0, 0, 0, 0))
+            if expected[0] != actual[0] or not all(
+                math.isclose(e, a, rel_tol=1e-9, abs_tol=1e-6)
+                for e, a in zip(expected[1:], actual[1:])
+            ):
+                mismatches.append(
+                    f"state {state}: esperado {expected}, encontrado {actual}"
+                )
+
+        expected_plantations = {
+            tuple(row[:3]): row[3]
+            for row in self.db.execute(self._live_plantation_rows())
+        }
+        actual_plantations = {
+            (row.state, row.season_id, row.plantation_id): row.total_plantations
+            for row in self.db.query(ReportSeasonPlantationRollup).filter(
+                ReportSeasonPlantationRollup.total_plantations != 0
+            )
+        }
+        for key in expected_plantations.keys() | actual_plantations.keys():
+            expected = expected_plantations.get(key, 0)
+            actual = actual_plantations.get(key, 0)
+            if expected != actual:
+                mismatches.append(
+                    f"state/season/plantation {key}: esperado {expected}, encontrado {actual}"
+                )
+
+        return mismatches
+
+    # Leitura
+
+    def get_total_farms(self):
+        total = self.db.query(func.sum(ReportStateRollup.farms_total)).scalar()
+        return total or 0
+
+    def get_total_area(self):
+        total_area = self.db.query(func.sum(ReportStateRollup.total_area)).scalar()
+        return total_area or 0
+
+    def get_total_vegetation_area(self):
+        total_vegetation_area = self.db.query(
+            func.sum(ReportStateRollup.vegetation_area)
+        ).scalar()
+        return total_vegetation_area or 0
+
+    def get_total_arable_area(self):
+        total_arable_area = self.db.query(
+            func.sum(ReportStateRollup.arable_area)).scalar()
+        return total_arable_area or 0
+
+    def get_state_aggregates(self):
+        state_plantations = (
+            self.db.query(
+                ReportSeasonPlantationRollup.state.label("state"),
+                func.count(distinct(ReportSeasonPlantationRollup.plantation_id)).label(
+                    "plantations_total"
+                ),
+            )
+            .filter(ReportSeasonPlantationRollup.total_plantations > 0)
+            .group_by(ReportSeasonPlantationRollup.state)
+            .subquery()
+        )
+        results = (
+            self.db.query(
+                ReportStateRollup.state,
+                ReportStateRollup.farms_total,
+                ReportStateRollup.total_area,
+                ReportStateRollup.arable_area,
+                ReportStateRollup.vegetation_area,
+                func.coalesce(state_plantations.c.plantations_total, 0).label(
+                    "plantations_total"
+                ),
+            )
+            .outerjoin(
+                state_plantations,
+                state_plantations.c.state == ReportStateRollup.state,
+            )
+            .filter(ReportStateRollup.farms_total > 0)
+            .order_by(ReportStateRollup.state)
+            .all()
+        )
+        return {row.state: row for row in results}
+
+    def get_global_aggregates(self):
+        plantations_total = (
+            select(func.count(distinct(ReportSeasonPlantationRollup.plantation_id)))
+            .where(ReportSeasonPlantationRollup.total_plantations > 0)
+            .scalar_subquery()
+        )
+        return self.db.query(
+            func.coalesce(func.sum(ReportStateRollup.farms_total), 0).label(
+                "farms_total"
+            ),
+            func.coalesce(func.sum(ReportStateRollup.total_area), 0).label(
+                "total_area"
+            ),
+            func.coalesce(func.sum(ReportStateRollup.arable_area), 0).label(
+                "arable_area"
+            ),
+            func.coalesce(func.sum(ReportStateRollup.vegetation_area), 0).label(
+                "vegetation_area"
+            ),
+            plantations_total.label("plantations_total"),
+        ).one()
+
+    def get_plantations_statistics(
+        self,
+        season_from: int = None,
+        season_to: int = None,
+        year_from: int = None,
+        year_to: int = None,
+    ):
+        rollup = ReportSeasonPlantationRollup
+        total_plantations = func.sum(rollup.total_plantations)
+        query = self.db.query(
+            rollup.season_id,
+            rollup.plantation_id,
+            total_plantations.label("total_plantations"),
+            # No Postgres, sum() de inteiros devolve numeric (Decimal)
+            cast(
+                func.sum(total_plantations).over(partition_by=rollup.season_id),
+                BigInteger,
+            ).label("season_plantations_total"),
+        )
+        if season_from is not None:
+            query = query.filter(rollup.season_id >= season_from)
+        if season_to is not None:
+            query = query.filter(rollup.season_id <= season_to)
+        if year_from is not None or year_to is not None:
+            query = query.join(Season, Season.id == rollup.season_id)
+            if year_from is not None:
+                query = query.filter(Season.year >= year_from)
+            if year_to is not None:
+                query = query.filter(Season.year <= year_to)
+
+        return (
+            query.group_by(rollup.season_id, rollup.plantation_id)
+            .having(total_plantations > 0)
+            .order_by(rollup.season_id, rollup.plantation_id)
+            .all()
+        )
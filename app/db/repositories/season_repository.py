@@ -1,6 +1,9 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, exists
+from sqlalchemy.orm import Session, joinedload
 
+from app.db.models.farm_plantation_season import FarmPlantationSeason
 from app.db.models.season import Season
+from app.db.pagination import paginate
 from app.schemas.season import SeasonCreate
 
 
@@ -25,8 +28,40 @@ class SeasonRepository:
     def get_season_by_id(self, season_id: int):
         return self.db.query(Season).filter(Season.id == season_id).first()
 
-    def list_seasons(self, offset: int = 0, limit: int = 100):
-        return self.db.query(Season).offset(offset).limit(limit).all()
+    def get_season_with_plantations(self, season_id: int):
+        """
+        Busca a safra com as relações de fazenda/cultura e as culturas
+        carregadas na mesma consulta (LEFT OUTER JOINs).
+        """
+        return (
+            self.db.query(Season)
+            .options(
+                joinedload(Season.farm_plantations).joinedload(
+                    FarmPlantationSeason.plantation
+                )
+            )
+            .filter(Season.id == season_id)
+            .first()
+        )
+
+    def get_existing_season_ids(self, season_ids, chunk_size: int = 1000) -> set[int]:
+        """Retorna quais dos IDs informados existem, com uma consulta por lote."""
+        season_ids = list(season_ids)
+        existing = set()
+        for start in range(0, len(season_ids), chunk_size):
+            rows = self.db.query(Season.id).filter(
+                Season.id.in_(season_ids[start:start + chunk_size]))
+            existing.update(season_id for (season_id,) in rows)
+        return existing
+
+    def list_seasons(self, offset: int = 0, limit: int = 100, after: tuple = None):
+        return paginate(
+            self.db.query(Season),
+            Season.id,
+            offset=offset,
+            limit=limit,
+            after=after,
+        )
 
     def update_season(self, season_id: int, season: SeasonCreate):
         db_season = self.get_season_by_id(season_id)
@@ -38,8 +73,25 @@ class SeasonRepository:
         return db_season
 
     def remove_season(self, season_id: int):
-        season = self.get_season_by_id(season_id)
-        if season:
-            self.db.delete(season)
-            self.db.commit()
+        """
+        Remove a safra com um único DELETE ... RETURNING, desde que ela não
+        tenha culturas cadastradas (NOT EXISTS sobre o índice de season_id).
+
+        Returns:
+            Season | None: A safra removida, ou None se ela não existir ou
+                           tiver registros relacionados.
+        """
+        stmt = (
+            delete(Season)
+            .where(
+                Season.id == season_id,
+                ~exists().where(FarmPlantationSeason.season_id == Season.id),
+            )
+            .returning(Season)
+        )
+        season = self.db.scalars(stmt).first()
+        if season is None:
+            return None
+        self.db.expunge(season)
+        self.db.commit()
         return season
@@ -1,9 +1,10 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import Session, declarative_base
 
 from app.core.config import DATABASE_URL
+from app.db.pool import engine_options
 
-engine = create_engine(DATABASE_URL)
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL))
 Base = declarative_base()
 
 
@@ -13,3 +14,45 @@ def get_db():
             yield session
         finally:
             session.close()
+
+
+# Versão global dos dados, guardada na linha única de data_version e
+# incrementada na mesma transação de cada escrita: todos os workers enxergam
+# a mesma versão. Usada para invalidar os caches de leitura (ex.: relatórios).
+DATA_VERSION_QUERY = text("SELECT version FROM data_version WHERE id = 1")
+DATA_VERSION_BUMP = text("UPDATE data_version SET version = version + 1 WHERE id = 1")
+
+
+def get_data_version(db: Session) -> int:
+    """Versão atual dos dados, com uma consulta pela chave primária."""
+    return db.execute(DATA_VERSION_QUERY).scalar() or 0
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush_changes(session, flush_context):
+    session.info["data_changed"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_changes(orm_execute_state):
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        orm_execute_state.session.info["data_changed"] = True
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_on_commit(session):
+    # O flush pendente do commit acontece antes, para que a versão só mude
+    # quando alguma tabela tiver sido alterada nesta transação
+    if session.new or session.dirty or session.deleted:
+        session.flush()
+    if session.info.pop("data_changed", False):
+        session.connection().execute(DATA_VERSION_BUMP)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session):
+    session.info.pop("data_changed", None)
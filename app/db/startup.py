@@ -0,0 +1,114 @@
+import time
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import configure_mappers
+
+from app.core.config import DATABASE_ASYNC, DB_POOL_WARMUP
+from app.core.logger import logger
+from app.db.async_session import get_async_engine
+from app.db.replica import replica_router
+from app.db.session import engine
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+
+class SchemaRevisionError(RuntimeError):
+    """Levantada quando o banco não está na revisão mais recente do Alembic."""
+
+
+def alembic_heads() -> set[str]:
+    """Revisões mais recentes dos scripts em alembic/versions."""
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    return set(ScriptDirectory.from_config(Config(str(ALEMBIC_INI))).get_heads())
+
+
+def check_schema_revision(engine: Engine) -> set[str]:
+    """
+    Confere se o banco está na revisão mais recente do Alembic, em vez de
+    criar as tabelas com create_all.
+
+    Returns:
+        set[str]: Revisão atual do banco.
+
+    Raises:
+        SchemaRevisionError: Se o banco não estiver atualizado.
+    """
+    from alembic.runtime.migration import MigrationContext
+
+    heads = alembic_heads()
+    with engine.connect() as connection:
+        current = set(MigrationContext.configure(connection).get_current_heads())
+    if current != heads:
+        raise SchemaRevisionError(
+            f"Banco na revisão {sorted(current) or 'vazia'}, esperado "
+            f"{sorted(heads)}. Execute 'alembic upgrade head'."
+        )
+    logger.info(f"Revisão do banco conferida: {', '.join(sorted(current))}")
+    return current
+
+
+def _warmup_size(pool, connections: int) -> int:
+    # Conexões além de pool_size seriam overflow e fechadas ao serem devolvidas
+    size = getattr(pool, "size", None)
+    return min(connections, size()) if size else min(connections, 1)
+
+
+def warm_pool(engine: Engine, connections: int) -> int:
+    """
+    Abre ``connections`` conexões (limitado ao pool_size) e as devolve ao
+    pool, para que as primeiras requisições não paguem o custo de conexão.
+
+    Returns:
+        int: Quantidade de conexões abertas.
+    """
+    connections = _warmup_size(engine.pool, connections)
+    opened = []
+    try:
+        for _ in range(connections):
+            connection = engine.connect()
+            opened.append(connection)
+            connection.execute(text("SELECT 1"))
+    finally:
+        for connection in opened:
+            connection.close()
+    return len(opened)
+
+
+async def warm_async_pool(engine: AsyncEngine, connections: int) -> int:
+    """Versão de warm_pool para a AsyncEngine."""
+    connections = _warmup_size(engine.pool, connections)
+    opened = []
+    try:
+        for _ in range(connections):
+            connection = await engine.connect()
+            opened.append(connection)
+            await connection.execute(text("SELECT 1"))
+    finally:
+        for connection in opened:
+            await connection.close()
+    return len(opened)
+
+
+async def fast_startup():
+    """
+    Inicialização rápida: confere a revisão do banco uma única vez,
+    configura os mappers e aquece os pools das engines em uso.
+    """
+    started = time.perf_counter()
+    check_schema_revision(engine)
+    # Sem isso, a configuração dos mappers acontece na primeira consulta
+    configure_mappers()
+    warmed = {"sync": warm_pool(engine, DB_POOL_WARMUP)}
+    if replica_router.engine is not None:
+        warmed["replica"] = warm_pool(replica_router.engine, DB_POOL_WARMUP)
+    if DATABASE_ASYNC:
+        warmed["async"] = await warm_async_pool(get_async_engine(), DB_POOL_WARMUP)
+    logger.info(
+        f"Inicialização rápida concluída em "
+        f"{(time.perf_counter() - started) * 1000:.1f} ms; conexões abertas: {warmed}"
+    )
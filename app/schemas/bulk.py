@@ -0,0 +1,16 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class BulkItem(BaseModel):
+    index: int
+    status_code: int
+    id: Optional[int] = None
+    detail: Optional[str] = None
+
+
+class BulkResult(BaseModel):
+    created: int
+    failed: int
+    items: list[BulkItem]
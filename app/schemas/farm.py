@@ -1,3 +1,6 @@
+from enum import Enum
+from typing import Optional
+
 from pydantic import BaseModel
 
 from app.schemas.farm_plantation_season import PlantationSeason, SeasonPlantation
@@ -30,3 +33,35 @@ class Farm(FarmBase):
 
     class ConfigDict:
         from_attributes = True
+
+
+class FarmSortField(str, Enum):
+    id = "id"
+    name = "name"
+    city = "city"
+    state = "state"
+    total_area = "total_area"
+    arable_area = "arable_area"
+    vegetation_area = "vegetation_area"
+
+
+class SortOrder(str, Enum):
+    asc = "asc"
+    desc = "desc"
+
+
+class FarmFilters(BaseModel):
+    state: Optional[str] = None
+    city: Optional[str] = None
+    productor_id: Optional[int] = None
+    min_total_area: Optional[float] = None
+    max_total_area: Optional[float] = None
+    min_arable_area: Optional[float] = None
+    max_arable_area: Optional[float] = None
+    min_vegetation_area: Optional[float] = None
+    max_vegetation_area: Optional[float] = None
+
+
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
@@ -13,6 +13,10 @@ class FarmPlantationSeasonCreate(FarmPlantationSeasonBase):
     pass
 
 
+class FarmPlantationSeasonBulkCreate(FarmPlantationSeasonBase):
+    farm_id: int
+
+
 class FarmPlantationSeason(FarmPlantationSeasonBase):
     id: int
     farm_id: int
@@ -1,4 +1,5 @@
 from datetime import date
+from enum import Enum
 
 from pydantic import BaseModel
 
@@ -18,3 +19,8 @@ class Productor(ProductorBase):
 
     class ConfigDict:
         from_attributes = True
+
+
+class ImportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
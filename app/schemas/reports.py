@@ -1,3 +1,6 @@
+from enum import Enum
+from typing import Optional
+
 from pydantic import BaseModel
 
 from app.schemas.plantation import Plantation
@@ -42,3 +45,22 @@ class StateStatistics(BaseModel):
     farms_percent: float
     plantation_statistics: PlantationStateStatistics
     ground_use_statistics: GroundUseStatistics
+
+
+class DashboardSection(str, Enum):
+    total_farms = "total_farms"
+    total_area = "total_area"
+    state_statistics = "state_statistics"
+    plantation_statistics = "plantation_statistics"
+    ground_use_statistics = "ground_use_statistics"
+
+
+DASHBOARD_SECTIONS = tuple(section.value for section in DashboardSection)
+
+
+class Dashboard(BaseModel):
+    total_farms: Optional[TotalFarms] = None
+    total_area: Optional[TotalArea] = None
+    state_statistics: Optional[list[StateStatistics]] = None
+    plantation_statistics: Optional[list[PlantationStatistics]] = None
+    ground_use_statistics: Optional[GroundUseStatistics] = None
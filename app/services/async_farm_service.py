@@ -0,0 +1,216 @@
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.bulk import BulkResult
+from app.schemas.farm import FarmCreate, FarmFilters, FarmSortField, SortOrder
+from app.schemas.farm_plantation_season import (
+    FarmPlantationSeasonBulkCreate,
+    FarmPlantationSeasonCreate,
+)
+from app.services.farm_service import FarmService
+
+
+class AsyncFarmService:
+    """
+    Versão assíncrona de FarmService. Cada método executa o método
+    equivalente do serviço síncrono com ``AsyncSession.run_sync``: as
+    consultas passam pelo driver assíncrono sem bloquear o event loop, e as
+    regras de área, a manutenção dos rollups e os erros continuam em um
+    único lugar.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _run(self, method: str, *args, **kwargs):
+        return await self.db.run_sync(
+            lambda session: getattr(FarmService(session), method)(*args, **kwargs)
+        )
+
+    async def create_farm(self, farm: FarmCreate):
+        """
+        Cria uma nova fazenda.
+
+        Args:
+            farm (FarmCreate): Dados da fazenda a ser criada.
+
+        Returns:
+            Farm: A fazenda criada.
+
+        Raises:
+            HTTPException: Se o produtor não for encontrado ou se a validação da área falhar.
+        """
+        return await self._run("create_farm", farm)
+
+    async def create_farms(self, farms: list[FarmCreate]) -> BulkResult:
+        """
+        Cria fazendas em lote; as inválidas não interrompem o lote.
+
+        Args:
+            farms (list[FarmCreate]): Dados das fazendas a serem criadas.
+
+        Returns:
+            BulkResult: Resultado por item, na ordem recebida, com o ID da
+                            fazenda criada ou o erro correspondente.
+        """
+        return await self._run("create_farms", farms)
+
+    async def add_plantation(
+        self, farm_id: int, plantation_season: FarmPlantationSeasonCreate
+    ):
+        """
+        Adiciona uma cultura a uma safra específica em uma fazenda.
+
+        Args:
+            farm_id (int): ID da fazenda.
+            plantation_season (FarmPlantationSeasonCreate): Dados da cultura e safra a serem adicionados.
+
+        Returns:
+            FarmPlantationSeason: A relação entre fazenda, cultura e safra criada.
+
+        Raises:
+            HTTPException: Se a fazenda, cultura ou safra não forem encontradas, ou se a cultura já existir na safra.
+        """
+        return await self._run("add_plantation", farm_id, plantation_season)
+
+    async def add_plantations(
+        self, farm_plantations: list[FarmPlantationSeasonBulkCreate]
+    ) -> BulkResult:
+        """
+        Adiciona culturas às safras de várias fazendas em lote; as relações
+        inválidas não interrompem o lote.
+
+        Args:
+            farm_plantations (list[FarmPlantationSeasonBulkCreate]): Relações
+                (farm_id, plantation_id, season_id) a serem criadas.
+
+        Returns:
+            BulkResult: Resultado por item, na ordem recebida, com o ID da
+                        relação criada ou o erro correspondente.
+        """
+        return await self._run("add_plantations", farm_plantations)
+
+    async def get_farm_by_id(self, farm_id: int):
+        """
+        Busca uma fazenda pelo seu ID.
+
+        Args:
+            farm_id (int): ID da fazenda a ser buscada.
+
+        Returns:
+            Farm: A fazenda encontrada.
+
+        Raises:
+            HTTPException: Se a fazenda não for encontrada.
+        """
+        return await self._run("get_farm_by_id", farm_id)
+
+    async def get_farm_etag(self, farm_id: int):
+        """
+        Calcula o ETag de uma fazenda a partir da sua versão, sem carregar a
+        linha completa.
+
+        Args:
+            farm_id (int): ID da fazenda.
+
+        Returns:
+            str | None: O ETag da fazenda, ou None se ela não existir.
+        """
+        return await self._run("get_farm_etag", farm_id)
+
+    async def list_farms(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        filters: FarmFilters = None,
+        sort_by: FarmSortField = FarmSortField.id,
+        order: SortOrder = SortOrder.asc,
+    ):
+        """
+        Lista as fazendas com filtros, ordenação e paginação.
+
+        Args:
+            offset (int): Número de registros a serem pulados (padrão: 0).
+            limit (int): Número máximo de registros a serem retornados (padrão: 100).
+            cursor (str): Cursor da página anterior; quando informado, o offset é ignorado.
+            filters (FarmFilters): Filtros por estado, cidade, produtor e faixas de área.
+            sort_by (FarmSortField): Campo de ordenação (padrão: id).
+            order (SortOrder): Direção da ordenação (padrão: asc).
+
+        Returns:
+            list[Farm]: Lista de fazendas.
+        """
+        return await self._run(
+            "list_farms",
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            filters=filters,
+            sort_by=sort_by,
+            order=order,
+        )
+
+    async def update_farm(self, farm_id: int, farm: FarmCreate):
+        """
+        Atualiza uma fazenda existente.
+
+        Args:
+            farm_id (int): ID da fazenda a ser atualizada.
+            farm (FarmCreate): Novos dados da fazenda.
+
+        Returns:
+            Farm: A fazenda atualizada.
+
+        Raises:
+            HTTPException: Se o produtor não for encontrado, a validação da área falhar,
+                           a fazenda não for encontrada ou for alterada por outra
+                           requisição durante a atualização (409).
+        """
+        return await self._run("update_farm", farm_id, farm)
+
+    async def remove_farm(self, farm_id: int):
+        """
+        Remove uma fazenda existente.
+
+        Args:
+            farm_id (int): ID da fazenda a ser removida.
+
+        Returns:
+            Farm: A fazenda removida.
+
+        Raises:
+            HTTPException: Se a fazenda não for encontrada ou se houver registros relacionados.
+        """
+        return await self._run("remove_farm", farm_id)
+
+    async def get_farm_plantations(self, farm_id: int):
+        """
+        Busca as culturas associadas a uma fazenda.
+
+        Args:
+            farm_id (int): ID da fazenda.
+
+        Returns:
+            list[FarmPlantation]: Lista de culturas associadas à fazenda.
+
+        Raises:
+            HTTPException: Se a fazenda não for encontrada.
+        """
+        return await self._run("get_farm_plantations", farm_id)
+
+    async def get_farm_seasons(self, farm_id: int):
+        """
+        Busca as safras associadas a uma fazenda.
+
+        Args:
+            farm_id (int): ID da fazenda.
+
+        Returns:
+            list[FarmSeason]: Lista de safras associadas à fazenda.
+
+        Raises:
+            HTTPException: Se a fazenda não for encontrada.
+        """
+        return await self._run("get_farm_seasons", farm_id)
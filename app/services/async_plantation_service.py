@@ -0,0 +1,126 @@
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logger import logger
+from app.db.repositories.async_plantation_repository import AsyncPlantationRepository
+from app.schemas.plantation import PlantationCreate
+from app.utils.pagination import decode_cursor
+
+
+class AsyncPlantationService:
+    """Versão assíncrona de PlantationService, com as mesmas regras e erros."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.plantation_repo = AsyncPlantationRepository(db)
+
+    async def create_plantation(self, plantation: PlantationCreate):
+        """
+        Cria uma nova cultura.
+
+        Args:
+            plantation (PlantationCreate): Dados da cultura a ser criada.
+
+        Returns:
+            Plantation: A cultura criada.
+        """
+        logger.info("Tentando criar uma nova cultura")
+        created_plantation = await self.plantation_repo.create_plantation(plantation)
+        logger.info("Cultura criada com sucesso")
+        return created_plantation
+
+    async def get_plantation_by_id(self, plantation_id: int):
+        """
+        Busca uma cultura pelo seu ID.
+
+        Args:
+            plantation_id (int): ID da cultura a ser buscada.
+
+        Returns:
+            Plantation: A cultura encontrada.
+
+        Raises:
+            HTTPException: Se a cultura não for encontrada.
+        """
+        logger.info(f"Buscando cultura por ID: {plantation_id}")
+        plantation = await self.plantation_repo.get_plantation_by_id(plantation_id)
+        if not plantation:
+            logger.error(f"Cultura não encontrada: ID {plantation_id}")
+            raise HTTPException(status_code=404, detail="Plantation not found")
+        return plantation
+
+    async def list_plantations(
+        self, offset: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ):
+        """
+        Lista todas as culturas com paginação.
+
+        Args:
+            offset (int): Número de registros a serem pulados (padrão: 0).
+            limit (int): Número máximo de registros a serem retornados (padrão: 100).
+            cursor (str): Cursor da página anterior; quando informado, o offset é ignorado.
+
+        Returns:
+            list[Plantation]: Lista de culturas.
+        """
+        logger.info("Listando todas as culturas")
+        after = decode_cursor(cursor) if cursor else None
+        return await self.plantation_repo.list_plantations(
+            offset=offset, limit=limit, after=after)
+
+    async def update_plantation(self, plantation_id: int,
+                                plantation: PlantationCreate):
+        """
+        Atualiza uma cultura existente.
+
+        Args:
+            plantation_id (int): ID da cultura a ser atualizada.
+            plantation (PlantationCreate): Novos dados da cultura.
+
+        Returns:
+            Plantation: A cultura atualizada.
+
+        Raises:
+            HTTPException: Se a cultura não for encontrada.
+        """
+        logger.info(f"Atualizando cultura ID: {plantation_id}")
+        updated_plantation = await self.plantation_repo.update_plantation(
+            plantation_id, plantation
+        )
+        if not updated_plantation:
+            logger.error(f"Cultura não encontrada: ID {plantation_id}")
+            raise HTTPException(status_code=404, detail="Plantation not found")
+        logger.info("Cultura atualizada com sucesso")
+        return updated_plantation
+
+    async def remove_plantation(self, plantation_id: int):
+        """
+        Remove uma cultura existente.
+
+        Args:
+            plantation_id (int): ID da cultura a ser removida.
+
+        Returns:
+            Plantation: A cultura removida.
+
+        Raises:
+            HTTPException: Se a cultura não for encontrada ou se houver registros relacionados.
+        """
+        logger.info(f"Removendo cultura ID: {plantation_id}")
+        deleted_plantation = await self.plantation_repo.remove_plantation(
+            plantation_id)
+        if not deleted_plantation:
+            if not await self.plantation_repo.plantation_exists(plantation_id):
+                logger.error(f"Cultura não encontrada: ID {plantation_id}")
+                raise HTTPException(status_code=404, detail="plantation not found")
+            logger.error(
+                "Não é possível deletar a cultura porque há registros relacionados"
+            )
+            raise HTTPException(
+                status_code=400,
+                detail="Cannot delete plantation because it has related records",
+            )
+        logger.info("Cultura removida com sucesso")
+        return deleted_plantation
@@ -0,0 +1,207 @@
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
+
+from app.core.logger import logger
+from app.db.repositories.async_productor_repository import AsyncProductorRepository
+from app.schemas.productor import ProductorCreate
+from app.utils.documents import normalize_cpf_cnpj
+from app.utils.etag import make_etag
+from app.utils.pagination import decode_cursor
+
+
+class AsyncProductorService:
+    """Versão assíncrona de ProductorService, com as mesmas regras e erros."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.productor_repo = AsyncProductorRepository(db)
+
+    async def create_productor(self, productor: ProductorCreate):
+        """
+        Cria um novo produtor.
+
+        Args:
+            productor (ProductorCreate): Dados do produtor a ser criado.
+
+        Returns:
+            Productor: O produtor criado.
+
+        Raises:
+            HTTPException: Se o CPF/CNPJ for inválido ou já estiver cadastrado.
+        """
+        logger.info(
+            f"Tentando criar produtor com CPF/CNPJ: {productor.cpf_cnpj}")
+        if normalize_cpf_cnpj(productor.cpf_cnpj) is None:
+            logger.error(
+                f"Falha ao criar produtor: CPF/CNPJ inválido: {productor.cpf_cnpj}"
+            )
+            raise HTTPException(status_code=400, detail="CPF/CNPJ inválido")
+        if await self.productor_repo.get_productor_by_cpf_cnpj(productor.cpf_cnpj):
+            logger.error(
+                f"Falha ao criar produtor: CPF/CNPJ já cadastrado: {productor.cpf_cnpj}"
+            )
+            raise HTTPException(
+                status_code=400,
+                detail="CPF/CNPJ já cadastrado")
+
+        created_productor = await self.productor_repo.create_productor(productor)
+        logger.info(f"Produtor criado com sucesso: {created_productor.id}")
+        return created_productor
+
+    async def get_productor_by_id(self, productor_id: int):
+        """
+        Busca um produtor pelo seu ID.
+
+        Args:
+            productor_id (int): ID do produtor a ser buscado.
+
+        Returns:
+            Productor: O produtor encontrado.
+
+        Raises:
+            HTTPException: Se o produtor não for encontrado.
+        """
+        logger.info(f"Buscando produtor por ID: {productor_id}")
+        productor = await self.productor_repo.get_productor_by_id(productor_id)
+        if not productor:
+            logger.error(f"Produtor não encontrado: {productor_id}")
+            raise HTTPException(status_code=404, detail="Productor not found")
+        logger.info(f"Produtor encontrado: {productor_id}")
+        return productor
+
+    async def get_productor_etag(self, productor_id: int):
+        """
+        Calcula o ETag de um produtor a partir da sua versão, sem carregar a
+        linha completa.
+
+        Args:
+            productor_id (int): ID do produtor.
+
+        Returns:
+            str | None: O ETag do produtor, ou None se ele não existir.
+        """
+        version = await self.productor_repo.get_productor_version(productor_id)
+        if version is None:
+            return None
+        return make_etag("productor", productor_id, version)
+
+    async def list_productors(
+        self, offset: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ):
+        """
+        Lista todos os produtores com paginação.
+
+        Args:
+            offset (int): Número de registros a serem pulados (padrão: 0).
+            limit (int): Número máximo de registros a serem retornados (padrão: 100).
+            cursor (str): Cursor da página anterior; quando informado, o offset é ignorado.
+
+        Returns:
+            list[Productor]: Lista de produtores.
+        """
+        logger.info(
+            f"Listando produtores com offset: {offset} e limite: {limit}")
+        after = decode_cursor(cursor) if cursor else None
+        productors = await self.productor_repo.list_productors(
+            offset=offset, limit=limit, after=after)
+        logger.info(f"Total de produtores listados: {len(productors)}")
+        return productors
+
+    async def update_productor(self, productor_id: int, productor: ProductorCreate):
+        """
+        Atualiza um produtor existente.
+
+        Args:
+            productor_id (int): ID do produtor a ser atualizado.
+            productor (ProductorCreate): Novos dados do produtor.
+
+        Returns:
+            Productor: O produtor atualizado.
+
+        Raises:
+            HTTPException: Se o CPF/CNPJ for inválido, o produtor não for encontrado
+                           ou for alterado por outra requisição durante a
+                           atualização (409).
+        """
+        logger.info(f"Tentando atualizar produtor: {productor_id}")
+        if normalize_cpf_cnpj(productor.cpf_cnpj) is None:
+            logger.error(
+                f"Falha ao atualizar produtor: CPF/CNPJ inválido: {productor.cpf_cnpj}"
+            )
+            raise HTTPException(status_code=400, detail="CPF/CNPJ inválido")
+        try:
+            updated_productor = await self.productor_repo.update_productor(
+                productor_id, productor
+            )
+        except StaleDataError:
+            await self.db.rollback()
+            logger.error(
+                f"Falha ao atualizar produtor: alterado concorrentemente: {productor_id}"
+            )
+            raise HTTPException(
+                status_code=409, detail="Productor was modified by another request"
+            )
+        if not updated_productor:
+            logger.error(
+                f"Falha ao atualizar produtor: Produtor não encontrado: {productor_id}"
+            )
+            raise HTTPException(status_code=404, detail="Productor not found")
+        logger.info(f"Produtor atualizado com sucesso: {productor_id}")
+        return updated_productor
+
+    async def delete_productor(self, productor_id: int):
+        """
+        Remove um produtor existente.
+
+        Args:
+            productor_id (int): ID do produtor a ser removido.
+
+        Returns:
+            Productor: O produtor removido.
+
+        Raises:
+            HTTPException: Se o produtor não for encontrado ou se houver fazendas relacionadas.
+        """
+        logger.info(f"Tentando deletar produtor: {productor_id}")
+        deleted_productor = await self.productor_repo.remove_productor(productor_id)
+        if not deleted_productor:
+            if not await self.productor_repo.productor_exists(productor_id):
+                logger.error(
+                    f"Falha ao deletar produtor: Produtor não encontrado: {productor_id}"
+                )
+                raise HTTPException(status_code=404, detail="Productor not found")
+            logger.error(
+                f"Falha ao deletar produtor: Produtor possui fazendas relacionadas: {productor_id}"
+            )
+            raise HTTPException(
+                status_code=400,
+                detail="Cannot delete productor because it has related records",
+            )
+        logger.info(f"Produtor deletado com sucesso: {productor_id}")
+        return deleted_productor
+
+    async def get_productor_farms(self, productor_id: int):
+        """
+        Busca as fazendas associadas a um produtor.
+
+        Args:
+            productor_id (int): ID do produtor.
+
+        Returns:
+            list[Farm]: Lista de fazendas associadas ao produtor.
+
+        Raises:
+            HTTPException: Se o produtor não for encontrado.
+        """
+        logger.info(f"Buscando fazendas do produtor: {productor_id}")
+        productor = await self.productor_repo.get_productor_with_farms(productor_id)
+        if not productor:
+            logger.error(
+                f"Falha ao buscar fazendas: Produtor não encontrado: {productor_id}"
+            )
+            raise HTTPException(status_code=404, detail="Productor not found")
+        logger.info(f"Fazendas encontradas para o produtor: {productor_id}")
+        return productor.farms
@@ -0,0 +1,160 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import REPORTS_CACHE_ENABLED, REPORTS_SOURCE
+from app.core.metrics import REPORT_CACHE_REQUESTS
+from app.db.session import get_data_version
+from app.schemas.reports import (
+    DASHBOARD_SECTIONS,
+    Dashboard,
+    GroundUseStatistics,
+    PlantationStatistics,
+    StateStatistics,
+    TotalArea,
+    TotalFarms,
+)
+from app.services.reports_service import (
+    ReportsService,
+    report_cache_key,
+    reports_cache,
+)
+
+
+class AsyncReportsService:
+    """
+    Versão assíncrona de ReportsService. Cada relatório é calculado pelo
+    serviço síncrono com ``AsyncSession.run_sync``, com a mesma origem (live
+    ou rollup) e snapshot do painel.
+
+    O cache é consultado aqui, fora do ``run_sync``: o cálculo roda no
+    event loop, e um miss concorrente aguardando a outra requisição dentro
+    dele travaria o loop inteiro.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        source: str = REPORTS_SOURCE,
+        use_cache: bool = REPORTS_CACHE_ENABLED,
+    ):
+        self.db = db
+        self.source = source
+        self.use_cache = use_cache
+        self.version = None
+
+    async def _run(self, method: str, *args, **kwargs):
+        def run(session):
+            reports_service = ReportsService(
+                db=session, source=self.source, use_cache=False
+            )
+            return getattr(reports_service, method)(*args, **kwargs)
+
+        if not self.use_cache:
+            return await self.db.run_sync(run)
+
+        target = "replica" if self.db.info.get("replica") else "primary"
+        key = report_cache_key(method, self.source, target, args, kwargs)
+        computed = False
+
+        async def compute():
+            nonlocal computed
+            computed = True
+            return await self.db.run_sync(run)
+
+        value = await reports_cache.aget_or_compute(
+            key, compute, version=await self.data_version())
+        report = method.removeprefix("get_")
+        REPORT_CACHE_REQUESTS.labels(report, "miss" if computed else "hit").inc()
+        return value
+
+    async def data_version(self) -> int:
+        """
+        Versão dos dados do banco consultado, lida uma vez por instância
+        (uma requisição) e reaproveitada pelos relatórios seguintes.
+
+        Returns:
+            int: A versão dos dados.
+        """
+        if self.version is None:
+            self.version = await self.db.run_sync(get_data_version)
+        return self.version
+
+    async def get_total_farms(self) -> TotalFarms:
+        """
+        Calcula o total de fazendas registradas.
+
+        Returns:
+            TotalFarms: Um dicionário contendo o total de fazendas.
+        """
+        return await self._run("get_total_farms")
+
+    async def get_total_area(self) -> TotalArea:
+        """
+        Calcula a área total de todas as fazendas registradas.
+
+        Returns:
+            TotalArea: Um dicionário contendo a área total das fazendas.
+        """
+        return await self._run("get_total_area")
+
+    async def get_state_statistics(self) -> list[StateStatistics]:
+        """
+        Calcula estatísticas de fazendas e plantações por estado.
+
+        Returns:
+            list[StateStatistics]: Uma lista de dicionários contendo estatísticas por estado,
+                                  incluindo o total de fazendas, porcentagem de fazendas,
+                                  estatísticas de plantações e uso do solo.
+        """
+        return await self._run("get_state_statistics")
+
+    async def get_plantation_statistics(
+        self,
+        season_from: int = None,
+        season_to: int = None,
+        year_from: int = None,
+        year_to: int = None,
+    ) -> list[PlantationStatistics]:
+        """
+        Calcula estatísticas de plantações por safra.
+
+        Args:
+            season_from (int): ID da primeira safra considerada (opcional).
+            season_to (int): ID da última safra considerada (opcional).
+            year_from (int): Ano inicial das safras consideradas (opcional).
+            year_to (int): Ano final das safras consideradas (opcional).
+
+        Returns:
+            list[PlantationStatistics]: Uma lista de dicionários contendo estatísticas de plantações
+                                       por safra, incluindo o total de plantações e a porcentagem
+                                       em relação ao total de plantações da safra.
+        """
+        return await self._run(
+            "get_plantation_statistics",
+            season_from=season_from,
+            season_to=season_to,
+            year_from=year_from,
+            year_to=year_to,
+        )
+
+    async def get_ground_use_statistics(self) -> GroundUseStatistics:
+        """
+        Calcula estatísticas de uso do solo, incluindo áreas de vegetação e cultivável.
+
+        Returns:
+            GroundUseStatistics: Um dicionário contendo estatísticas de uso do solo,
+                                incluindo a porcentagem e o total de áreas de vegetação e cultivável.
+        """
+        return await self._run("get_ground_use_statistics")
+
+    async def get_dashboard(self, sections: tuple = DASHBOARD_SECTIONS) -> Dashboard:
+        """
+        Calcula os relatórios do painel a partir de um único snapshot do banco,
+        reaproveitando os agregados compartilhados entre as seções.
+
+        Args:
+            sections (tuple): Seções a incluir (padrão: todas).
+
+        Returns:
+            Dashboard: Um dicionário com uma chave por seção solicitada.
+        """
+        return await self._run("get_dashboard", sections)
@@ -0,0 +1,122 @@
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logger import logger
+from app.db.repositories.async_season_repository import AsyncSeasonRepository
+from app.schemas.season import SeasonCreate
+from app.utils.pagination import decode_cursor
+
+
+class AsyncSeasonService:
+    """Versão assíncrona de SeasonService, com as mesmas regras e erros."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.season_repo = AsyncSeasonRepository(db)
+
+    async def create_season(self, season: SeasonCreate):
+        """
+        Cria uma nova safra.
+
+        Args:
+            season (SeasonCreate): Dados da safra a ser criada.
+
+        Returns:
+            Season: A safra criada.
+        """
+        logger.info("Tentando criar uma nova safra")
+        created_season = await self.season_repo.create_season(season)
+        logger.info("Safra criada com sucesso")
+        return created_season
+
+    async def get_season_by_id(self, season_id: int):
+        """
+        Busca uma safra pelo seu ID.
+
+        Args:
+            season_id (int): ID da safra a ser buscada.
+
+        Returns:
+            Season: A safra encontrada.
+
+        Raises:
+            HTTPException: Se a safra não for encontrada.
+        """
+        logger.info(f"Buscando safra por ID: {season_id}")
+        season = await self.season_repo.get_season_by_id(season_id)
+        if not season:
+            logger.error(f"Safra não encontrada: ID {season_id}")
+            raise HTTPException(status_code=404, detail="Safra não encontrada")
+        return season
+
+    async def list_seasons(
+        self, offset: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ):
+        """
+        Lista todas as safras com paginação.
+
+        Args:
+            offset (int): Número de registros a serem pulados (padrão: 0).
+            limit (int): Número máximo de registros a serem retornados (padrão: 100).
+            cursor (str): Cursor da página anterior; quando informado, o offset é ignorado.
+
+        Returns:
+            list[Season]: Lista de safras.
+        """
+        logger.info("Listando todas as safras")
+        after = decode_cursor(cursor) if cursor else None
+        return await self.season_repo.list_seasons(
+            offset=offset, limit=limit, after=after)
+
+    async def update_season(self, season_id: int, season: SeasonCreate):
+        """
+        Atualiza uma safra existente.
+
+        Args:
+            season_id (int): ID da safra a ser atualizada.
+            season (SeasonCreate): Novos dados da safra.
+
+        Returns:
+            Season: A safra atualizada.
+
+        Raises:
+            HTTPException: Se a safra não for encontrada.
+        """
+        logger.info(f"Atualizando safra ID: {season_id}")
+        updated_season = await self.season_repo.update_season(season_id, season)
+        if not updated_season:
+            logger.error(f"Safra não encontrada: ID {season_id}")
+            raise HTTPException(status_code=404, detail="Safra não encontrada")
+        logger.info("Safra atualizada com sucesso")
+        return updated_season
+
+    async def remove_season(self, season_id: int):
+        """
+        Remove uma safra existente.
+
+        Args:
+            season_id (int): ID da safra a ser removida.
+
+        Returns:
+            Season: A safra removida.
+
+        Raises:
+            HTTPException: Se a safra não for encontrada ou se houver registros relacionados.
+        """
+        logger.info(f"Removendo safra ID: {season_id}")
+        deleted_season = await self.season_repo.remove_season(season_id)
+        if not deleted_season:
+            if not await self.season_repo.season_exists(season_id):
+                logger.error(f"Safra não encontrada: ID {season_id}")
+                raise HTTPException(status_code=404, detail="Safra não encontrada")
+            logger.error(
+                "Não é possível deletar a safra porque há registros relacionados"
+            )
+            raise HTTPException(
+                status_code=400,
+                detail="Não é possível deletar a safra porque há registros relacionados",
+            )
+        logger.info("Safra removida com sucesso")
+        return deleted_season
@@ -1,19 +1,43 @@
+from typing import Optional
+
 from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 
+from app.core.config import CORE_READ_PATH
 from app.core.logger import logger
+from app.db.repositories.core_read_repository import CoreReadRepository
 from app.db.repositories.farm_repository import FarmRepository
 from app.db.repositories.plantation_repository import PlantationRepository
 from app.db.repositories.productor_repository import ProductorRepository
 from app.db.repositories.season_repository import SeasonRepository
-from app.schemas.farm import Farm, FarmCreate, FarmPlantation
-from app.schemas.farm_plantation_season import FarmPlantationSeasonCreate
+from app.schemas.bulk import BulkResult
+from app.schemas.farm import (
+    ExportFormat,
+    Farm,
+    FarmBase,
+    FarmCreate,
+    FarmFilters,
+    FarmPlantation,
+    FarmSortField,
+    SortOrder,
+)
+from app.schemas.farm_plantation_season import (
+    FarmPlantationSeasonBulkCreate,
+    FarmPlantationSeasonCreate,
+)
+from app.utils.etag import make_etag
+from app.utils.export import csv_chunks, ndjson_chunks
+from app.utils.pagination import decode_cursor
 
 
 class FarmService:
     def __init__(self, db: Session):
         self.db = db
         self.farm_repo = FarmRepository(db)
+        # Listagens e buscas por ID em Core, sem montar objetos do ORM
+        self.read_repo = CoreReadRepository(db) if CORE_READ_PATH else self.farm_repo
         self.productor_repo = ProductorRepository(db)
 
     def area_validate(self, farm: FarmCreate):
@@ -60,6 +84,52 @@ class FarmService:
         logger.info("Fazenda criada com sucesso")
         return self.farm_repo.create_farm(farm)
 
+    def create_farms(self, farms: list[FarmCreate]) -> BulkResult:
+        """
+        Cria fazendas em lote. As regras de área são validadas em uma passada,
+        os produtores são conferidos com uma única consulta e as fazendas
+        válidas são inseridas em lotes; as inválidas não interrompem o lote.
+
+        Args:
+            farms (list[FarmCreate]): Dados das fazendas a serem criadas.
+
+        Returns:
+            BulkResult: Resultado por item, na ordem recebida, com o ID da
+                            fazenda criada ou o erro correspondente.
+        """
+        logger.info(f"Tentando criar {len(farms)} fazendas em lote")
+        existing_productors = self.productor_repo.get_existing_productor_ids(
+            {farm.productor_id for farm in farms}
+        )
+
+        items = []
+        valid_farms = []
+        for index, farm in enumerate(farms):
+            if farm.productor_id not in existing_productors:
+                items.append(
+                    {"index": index, "status_code": 404, "detail": "Productor not found"}
+                )
+            elif not self.area_validate(farm):
+                items.append(
+                    {
+                        "index": index,
+                        "status_code": 400,
+                        "detail": "The total area is less than the combined area of vegetation and arable land",
+                    }
+                )
+            else:
+                item = {"index": index, "status_code": 201}
+                items.append(item)
+                valid_farms.append((item, farm))
+
+        farm_ids = self.farm_repo.create_farms([farm for _, farm in valid_farms])
+        for (item, _), farm_id in zip(valid_farms, farm_ids):
+            item["id"] = farm_id
+
+        failed = len(farms) - len(valid_farms)
+        logger.info(f"Fazendas criadas: {len(valid_farms)}, com erro: {failed}")
+        return BulkResult(created=len(valid_farms), failed=failed, items=items)
+
     def add_plantation(
         self, farm_id: int, plantation_season: FarmPlantationSeasonCreate
     ):
@@ -74,36 +144,118 @@ class FarmService:
             FarmPlantationSeason: A relação entre fazenda, cultura e safra criada.
 
         Raises:
-            HTTPException: Se a fazenda, cultura ou safra não forem encontradas, ou se a cultura já existir na safra.
+            HTTPException: Se a fazenda, cultura ou safra não forem encontradas, se a cultura já existir na safra
+                           ou se a tabela particionada não tiver partição para a safra.
         """
         logger.info(f"Tentando adicionar cultura à fazenda ID: {farm_id}")
-        plantation_repo = PlantationRepository(self.db)
-        season_repo = SeasonRepository(self.db)
+        try:
+            farm_plantation_season = self.farm_repo.add_plantation(
+                farm_id, plantation_season
+            )
+        except IntegrityError:
+            # Só a falta de partição da safra chega aqui (ver FarmRepository)
+            logger.error(
+                f"Safra sem partição em farm_plantation_season: "
+                f"ID {plantation_season.season_id}"
+            )
+            raise HTTPException(
+                status_code=409,
+                detail=f"No partition for season {plantation_season.season_id}",
+            )
+        if farm_plantation_season is not None:
+            logger.info("Cultura adicionada com sucesso")
+            return farm_plantation_season
 
-        if not self.get_farm_by_id(farm_id):
+        # Nada foi inserido: descobre o motivo para manter os erros da API
+        references = self.farm_repo.get_plantation_references(
+            farm_id, plantation_season
+        )
+        if not references.farm:
             logger.error(f"Fazenda não encontrada: ID {farm_id}")
             raise HTTPException(status_code=404, detail="Farm not found")
 
-        if not plantation_repo.get_plantation_by_id(
-                plantation_season.plantation_id):
+        if not references.plantation:
             logger.error(
                 f"Cultura não encontrada: ID {plantation_season.plantation_id}"
             )
             raise HTTPException(status_code=404, detail="Plantation not found")
 
-        if not season_repo.get_season_by_id(plantation_season.season_id):
+        if not references.season:
             logger.error(
                 f"Safra não encontrada: ID {plantation_season.season_id}")
             raise HTTPException(status_code=404, detail="Season not found")
 
-        if self.farm_repo.farm_plantation_exists(farm_id, plantation_season):
-            logger.error("Cultura já existe nesta safra")
-            raise HTTPException(
-                status_code=400, detail="Plantation already exists in this season"
-            )
+        logger.error("Cultura já existe nesta safra")
+        raise HTTPException(
+            status_code=400, detail="Plantation already exists in this season"
+        )
+
+    def add_plantations(
+        self, farm_plantations: list[FarmPlantationSeasonBulkCreate]
+    ) -> BulkResult:
+        """
+        Adiciona culturas às safras de várias fazendas em lote. Fazendas,
+        culturas, safras e relações já existentes são conferidas com uma
+        consulta por tabela e lote, e as válidas são
+        inseridas em lotes; as inválidas não interrompem o lote.
+
+        Args:
+            farm_plantations (list[FarmPlantationSeasonBulkCreate]): Relações
+                (farm_id, plantation_id, season_id) a serem criadas.
+
+        Returns:
+            BulkResult: Resultado por item, na ordem recebida, com o ID da
+                        relação criada ou o erro correspondente.
+        """
+        logger.info(f"Tentando adicionar {len(farm_plantations)} culturas em lote")
+        plantation_repo = PlantationRepository(self.db)
+        season_repo = SeasonRepository(self.db)
 
-        logger.info("Cultura adicionada com sucesso")
-        return self.farm_repo.add_plantation(farm_id, plantation_season)
+        keys = [
+            (item.farm_id, item.plantation_id, item.season_id)
+            for item in farm_plantations
+        ]
+        existing_farms = self.farm_repo.get_existing_farm_ids({key[0] for key in keys})
+        existing_plantations = plantation_repo.get_existing_plantation_ids(
+            {key[1] for key in keys}
+        )
+        existing_seasons = season_repo.get_existing_season_ids({key[2] for key in keys})
+        seen = self.farm_repo.get_existing_farm_plantations(set(keys))
+
+        items = []
+        valid = []
+        for index, key in enumerate(keys):
+            farm_id, plantation_id, season_id = key
+            if farm_id not in existing_farms:
+                error = (404, "Farm not found")
+            elif plantation_id not in existing_plantations:
+                error = (404, "Plantation not found")
+            elif season_id not in existing_seasons:
+                error = (404, "Season not found")
+            elif key in seen:
+                error = (400, "Plantation already exists in this season")
+            else:
+                seen.add(key)
+                item = {"index": index, "status_code": 201}
+                items.append(item)
+                valid.append((item, key))
+                continue
+            items.append({"index": index, "status_code": error[0], "detail": error[1]})
+
+        ids = self.farm_repo.add_plantations([key for _, key in valid])
+        created = 0
+        for item, key in valid:
+            if key in ids:
+                item["id"] = ids[key]
+                created += 1
+            else:
+                # Gravada por outra transação entre a conferência e o INSERT
+                item["status_code"] = 400
+                item["detail"] = "Plantation already exists in this season"
+
+        failed = len(keys) - created
+        logger.info(f"Culturas adicionadas: {created}, com erro: {failed}")
+        return BulkResult(created=created, failed=failed, items=items)
 
     def get_farm_by_id(self, farm_id: int):
         """
@@ -119,25 +271,99 @@ class FarmService:
             HTTPException: Se a fazenda não for encontrada.
         """
         logger.info(f"Buscando fazenda por ID: {farm_id}")
-        farm = self.farm_repo.get_farm_by_id(farm_id)
+        farm = self.read_repo.get_farm_by_id(farm_id)
         if not farm:
             logger.error(f"Fazenda não encontrada: ID {farm_id}")
             raise HTTPException(status_code=404, detail="Farm not found")
         return farm
 
-    def list_farms(self, offset: int = 0, limit: int = 100):
+    def get_farm_etag(self, farm_id: int):
         """
-        Lista todas as fazendas com paginação.
+        Calcula o ETag de uma fazenda a partir da sua versão, sem carregar a
+        linha completa.
+
+        Args:
+            farm_id (int): ID da fazenda.
+
+        Returns:
+            str | None: O ETag da fazenda, ou None se ela não existir.
+        """
+        version = self.farm_repo.get_farm_version(farm_id)
+        if version is None:
+            return None
+        return make_etag("farm", farm_id, version)
+
+    def list_farms(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        filters: FarmFilters = None,
+        sort_by: FarmSortField = FarmSortField.id,
+        order: SortOrder = SortOrder.asc,
+    ):
+        """
+        Lista as fazendas com filtros, ordenação e paginação.
 
         Args:
             offset (int): Número de registros a serem pulados (padrão: 0).
             limit (int): Número máximo de registros a serem retornados (padrão: 100).
+            cursor (str): Cursor da página anterior; quando informado, o offset é ignorado.
+            filters (FarmFilters): Filtros por estado, cidade, produtor e faixas de área.
+            sort_by (FarmSortField): Campo de ordenação (padrão: id).
+            order (SortOrder): Direção da ordenação (padrão: asc).
 
         Returns:
             list[Farm]: Lista de fazendas.
         """
         logger.info("Listando todas as fazendas")
-        return self.farm_repo.list_farms(offset=offset, limit=limit)
+        after = None
+        if cursor:
+            # O cursor guarda o valor do campo de ordenação, com o tipo do schema
+            key_types = (
+                ()
+                if sort_by == FarmSortField.id
+                else (FarmBase.model_fields[FarmSortField(sort_by).value].annotation,)
+            )
+            after = decode_cursor(cursor, key_types)
+        return self.read_repo.list_farms(
+            offset=offset,
+            limit=limit,
+            after=after,
+            filters=filters,
+            sort_by=sort_by,
+            order=order,
+        )
+
+    def export_farms(
+        self,
+        export_format: ExportFormat = ExportFormat.ndjson,
+        filters: FarmFilters = None,
+        include_productor: bool = False,
+        include_plantations: bool = False,
+    ):
+        """
+        Exporta as fazendas em NDJSON ou CSV, lendo o banco em lotes.
+
+        Args:
+            export_format (ExportFormat): Formato da exportação (padrão: ndjson).
+            filters (FarmFilters): Filtros por estado, cidade, produtor e faixas de área.
+            include_productor (bool): Inclui o nome e o CPF/CNPJ do produtor.
+            include_plantations (bool): Inclui os nomes das culturas da fazenda.
+
+        Returns:
+            Iterator[str]: Blocos de texto a serem enviados na resposta.
+        """
+        logger.info(f"Exportando fazendas em {export_format.value}")
+        rows = self.farm_repo.stream_farms(
+            filters=filters,
+            include_productor=include_productor,
+            include_plantations=include_plantations,
+        )
+        if export_format == ExportFormat.csv:
+            columns = [column["name"] for column in rows.column_descriptions]
+            return csv_chunks(columns, rows)
+        return ndjson_chunks(rows)
 
     def update_farm(self, farm_id: int, farm: FarmCreate):
         """
@@ -151,7 +377,9 @@ class FarmService:
             Farm: A fazenda atualizada.
 
         Raises:
-            HTTPException: Se o produtor não for encontrado, a validação da área falhar ou a fazenda não for encontrada.
+            HTTPException: Se o produtor não for encontrado, a validação da área falhar,
+                           a fazenda não for encontrada ou for alterada por outra
+                           requisição durante a atualização (409).
         """
         logger.info(f"Atualizando fazenda ID: {farm_id}")
         if not self.productor_repo.productor_exists(farm.productor_id):
@@ -167,7 +395,15 @@ class FarmService:
                 detail="The total area is less than the combined area of vegetation and arable land",
             )
 
-        updated_farm = self.farm_repo.update_farm(farm_id, farm)
+        try:
+            updated_farm = self.farm_repo.update_farm(farm_id, farm)
+        except StaleDataError:
+            # A versão mudou entre a leitura e o UPDATE (escrita concorrente)
+            self.db.rollback()
+            logger.error(f"Fazenda alterada concorrentemente: ID {farm_id}")
+            raise HTTPException(
+                status_code=409, detail="Farm was modified by another request"
+            )
         if not updated_farm:
             logger.error(f"Fazenda não encontrada: ID {farm_id}")
             raise HTTPException(status_code=404, detail="Farm not found")
@@ -189,11 +425,11 @@ class FarmService:
             HTTPException: Se a fazenda não for encontrada ou se houver registros relacionados.
         """
         logger.info(f"Removendo fazenda ID: {farm_id}")
-        farm = self.farm_repo.get_farm_by_id(farm_id)
-        if not farm:
-            logger.error(f"Fazenda não encontrada: ID {farm_id}")
-            raise HTTPException(status_code=404, detail="Farm not found")
-        if farm.farm_plantations:
+        deleted_farm = self.farm_repo.remove_farm(farm_id)
+        if not deleted_farm:
+            if not self.farm_repo.farm_exists(farm_id):
+                logger.error(f"Fazenda não encontrada: ID {farm_id}")
+                raise HTTPException(status_code=404, detail="Farm not found")
             logger.error(
                 "Não é possível deletar a fazenda porque há registros relacionados"
             )
@@ -202,11 +438,6 @@ class FarmService:
                 detail="Cannot delete farm because it has related records",
             )
 
-        deleted_farm = self.farm_repo.remove_farm(farm_id)
-        if not deleted_farm:
-            logger.error(f"Fazenda não encontrada: ID {farm_id}")
-            raise HTTPException(status_code=404, detail="Farm not found")
-
         logger.info("Fazenda removida com sucesso")
         return deleted_farm
 
@@ -224,7 +455,7 @@ class FarmService:
             HTTPException: Se a fazenda não for encontrada.
         """
         logger.info(f"Buscando plantações da fazenda ID: {farm_id}")
-        farm = self.farm_repo.get_farm_by_id(farm_id)
+        farm = self.farm_repo.get_farm_with_plantations(farm_id)
         if not farm:
             logger.error(f"Fazenda não encontrada: ID {farm_id}")
             raise HTTPException(status_code=404, detail="Farm not found")
@@ -279,7 +510,7 @@ class FarmService:
             HTTPException: Se a fazenda não for encontrada.
         """
         logger.info(f"Buscando safras da fazenda ID: {farm_id}")
-        farm = self.farm_repo.get_farm_by_id(farm_id)
+        farm = self.farm_repo.get_farm_with_plantations(farm_id)
         if not farm:
             logger.error(f"Fazenda não encontrada: ID {farm_id}")
             raise HTTPException(status_code=404, detail="Farm not found")
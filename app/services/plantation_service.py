@@ -1,16 +1,25 @@
+from typing import Optional
+
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
+from app.core.config import CORE_READ_PATH
 from app.core.logger import logger
+from app.db.repositories.core_read_repository import CoreReadRepository
 from app.db.repositories.plantation_repository import PlantationRepository
 from app.db.repositories.season_repository import SeasonRepository
 from app.schemas.plantation import PlantationCreate
+from app.utils.pagination import decode_cursor
 
 
 class PlantationService:
     def __init__(self, db: Session):
         self.db = db
         self.plantation_repo = PlantationRepository(db)
+        # Listagens e buscas por ID em Core, sem montar objetos do ORM
+        self.read_repo = (
+            CoreReadRepository(db) if CORE_READ_PATH else self.plantation_repo
+        )
         self.season_repo = SeasonRepository(db)
 
     def create_plantation(self, plantation: PlantationCreate):
@@ -42,26 +51,30 @@ class PlantationService:
             HTTPException: Se a cultura não for encontrada.
         """
         logger.info(f"Buscando cultura por ID: {plantation_id}")
-        plantation = self.plantation_repo.get_plantation_by_id(plantation_id)
+        plantation = self.read_repo.get_plantation_by_id(plantation_id)
         if not plantation:
             logger.error(f"Cultura não encontrada: ID {plantation_id}")
             raise HTTPException(status_code=404, detail="Plantation not found")
         return plantation
 
-    def list_plantations(self, offset: int = 0, limit: int = 100):
+    def list_plantations(
+        self, offset: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ):
         """
         Lista todas as culturas com paginação.
 
         Args:
             offset (int): Número de registros a serem pulados (padrão: 0).
             limit (int): Número máximo de registros a serem retornados (padrão: 100).
+            cursor (str): Cursor da página anterior; quando informado, o offset é ignorado.
 
         Returns:
             list[Plantation]: Lista de culturas.
         """
         logger.info("Listando todas as culturas")
-        return self.plantation_repo.list_plantations(
-            offset=offset, limit=limit)
+        after = decode_cursor(cursor) if cursor else None
+        return self.read_repo.list_plantations(
+            offset=offset, limit=limit, after=after)
 
     def update_plantation(self, plantation_id: int,
                           plantation: PlantationCreate):
@@ -102,11 +115,12 @@ class PlantationService:
             HTTPException: Se a cultura não for encontrada ou se houver registros relacionados.
         """
         logger.info(f"Removendo cultura ID: {plantation_id}")
-        plantation = self.plantation_repo.get_plantation_by_id(plantation_id)
-        if not plantation:
-            logger.error(f"Cultura não encontrada: ID {plantation_id}")
-            raise HTTPException(status_code=404, detail="plantation not found")
-        if plantation.farm_plantations:
+        deleted_plantation = self.plantation_repo.remove_plantation(
+            plantation_id)
+        if not deleted_plantation:
+            if not self.plantation_repo.plantation_exists(plantation_id):
+                logger.error(f"Cultura não encontrada: ID {plantation_id}")
+                raise HTTPException(status_code=404, detail="plantation not found")
             logger.error(
                 "Não é possível deletar a cultura porque há registros relacionados"
             )
@@ -114,12 +128,6 @@ class PlantationService:
                 status_code=400,
                 detail="Cannot delete plantation because it has related records",
             )
-
-        deleted_plantation = self.plantation_repo.remove_plantation(
-            plantation_id)
-        if not deleted_plantation:
-            logger.error(f"Cultura não encontrada: ID {plantation_id}")
-            raise HTTPException(status_code=404, detail="Plantation not found")
         logger.info("Cultura removida com sucesso")
         return deleted_plantation
 
@@ -137,7 +145,7 @@ class PlantationService:
             HTTPException: Se a cultura não for encontrada.
         """
         logger.info(f"Buscando safras da cultura ID: {plantation_id}")
-        plantation = self.plantation_repo.get_plantation_by_id(plantation_id)
+        plantation = self.plantation_repo.get_plantation_with_seasons(plantation_id)
         if not plantation:
             logger.error(f"Cultura não encontrada: ID {plantation_id}")
             raise HTTPException(status_code=404, detail="Plantation not found")
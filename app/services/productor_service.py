@@ -1,17 +1,39 @@
+import csv
+import json
+from collections import deque
+from itertools import islice
+from typing import Iterator, Optional, TextIO
+
 from fastapi import HTTPException
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 from validate_docbr import CNPJ, CPF
 
+from app.core.config import (
+    CORE_READ_PATH,
+    PRODUCTOR_IMPORT_CHUNK_SIZE,
+    PRODUCTOR_IMPORT_WORKERS,
+)
 from app.core.logger import logger
+from app.db.repositories.core_read_repository import CoreReadRepository
 from app.db.repositories.productor_repository import ProductorRepository
 from app.schemas.farm import Farm
-from app.schemas.productor import ProductorCreate
+from app.schemas.bulk import BulkItem
+from app.schemas.productor import ImportFormat, ProductorCreate
+from app.utils.documents import submit_normalize_cpf_cnpjs
+from app.utils.etag import make_etag
+from app.utils.pagination import decode_cursor
 
 
 class ProductorService:
     def __init__(self, db: Session):
         self.db = db
         self.productor_repo = ProductorRepository(db)
+        # Listagens e buscas por ID em Core, sem montar objetos do ORM
+        self.read_repo = (
+            CoreReadRepository(db) if CORE_READ_PATH else self.productor_repo
+        )
 
     def validate_cpf_cnpj(self, cpf_cnpj):
         """
@@ -67,6 +89,143 @@ class ProductorService:
         logger.info(f"Produtor criado com sucesso: {created_productor.id}")
         return created_productor
 
+    def import_productors(
+        self, source: TextIO, import_format: ImportFormat = ImportFormat.ndjson
+    ) -> Iterator[str]:
+        """
+        Importa produtores de um arquivo CSV (cabeçalho name,cpf_cnpj,birthdate)
+        ou NDJSON, processando-o em lotes: os documentos de cada lote são
+        validados em um pool de processos, os já cadastrados são buscados com
+        uma única consulta IN e os demais são inseridos com um único INSERT.
+        Cada lote é gravado em sua própria transação.
+
+        Args:
+            source (TextIO): Arquivo a ser importado.
+            import_format (ImportFormat): Formato do arquivo (padrão: ndjson).
+
+        Returns:
+            Iterator[str]: Relatório em NDJSON, com uma linha por registro do
+                           arquivo (index, status_code, id, detail) e uma
+                           linha final com os totais (created, failed).
+        """
+        logger.info(f"Importando produtores em {import_format.value}")
+        rows = self._parse_import_rows(source, import_format)
+        # Mantém até PRODUCTOR_IMPORT_WORKERS lotes sendo validados no pool
+        # enquanto o lote mais antigo é gravado; a memória usada depende só
+        # do tamanho do lote, não do arquivo.
+        in_flight = deque()
+        created = failed = 0
+        while True:
+            chunk = list(islice(rows, PRODUCTOR_IMPORT_CHUNK_SIZE))
+            if chunk:
+                in_flight.append((chunk, self._submit_documents(chunk)))
+            if not in_flight:
+                break
+            if chunk and len(in_flight) <= PRODUCTOR_IMPORT_WORKERS:
+                continue
+            items = self._import_chunk(*in_flight.popleft())
+            for item in items:
+                if item.status_code == 201:
+                    created += 1
+                else:
+                    failed += 1
+            yield "".join(item.model_dump_json() + "\n" for item in items)
+        logger.info(
+            f"Importação concluída: {created} produtores criados, {failed} falhas"
+        )
+        yield json.dumps({"created": created, "failed": failed}) + "\n"
+
+    def _submit_documents(self, chunk):
+        return submit_normalize_cpf_cnpjs(
+            [productor.cpf_cnpj for _, productor, _ in chunk if productor],
+            PRODUCTOR_IMPORT_WORKERS,
+        )
+
+    def _parse_import_rows(self, source: TextIO, import_format: ImportFormat):
+        """Produz (index, ProductorCreate | None, erro | None) por registro."""
+        if import_format == ImportFormat.csv:
+            records = (
+                (index, record, None)
+                for index, record in enumerate(csv.DictReader(source))
+            )
+        else:
+            records = self._parse_ndjson(source)
+        for index, record, error in records:
+            if error:
+                yield index, None, error
+                continue
+            try:
+                yield index, ProductorCreate.model_validate(record), None
+            except ValidationError as exc:
+                error = exc.errors()[0]
+                location = ".".join(str(part) for part in error["loc"])
+                yield index, None, f"{location}: {error['msg']}"
+
+    def _parse_ndjson(self, source: TextIO):
+        index = 0
+        for line in source:
+            if not line.strip():
+                continue
+            try:
+                yield index, json.loads(line), None
+            except ValueError:
+                yield index, None, "JSON inválido"
+            index += 1
+
+    def _import_chunk(self, chunk, documents_future) -> list[BulkItem]:
+        items = {}
+        pending = []
+        for index, productor, error in chunk:
+            if error:
+                items[index] = BulkItem(index=index, status_code=422, detail=error)
+            else:
+                pending.append((index, productor))
+
+        documents = documents_future.result()
+        # Produtores criados pelo POST /productor podem ter o documento gravado
+        # com ou sem máscara; a consulta procura as duas formas.
+        lookup = {
+            variant
+            for document in documents
+            if document
+            for variant in (document, "".join(filter(str.isdigit, document)))
+        }
+        existing = self.productor_repo.get_existing_cpf_cnpjs(lookup)
+
+        to_create = {}
+        for (index, productor), document in zip(pending, documents):
+            if document is None:
+                items[index] = BulkItem(
+                    index=index, status_code=400, detail="CPF/CNPJ inválido")
+            elif (
+                document in existing
+                or "".join(filter(str.isdigit, document)) in existing
+                or document in to_create
+            ):
+                items[index] = BulkItem(
+                    index=index, status_code=400, detail="CPF/CNPJ já cadastrado")
+            else:
+                to_create[document] = (index, productor)
+
+        created = self.productor_repo.create_productors(
+            [
+                {
+                    "name": productor.name,
+                    "cpf_cnpj": document,
+                    "birthdate": productor.birthdate,
+                }
+                for document, (_, productor) in to_create.items()
+            ]
+        )
+        for document, (index, _) in to_create.items():
+            if document in created:
+                items[index] = BulkItem(
+                    index=index, status_code=201, id=created[document])
+            else:
+                items[index] = BulkItem(
+                    index=index, status_code=400, detail="CPF/CNPJ já cadastrado")
+        return [items[index] for index, _, _ in chunk]
+
     def get_productor_by_id(self, productor_id: int):
         """
         Busca um produtor pelo seu ID.
@@ -81,28 +240,48 @@ class ProductorService:
             HTTPException: Se o produtor não for encontrado.
         """
         logger.info(f"Buscando produtor por ID: {productor_id}")
-        productor = self.productor_repo.get_productor_by_id(productor_id)
+        productor = self.read_repo.get_productor_by_id(productor_id)
         if not productor:
             logger.error(f"Produtor não encontrado: {productor_id}")
             raise HTTPException(status_code=404, detail="Productor not found")
         logger.info(f"Produtor encontrado: {productor_id}")
         return productor
 
-    def list_productors(self, offset: int = 0, limit: int = 100):
+    def get_productor_etag(self, productor_id: int):
+        """
+        Calcula o ETag de um produtor a partir da sua versão, sem carregar a
+        linha completa.
+
+        Args:
+            productor_id (int): ID do produtor.
+
+        Returns:
+            str | None: O ETag do produtor, ou None se ele não existir.
+        """
+        version = self.productor_repo.get_productor_version(productor_id)
+        if version is None:
+            return None
+        return make_etag("productor", productor_id, version)
+
+    def list_productors(
+        self, offset: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ):
         """
         Lista todos os produtores com paginação.
 
         Args:
             offset (int): Número de registros a serem pulados (padrão: 0).
             limit (int): Número máximo de registros a serem retornados (padrão: 100).
+            cursor (str): Cursor da página anterior; quando informado, o offset é ignorado.
 
         Returns:
             list[Productor]: Lista de produtores.
         """
         logger.info(
             f"Listando produtores com offset: {offset} e limite: {limit}")
-        productors = self.productor_repo.list_productors(
-            offset=offset, limit=limit)
+        after = decode_cursor(cursor) if cursor else None
+        productors = self.read_repo.list_productors(
+            offset=offset, limit=limit, after=after)
         logger.info(f"Total de produtores listados: {len(productors)}")
         return productors
 
@@ -118,7 +297,9 @@ class ProductorService:
             Productor: O produtor atualizado.
 
         Raises:
-            HTTPException: Se o CPF/CNPJ for inválido ou o produtor não for encontrado.
+            HTTPException: Se o CPF/CNPJ for inválido, o produtor não for encontrado
+                           ou for alterado por outra requisição durante a
+                           atualização (409).
         """
         logger.info(f"Tentando atualizar produtor: {productor_id}")
         if not self.validate_cpf_cnpj(productor.cpf_cnpj):
@@ -126,9 +307,19 @@ class ProductorService:
                 f"Falha ao atualizar produtor: CPF/CNPJ inválido: {productor.cpf_cnpj}"
             )
             raise HTTPException(status_code=400, detail="CPF/CNPJ inválido")
-        updated_productor = self.productor_repo.update_productor(
-            productor_id, productor
-        )
+        try:
+            updated_productor = self.productor_repo.update_productor(
+                productor_id, productor
+            )
+        except StaleDataError:
+            # A versão mudou entre a leitura e o UPDATE (escrita concorrente)
+            self.db.rollback()
+            logger.error(
+                f"Falha ao atualizar produtor: alterado concorrentemente: {productor_id}"
+            )
+            raise HTTPException(
+                status_code=409, detail="Productor was modified by another request"
+            )
         if not updated_productor:
             logger.error(
                 f"Falha ao atualizar produtor: Produtor não encontrado: {productor_id}"
@@ -151,13 +342,13 @@ class ProductorService:
             HTTPException: Se o produtor não for encontrado ou se houver fazendas relacionadas.
         """
         logger.info(f"Tentando deletar produtor: {productor_id}")
-        productor = self.productor_repo.get_productor_by_id(productor_id)
-        if not productor:
-            logger.error(
-                f"Falha ao deletar produtor: Produtor não encontrado: {productor_id}"
-            )
-            raise HTTPException(status_code=404, detail="Productor not found")
-        if productor.farms:
+        deleted_productor = self.productor_repo.remove_productor(productor_id)
+        if not deleted_productor:
+            if not self.productor_repo.productor_exists(productor_id):
+                logger.error(
+                    f"Falha ao deletar produtor: Produtor não encontrado: {productor_id}"
+                )
+                raise HTTPException(status_code=404, detail="Productor not found")
             logger.error(
                 f"Falha ao deletar produtor: Produtor possui fazendas relacionadas: {productor_id}"
             )
@@ -165,13 +356,6 @@ class ProductorService:
                 status_code=400,
                 detail="Cannot delete productor because it has related records",
             )
-
-        deleted_productor = self.productor_repo.remove_productor(productor_id)
-        if not deleted_productor:
-            logger.error(
-                f"Falha ao deletar produtor: Produtor não encontrado: {productor_id}"
-            )
-            raise HTTPException(status_code=404, detail="Productor not found")
         logger.info(f"Produtor deletado com sucesso: {productor_id}")
         return deleted_productor
 
@@ -1,9 +1,25 @@
+import time
+from contextlib import contextmanager
+from functools import wraps
+
 from sqlalchemy.orm import Session
 
+from app.core.cache import VersionedCache
+from app.core.config import (
+    REPORTS_CACHE_ENABLED,
+    REPORTS_CACHE_MAX_ENTRIES,
+    REPORTS_CACHE_TTL,
+    REPORTS_SOURCE,
+)
 from app.core.logger import logger
+from app.core.metrics import REPORT_CACHE_REQUESTS, REPORT_DURATION
 from app.db.repositories.farm_repository import FarmRepository
 from app.db.repositories.plantation_repository import PlantationRepository
+from app.db.repositories.report_rollup_repository import ReportRollupRepository
+from app.db.session import get_data_version
 from app.schemas.reports import (
+    DASHBOARD_SECTIONS,
+    Dashboard,
     GroundUseStatistics,
     PlantationStatistics,
     StateStatistics,
@@ -11,13 +27,91 @@ from app.schemas.reports import (
     TotalFarms,
 )
 
+reports_cache = VersionedCache(
+    max_entries=REPORTS_CACHE_MAX_ENTRIES,
+    ttl=REPORTS_CACHE_TTL,
+)
+
+
+def report_cache_key(method: str, source: str, target: str, args, kwargs) -> tuple:
+    """Chave do relatório no ``reports_cache`` (serviços síncrono e assíncrono)."""
+    return (method, source, target, args, tuple(sorted(kwargs.items())))
+
+
+def cached_report(method):
+    """
+    Serve o resultado do relatório a partir do ``reports_cache`` enquanto a
+    versão dos dados (lida do banco consultado) não mudar. A chave inclui a
+    origem (live ou rollup) e o banco consultado (primário ou réplica).
+    """
+
+    report = method.__name__.removeprefix("get_")
+
+    def compute(self, args, kwargs):
+        started = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            REPORT_DURATION.labels(report, self.source).observe(
+                time.perf_counter() - started)
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.use_cache:
+            return compute(self, args, kwargs)
+        key = report_cache_key(method.__name__, self.source, self.target, args, kwargs)
+        computed = False
+
+        def compute_once():
+            nonlocal computed
+            computed = True
+            return compute(self, args, kwargs)
+
+        value = reports_cache.get_or_compute(
+            key, compute_once, version=self.data_version())
+        REPORT_CACHE_REQUESTS.labels(report, "miss" if computed else "hit").inc()
+        return value
+
+    return wrapper
+
 
 class ReportsService:
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        source: str = REPORTS_SOURCE,
+        use_cache: bool = REPORTS_CACHE_ENABLED,
+    ):
         self.db = db
-        self.farm_repo = FarmRepository(db)
-        self.plantation_repo = PlantationRepository(db)
+        self.source = source
+        self.use_cache = use_cache
+        # Banco consultado; a réplica pode estar atrasada em relação ao
+        # primário, então cada um tem as próprias entradas no cache
+        self.target = "replica" if db.info.get("replica") else "primary"
+        self.version = None
+        if source == "rollup":
+            # O rollup expõe as mesmas consultas de leitura dos repositórios
+            # de fazendas e culturas, em O(estados) em vez de O(fazendas).
+            rollup_repo = ReportRollupRepository(db)
+            self.farm_repo = rollup_repo
+            self.plantation_repo = rollup_repo
+        else:
+            self.farm_repo = FarmRepository(db)
+            self.plantation_repo = PlantationRepository(db)
+
+    def data_version(self) -> int:
+        """
+        Versão dos dados do banco consultado, lida uma vez por instância
+        (uma requisição) e reaproveitada pelos relatórios seguintes.
 
+        Returns:
+            int: A versão dos dados.
+        """
+        if self.version is None:
+            self.version = get_data_version(self.db)
+        return self.version
+
+    @cached_report
     def get_total_farms(self) -> TotalFarms:
         """
         Calcula o total de fazendas registradas.
@@ -30,6 +124,7 @@ class ReportsService:
         logger.info(f"Total de fazendas calculado: {total_farms}")
         return {"total_farms": total_farms}
 
+    @cached_report
     def get_total_area(self) -> TotalArea:
         """
         Calcula a área total de todas as fazendas registradas.
@@ -40,7 +135,7 @@ class ReportsService:
         logger.info("Calculando a área total das fazendas")
         total_area = self.farm_repo.get_total_area()
         logger.info(f"Área total calculada: {total_area}")
-        return {"total_area": total_area}
+        return {"total_area": float(total_area)}
 
     def get_percent(self, total: float, slice: float) -> float:
         """
@@ -58,8 +153,10 @@ class ReportsService:
             return 0.0
         if slice < 0:
             slice = 0.0
-        return round((slice / total) * 100, 2)
+        # float(): no Postgres, somas de inteiros chegam como Decimal
+        return round((float(slice) / float(total)) * 100, 2)
 
+    @cached_report
     def get_state_statistics(self) -> list[StateStatistics]:
         """
         Calcula estatísticas de fazendas e plantações por estado.
@@ -70,93 +167,50 @@ class ReportsService:
                                   estatísticas de plantações e uso do solo.
         """
         logger.info("Calculando estatísticas por estado")
-        state_statistics = {}
-        total_farms = self.farm_repo.get_total_farms()
-        farms_by_state = self.farm_repo.get_total_farms_by_state()
-        total_plantations = self.farm_repo.get_total_plantations()
-
-        total_area_by_state = self.farm_repo.get_total_area_by_state()
-        vegetation_area_by_state = self.farm_repo.get_vegetation_area_by_state()
-        arable_area_by_state = self.farm_repo.get_arable_area_by_state()
-        plantations_by_state = self.farm_repo.get_plantations_by_state()
-
-        for state, state_amount in farms_by_state:
-            state_total_area = [x[1]
-                                for x in total_area_by_state if x[0] == state][0]
-            state_vegetation_area = [
-                x[1] for x in vegetation_area_by_state if x[0] == state
-            ][0]
-            state_arable_area = [x[1]
-                                 for x in arable_area_by_state if x[0] == state][0]
-            state_plantations_total = [
-                state_plantations_total
-                for st, state_plantations_total in plantations_by_state
-                if st == state
-            ][0]
-            state_statistics[state] = {
-                "state": state,
-                "farms_total": state_amount,
-                "farms_percent": self.get_percent(total_farms, state_amount),
-                "plantation_statistics": {
-                    "state_total": state_plantations_total,
-                    "percent": self.get_percent(
-                        total_plantations, state_plantations_total
-                    ),
-                },
-                "ground_use_statistics": {
-                    "total_area": state_total_area or 0,
-                    "vegetation_area_total": state_vegetation_area or 0,
-                    "vegetation_area_percent": self.get_percent(
-                        state_total_area, state_vegetation_area
-                    ),
-                    "arable_area_total": state_arable_area or 0,
-                    "arable_area_percent": self.get_percent(
-                        state_total_area, state_arable_area
-                    ),
-                },
-            }
+        state_statistics = self._build_state_statistics(
+            self.farm_repo.get_global_aggregates(),
+            self.farm_repo.get_state_aggregates(),
+        )
 
         logger.info("Estatísticas por estado calculadas com sucesso")
-        return list(state_statistics.values())
+        return state_statistics
 
-    def get_plantation_statistics(self) -> list[PlantationStatistics]:
+    @cached_report
+    def get_plantation_statistics(
+        self,
+        season_from: int = None,
+        season_to: int = None,
+        year_from: int = None,
+        year_to: int = None,
+    ) -> list[PlantationStatistics]:
         """
         Calcula estatísticas de plantações por safra.
 
+        Args:
+            season_from (int): ID da primeira safra considerada (opcional).
+            season_to (int): ID da última safra considerada (opcional).
+            year_from (int): Ano inicial das safras consideradas (opcional).
+            year_to (int): Ano final das safras consideradas (opcional).
+
         Returns:
             list[PlantationStatistics]: Uma lista de dicionários contendo estatísticas de plantações
                                        por safra, incluindo o total de plantações e a porcentagem
                                        em relação ao total de plantações da safra.
         """
         logger.info("Calculando estatísticas de plantações")
-        plantations_stats = self.plantation_repo.get_plantations_statistics()
-        seasons_plantations_total = (
-            self.plantation_repo.get_plantations_total_by_season()
-        )
-        output = {}
-        for season_id, plantation_id, total_plantations in plantations_stats:
-            if season_id not in output:
-                season_plantations_total = [
-                    t[1] for t in seasons_plantations_total if t[0] == season_id
-                ][0]
-                output[season_id] = {
-                    "season_id": season_id,
-                    "season_plantations_total": season_plantations_total,
-                    "statistics": [],
-                }
-            output[season_id]["statistics"].append(
-                {
-                    "plantation_id": plantation_id,
-                    "total_plantations": total_plantations,
-                    "percent": self.get_percent(
-                        season_plantations_total, total_plantations
-                    ),
-                }
+        plantation_statistics = self._build_plantation_statistics(
+            self.plantation_repo.get_plantations_statistics(
+                season_from=season_from,
+                season_to=season_to,
+                year_from=year_from,
+                year_to=year_to,
             )
+        )
 
         logger.info("Estatísticas de plantações calculadas com sucesso")
-        return list(output.values())
+        return plantation_statistics
 
+    @cached_report
     def get_ground_use_statistics(self) -> GroundUseStatistics:
         """
         Calcula estatísticas de uso do solo, incluindo áreas de vegetação e cultivável.
@@ -170,13 +224,161 @@ class ReportsService:
         vegetation_area = self.farm_repo.get_total_vegetation_area()
         arable_area = self.farm_repo.get_total_arable_area()
 
-        ground_use_stats = {
-            "vegetation_area_percent": self.get_percent(total_area, vegetation_area),
-            "vegetation_area_total": vegetation_area,
-            "arable_area_percent": self.get_percent(total_area, arable_area),
-            "arable_area_total": arable_area,
-            "total_area": total_area,
-        }
+        ground_use_stats = self._build_ground_use_statistics(
+            total_area, vegetation_area, arable_area
+        )
 
         logger.info("Estatísticas de uso do solo calculadas com sucesso")
         return ground_use_stats
+
+    @cached_report
+    def get_dashboard(self, sections: tuple = DASHBOARD_SECTIONS) -> Dashboard:
+        """
+        Calcula os relatórios do painel a partir de um único snapshot do banco,
+        reaproveitando os agregados compartilhados entre as seções.
+
+        Args:
+            sections (tuple): Seções a incluir (padrão: todas).
+
+        Returns:
+            Dashboard: Um dicionário com uma chave por seção solicitada.
+        """
+        logger.info(f"Calculando painel: {', '.join(sections)}")
+        with self._snapshot() as reports_service:
+            dashboard = reports_service._build_dashboard(sections)
+        logger.info("Painel calculado com sucesso")
+        return dashboard
+
+    @contextmanager
+    def _snapshot(self):
+        """
+        No Postgres, executa as consultas do painel em uma transação
+        REPEATABLE READ, para que todas as seções enxerguem o mesmo snapshot.
+        O isolamento de uma transação já iniciada (ex.: pela leitura da
+        versão dos dados) não pode mais mudar; nesse caso o painel usa uma
+        sessão própria, em outra conexão.
+        """
+        bind = self.db.get_bind()
+        if bind.dialect.name != "postgresql":
+            yield self
+            return
+        if not self.db.in_transaction():
+            self.db.connection(
+                execution_options={"isolation_level": "REPEATABLE READ"})
+            yield self
+            return
+        snapshot_engine = bind.engine.execution_options(
+            isolation_level="REPEATABLE READ")
+        with Session(snapshot_engine) as snapshot:
+            yield ReportsService(snapshot, source=self.source, use_cache=False)
+
+    def _build_dashboard(self, sections: tuple) -> Dashboard:
+        dashboard = {}
+
+        if set(sections) - {"plantation_statistics"}:
+            # Total de fazendas, áreas e uso do solo saem da mesma linha de
+            # totais usada nos percentuais por estado
+            totals = self.farm_repo.get_global_aggregates()
+            if "total_farms" in sections:
+                dashboard["total_farms"] = {"total_farms": totals.farms_total}
+            if "total_area" in sections:
+                dashboard["total_area"] = {"total_area": float(totals.total_area)}
+            if "ground_use_statistics" in sections:
+                dashboard["ground_use_statistics"] = self._build_ground_use_statistics(
+                    totals.total_area, totals.vegetation_area, totals.arable_area
+                )
+            if "state_statistics" in sections:
+                dashboard["state_statistics"] = self._build_state_statistics(
+                    totals, self.farm_repo.get_state_aggregates()
+                )
+
+        if "plantation_statistics" in sections:
+            dashboard["plantation_statistics"] = self._build_plantation_statistics(
+                self.plantation_repo.get_plantations_statistics()
+            )
+
+        # Seções na ordem dos campos de Dashboard
+        return {
+            section: dashboard[section]
+            for section in DASHBOARD_SECTIONS
+            if section in dashboard
+        }
+
+    def _build_state_statistics(
+        self, totals, state_aggregates: dict
+    ) -> list[StateStatistics]:
+        """
+        Monta as estatísticas por estado a partir dos agregados por estado e
+        da linha de totais globais.
+
+        Os relatórios são serializados sem nova validação (trusted_response),
+        então os valores já saem com os tipos e a ordem dos campos do schema.
+        """
+        state_statistics = []
+        for state, aggregates in state_aggregates.items():
+            state_total_area = aggregates.total_area
+            state_vegetation_area = aggregates.vegetation_area
+            state_arable_area = aggregates.arable_area
+            state_statistics.append(
+                {
+                    "state": state,
+                    "farms_total": aggregates.farms_total,
+                    "farms_percent": self.get_percent(
+                        totals.farms_total, aggregates.farms_total
+                    ),
+                    "plantation_statistics": {
+                        "percent": self.get_percent(
+                            totals.plantations_total, aggregates.plantations_total
+                        ),
+                        "state_total": aggregates.plantations_total,
+                    },
+                    "ground_use_statistics": {
+                        "vegetation_area_percent": self.get_percent(
+                            state_total_area, state_vegetation_area
+                        ),
+                        "vegetation_area_total": float(state_vegetation_area or 0),
+                        "arable_area_percent": self.get_percent(
+                            state_total_area, state_arable_area
+                        ),
+                        "arable_area_total": float(state_arable_area or 0),
+                        "total_area": float(state_total_area or 0),
+                    },
+                }
+            )
+        return state_statistics
+
+    def _build_plantation_statistics(self, rows) -> list[PlantationStatistics]:
+        """
+        Agrupa as contagens de culturas por safra, com a porcentagem de cada
+        cultura no total da safra. As linhas chegam ordenadas por safra e já
+        trazem o total da safra, então basta uma passada.
+        """
+        output = []
+        season = None
+        for season_id, plantation_id, total_plantations, season_total in rows:
+            if season is None or season["season_id"] != season_id:
+                season = {
+                    "season_id": season_id,
+                    "season_plantations_total": int(season_total),
+                    "statistics": [],
+                }
+                output.append(season)
+            season["statistics"].append(
+                {
+                    "plantation_id": plantation_id,
+                    "total_plantations": int(total_plantations),
+                    "percent": self.get_percent(season_total, total_plantations),
+                }
+            )
+        return output
+
+    def _build_ground_use_statistics(
+        self, total_area: float, vegetation_area: float, arable_area: float
+    ) -> GroundUseStatistics:
+        return {
+            "vegetation_area_percent": self.get_percent(total_area, vegetation_area),
+            "vegetation_area_total": float(vegetation_area),
+            "arable_area_percent": self.get_percent(total_area, arable_area),
+            "arable_area_total": float(arable_area),
+            "total_area": float(total_area),
+        }
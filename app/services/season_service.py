@@ -1,15 +1,22 @@
+from typing import Optional
+
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
+from app.core.config import CORE_READ_PATH
 from app.core.logger import logger
+from app.db.repositories.core_read_repository import CoreReadRepository
 from app.db.repositories.season_repository import SeasonRepository
 from app.schemas.season import SeasonCreate
+from app.utils.pagination import decode_cursor
 
 
 class SeasonService:
     def __init__(self, db: Session):
         self.db = db
         self.season_repo = SeasonRepository(db)
+        # Listagens e buscas por ID em Core, sem montar objetos do ORM
+        self.read_repo = CoreReadRepository(db) if CORE_READ_PATH else self.season_repo
 
     def create_season(self, season: SeasonCreate):
         """
@@ -40,25 +47,30 @@ class SeasonService:
             HTTPException: Se a safra não for encontrada.
         """
         logger.info(f"Buscando safra por ID: {season_id}")
-        season = self.season_repo.get_season_by_id(season_id)
+        season = self.read_repo.get_season_by_id(season_id)
         if not season:
             logger.error(f"Safra não encontrada: ID {season_id}")
             raise HTTPException(status_code=404, detail="Safra não encontrada")
         return season
 
-    def list_seasons(self, offset: int = 0, limit: int = 100):
+    def list_seasons(
+        self, offset: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ):
         """
         Lista todas as safras com paginação.
 
         Args:
             offset (int): Número de registros a serem pulados (padrão: 0).
             limit (int): Número máximo de registros a serem retornados (padrão: 100).
+            cursor (str): Cursor da página anterior; quando informado, o offset é ignorado.
 
         Returns:
             list[Season]: Lista de safras.
         """
         logger.info("Listando todas as safras")
-        return self.season_repo.list_seasons(offset=offset, limit=limit)
+        after = decode_cursor(cursor) if cursor else None
+        return self.read_repo.list_seasons(
+            offset=offset, limit=limit, after=after)
 
     def update_season(self, season_id: int, season: SeasonCreate):
         """
@@ -96,11 +108,11 @@ class SeasonService:
             HTTPException: Se a safra não for encontrada ou se houver registros relacionados.
         """
         logger.info(f"Removendo safra ID: {season_id}")
-        season = self.season_repo.get_season_by_id(season_id)
-        if not season:
-            logger.error(f"Safra não encontrada: ID {season_id}")
-            raise HTTPException(status_code=404, detail="Safra não encontrada")
-        if season.farm_plantations:
+        deleted_season = self.season_repo.remove_season(season_id)
+        if not deleted_season:
+            if not self.season_repo.season_exists(season_id):
+                logger.error(f"Safra não encontrada: ID {season_id}")
+                raise HTTPException(status_code=404, detail="Safra não encontrada")
             logger.error(
                 "Não é possível deletar a safra porque há registros relacionados"
             )
@@ -108,13 +120,6 @@ class SeasonService:
                 status_code=400,
                 detail="Não é possível deletar a safra porque há registros relacionados",
             )
-
-        deleted_season = self.season_repo.remove_season(season_id)
-        if not deleted_season:
-            logger.error(f"Falha ao deletar a safra: ID {season_id}")
-            raise HTTPException(
-                status_code=400,
-                detail="Falha ao deletar a safra")
         logger.info("Safra removida com sucesso")
         return deleted_season
 
@@ -132,7 +137,7 @@ class SeasonService:
             HTTPException: Se a safra não for encontrada.
         """
         logger.info(f"Buscando culturas da safra ID: {season_id}")
-        season = self.season_repo.get_season_by_id(season_id)
+        season = self.season_repo.get_season_with_plantations(season_id)
         if not season:
             logger.error(f"Safra não encontrada: ID {season_id}")
             raise HTTPException(status_code=404, detail="Safra não encontrada")
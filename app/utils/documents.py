@@ -0,0 +1,60 @@
+import multiprocessing
+import re
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional
+
+from validate_docbr import CNPJ, CPF
+
+_cpf = CPF()
+_cnpj = CNPJ()
+_non_digits = re.compile(r"\D")
+
+# Abaixo deste número de documentos o custo de enviar o lote a outro processo
+# supera o da validação em si
+POOL_MIN_DOCUMENTS = 256
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def normalize_cpf_cnpj(value: str) -> Optional[str]:
+    """
+    Remove a máscara do documento, valida-o como CPF (11 dígitos) ou CNPJ
+    (14 dígitos) e o devolve com a máscara padrão.
+
+    Returns:
+        str | None: O documento formatado, ou None se for inválido.
+    """
+    digits = _non_digits.sub("", value or "")
+    if len(digits) == 11 and _cpf.validate(digits):
+        return _cpf.mask(digits)
+    if len(digits) == 14 and _cnpj.validate(digits):
+        return _cnpj.mask(digits)
+    return None
+
+
+def normalize_cpf_cnpjs(values: list[str]) -> list[Optional[str]]:
+    return [normalize_cpf_cnpj(value) for value in values]
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # "spawn" evita herdar, via fork, as threads e conexões do servidor
+        _pool = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pool
+
+
+def submit_normalize_cpf_cnpjs(values: list[str], workers: int) -> Future:
+    """
+    Agenda a normalização de um lote de documentos no pool de ``workers``
+    processos e devolve o Future com o resultado, permitindo validar os
+    próximos lotes enquanto o atual é gravado. Lotes pequenos (ou
+    ``workers`` <= 1) são validados no próprio processo.
+    """
+    if workers <= 1 or len(values) < POOL_MIN_DOCUMENTS:
+        future = Future()
+        future.set_result(normalize_cpf_cnpjs(values))
+        return future
+    return _get_pool(workers).submit(normalize_cpf_cnpjs, values)
@@ -0,0 +1,25 @@
+from typing import Optional
+
+from fastapi import HTTPException
+
+
+def make_etag(*parts) -> str:
+    """Monta um ETag forte a partir das partes informadas."""
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Compara o cabeçalho If-None-Match com o ETag atual (comparação fraca)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return etag in [tag[2:] if tag.startswith("W/") else tag for tag in candidates]
+
+
+def raise_if_not_modified(if_none_match: Optional[str], etag: str):
+    """Interrompe a requisição com 304 quando o cliente já tem o ETag atual."""
+    if etag_matches(if_none_match, etag):
+        raise HTTPException(status_code=304, headers={"ETag": etag})
+
@@ -0,0 +1,32 @@
+import csv
+import io
+import json
+from typing import Iterable, Iterator
+
+
+def ndjson_chunks(rows: Iterable, batch_size: int = 1000) -> Iterator[str]:
+    """Serializa as linhas como NDJSON, um bloco de texto a cada lote."""
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(dict(row._mapping), default=str))
+        if len(lines) >= batch_size:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def csv_chunks(
+    columns: list[str], rows: Iterable, batch_size: int = 1000
+) -> Iterator[str]:
+    """Serializa as linhas como CSV (com cabeçalho), um bloco a cada lote."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if count % batch_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
@@ -0,0 +1,83 @@
+import base64
+import binascii
+import json
+
+from fastapi import HTTPException, Response
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Documenta no OpenAPI o cabeçalho com o cursor da próxima página
+NEXT_CURSOR_RESPONSES = {
+    200: {
+        "headers": {
+            NEXT_CURSOR_HEADER: {
+                "description": "Cursor da próxima página, enviado quando a "
+                "página veio cheia; reenvie-o em ?cursor=.",
+                "schema": {"type": "string"},
+            }
+        }
+    }
+}
+
+
+def encode_cursor(*values) -> str:
+    """Codifica a chave da última linha da página em um cursor opaco."""
+    payload = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def _matches_type(value, expected: type) -> bool:
+    if isinstance(value, bool):
+        return False
+    if expected is float:
+        return isinstance(value, (int, float))
+    return isinstance(value, expected)
+
+
+def decode_cursor(cursor: str, key_types: tuple = ()) -> tuple:
+    """
+    Decodifica um cursor gerado por ``encode_cursor``. O último valor da
+    chave é sempre o ``id`` da linha, usado como desempate.
+
+    Args:
+        cursor (str): Cursor recebido do cliente.
+        key_types (tuple): Tipos esperados dos valores antes do ``id`` (ex.:
+                           ``(float,)`` para a ordenação por área).
+
+    Raises:
+        HTTPException: Se o cursor for inválido.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Cursor inválido")
+    if (
+        not isinstance(values, list)
+        or len(values) != len(key_types) + 1
+        or type(values[-1]) is not int
+        or not all(map(_matches_type, values, key_types))
+    ):
+        raise HTTPException(status_code=400, detail="Cursor inválido")
+    return tuple(values)
+
+
+def set_next_cursor(
+    response: Response, items: list, limit: int, sort_field: str = None
+):
+    """
+    Publica o cursor da próxima página no cabeçalho ``X-Next-Cursor`` quando
+    a página veio cheia. O corpo das listagens não muda, mantendo a
+    compatibilidade com clientes que usam ``offset``.
+
+    Args:
+        response (Response): Resposta do endpoint.
+        items (list): Itens da página atual.
+        limit (int): Tamanho da página solicitado.
+        sort_field (str): Campo de ordenação além do ``id``, quando houver.
+    """
+    if limit <= 0 or len(items) < limit:
+        return
+    last = items[-1]
+    values = (getattr(last, sort_field), last.id) if sort_field else (last.id,)
+    response.headers[NEXT_CURSOR_HEADER] = encode_cursor(*values)
@@ -0,0 +1,114 @@
+import datetime
+import types
+from decimal import Decimal
+from functools import cache
+from operator import attrgetter
+from typing import Any, Optional, Union, get_args, get_origin
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+from app.core.config import FAST_JSON_RESPONSES
+
+# Tipos que o orjson serializa exatamente como o pydantic, permitindo copiar
+# o valor da coluna para o JSON sem validação
+TRUSTED_FIELD_TYPES = (str, int, float, bool, datetime.date, datetime.datetime)
+
+
+def _default(value):
+    # No Postgres, sum() de contagens volta como numeric (Decimal)
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(f"Tipo não serializável em JSON: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default)
+
+
+@cache
+def type_adapter(schema) -> TypeAdapter:
+    """TypeAdapter compilado uma única vez por tipo."""
+    return TypeAdapter(schema)
+
+
+def _is_trusted(annotation) -> bool:
+    if get_origin(annotation) in (Union, types.UnionType):
+        return all(
+            arg is type(None) or _is_trusted(arg) for arg in get_args(annotation)
+        )
+    return isinstance(annotation, type) and issubclass(annotation, TRUSTED_FIELD_TYPES)
+
+
+class RowEncoder:
+    """
+    Serializa objetos do ORM ou linhas com os campos de um schema.
+
+    Para schemas planos (só str, int, float, bool e datas) os valores são
+    lidos com um ``attrgetter`` pré-compilado e codificados com orjson, sem
+    validação: vêm de colunas já tipadas pelo banco. Os demais schemas são
+    validados com um TypeAdapter pré-compilado e serializados pelo pydantic.
+    """
+
+    def __init__(self, schema: type[BaseModel]):
+        self.fields = tuple(schema.model_fields)
+        self.trusted = all(
+            _is_trusted(field.annotation) for field in schema.model_fields.values()
+        )
+        self._getter = attrgetter(*self.fields)
+        self._adapter = type_adapter(list[schema])
+
+    def to_dicts(self, rows) -> list[dict]:
+        fields, getter = self.fields, self._getter
+        if len(fields) == 1:
+            return [{fields[0]: getter(row)} for row in rows]
+        return [dict(zip(fields, getter(row))) for row in rows]
+
+    def encode(self, rows) -> bytes:
+        if self.trusted:
+            return dumps(self.to_dicts(rows))
+        adapter = self._adapter
+        return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+
+@cache
+def row_encoder(schema: type[BaseModel]) -> RowEncoder:
+    return RowEncoder(schema)
+
+
+def _build_response(body: bytes, response: Optional[Response]) -> Response:
+    fast = Response(content=body, media_type="application/json")
+    if response is not None:
+        # Cabeçalhos definidos no Response injetado (X-Next-Cursor, ETag)
+        fast.raw_headers.extend(
+            (name, value)
+            for name, value in response.raw_headers
+            if name not in (b"content-length", b"content-type")
+        )
+        if response.status_code:
+            fast.status_code = response.status_code
+    return fast
+
+
+def rows_response(schema: type[BaseModel], rows, response: Response = None):
+    """
+    Resposta JSON de uma listagem de objetos do ORM ou linhas (``Row``) no
+    formato de ``schema``.
+
+    Com FAST_JSON_RESPONSES desligado, devolve ``rows`` para que o FastAPI
+    valide e serialize pelo ``response_model``, como antes.
+    """
+    if not FAST_JSON_RESPONSES:
+        return rows
+    return _build_response(row_encoder(schema).encode(rows), response)
+
+
+def trusted_response(content: Any, response: Response = None):
+    """
+    Resposta JSON de dicionários montados pelos serviços já no formato do
+    schema de resposta (ex.: relatórios), sem validá-los de novo.
+    """
+    if not FAST_JSON_RESPONSES:
+        return content
+    return _build_response(dumps(content), response)
@@ -0,0 +1,19 @@
+import io
+import tempfile
+
+from fastapi import Request
+
+# Corpos maiores que isto são gravados em disco em vez de ficarem em memória
+SPOOL_MAX_MEMORY = 1024 * 1024
+
+
+async def spool_request_body(request: Request) -> io.TextIOWrapper:
+    """
+    Copia o corpo da requisição, à medida que chega, para um arquivo
+    temporário e o devolve pronto para ser lido como texto linha a linha.
+    """
+    spooled = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+    async for chunk in request.stream():
+        spooled.write(chunk)
+    spooled.seek(0)
+    return io.TextIOWrapper(spooled, encoding="utf-8-sig", newline="")
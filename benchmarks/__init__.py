@@ -0,0 +1,5 @@
+import os
+
+# ``app.db.session`` cria a engine na importação; os benchmarks usam a
+# própria engine, então qualquer URL válida serve aqui.
+os.environ.setdefault("DATABASE_URL", "sqlite://")
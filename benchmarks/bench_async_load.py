@@ -0,0 +1,139 @@
+"""
+Compara a latência (p50/p99) e a vazão das pilhas síncrona e assíncrona sob
+alta concorrência, com requisições de leitura de produtores ou, com
+``--mix farm``, de fazendas e relatórios.
+
+Em processo (ASGI, sem servidor HTTP), contra um SQLite em arquivo ou o
+banco de ``BENCH_DATABASE_URL``:
+
+    python -m benchmarks.bench_async_load --concurrency 200 --requests 5000
+    python -m benchmarks.bench_async_load --mix farm
+
+Contra servidores já em execução (ex.: uvicorn com DATABASE_ASYNC=false e
+outro com DATABASE_ASYNC=true), que é a medição representativa com Postgres:
+
+    python -m benchmarks.bench_async_load --url http://localhost:8000 --url http://localhost:8001
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from app.api.routers import build_router
+from app.db.async_session import get_async_db, to_async_url
+from app.db.session import get_db
+from benchmarks.common import BENCH_DATABASE_URL, create_bench_engine, seed
+
+
+def build_app(sync_engine, async_session_factory, async_database: bool) -> FastAPI:
+    def override_get_db():
+        with Session(sync_engine) as session:
+            yield session
+
+    async def override_get_async_db():
+        async with async_session_factory() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(build_router(async_database), prefix="/api/v1")
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    return app
+
+
+def load_paths(mix: str, farms: int, requests: int) -> list[str]:
+    """Caminhos das ``requests`` leituras do cenário escolhido."""
+    rng = random.Random(42)
+    if mix == "farm":
+        # Relatórios sem cache, para que cada requisição consulte o banco
+        templates = [
+            lambda: f"/api/v1/farm/{rng.randint(1, farms)}",
+            lambda: "/api/v1/farm/?limit=20&state=SP&sort_by=total_area",
+            lambda: "/api/v1/reports/state-statistics?use_cache=false",
+        ]
+    else:
+        productors = max(1, farms // 10)
+        templates = [
+            lambda: "/api/v1/productor/?limit=20",
+            lambda: f"/api/v1/productor/{rng.randint(1, productors)}",
+        ]
+    return [templates[i % len(templates)]() for i in range(requests)]
+
+
+async def run_load(client: httpx.AsyncClient, paths: list[str], concurrency: int):
+    """Dispara as leituras de ``paths`` com ``concurrency`` clientes simultâneos."""
+    latencies = []
+    queue = iter(paths)
+
+    async def worker():
+        for path in queue:
+            started = time.perf_counter()
+            response = await client.get(path)
+            latencies.append((time.perf_counter() - started) * 1000)
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return latencies, elapsed
+
+
+def report(name: str, latencies: list[float], elapsed: float):
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{name:<12} p50 {percentiles[49]:8.2f} ms   p99 {percentiles[98]:8.2f} ms"
+        f"   {len(latencies) / elapsed:8.0f} req/s"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--farms", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--url", action="append", default=[])
+    parser.add_argument("--mix", choices=["productor", "farm"], default="productor")
+    args = parser.parse_args()
+    paths = load_paths(args.mix, args.farms, args.requests)
+
+    if args.url:
+        for url in args.url:
+            async with httpx.AsyncClient(base_url=url, timeout=60) as client:
+                latencies, elapsed = await run_load(client, paths, args.concurrency)
+            report(url, latencies, elapsed)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = BENCH_DATABASE_URL
+        if url == "sqlite://":
+            # O driver assíncrono abre conexões próprias: o banco precisa
+            # estar em arquivo para ser compartilhado entre as pilhas.
+            url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        sync_engine = create_bench_engine(url)
+        seed(sync_engine, args.farms)
+        async_engine = create_async_engine(to_async_url(url))
+        async_session_factory = async_sessionmaker(
+            bind=async_engine, expire_on_commit=False)
+
+        for name, async_database in (("síncrona", False), ("assíncrona", True)):
+            app = build_app(sync_engine, async_session_factory, async_database)
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://bench", timeout=60
+            ) as client:
+                latencies, elapsed = await run_load(client, paths, args.concurrency)
+            report(name, latencies, elapsed)
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
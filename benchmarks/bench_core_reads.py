@@ -0,0 +1,144 @@
+"""
+Compara as listagens e buscas por ID pelos repositórios do ORM com o caminho
+de leitura em Core (``CoreReadRepository``): latência e memória alocada.
+
+    python -m benchmarks.bench_core_reads --farms 20000
+
+A primeira parte mede a leitura no repositório seguida da serialização da
+resposta (RowEncoder), com uma sessão nova por chamada, como em uma
+requisição; a alocação é o pico medido pelo tracemalloc em uma chamada. A
+segunda mede a requisição completa, com CORE_READ_PATH ligado e desligado.
+"""
+
+import argparse
+import tracemalloc
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+import app.services.farm_service as farm_service
+import app.services.plantation_service as plantation_service
+import app.services.productor_service as productor_service
+import app.services.season_service as season_service
+from app.db.repositories.core_read_repository import CoreReadRepository
+from app.db.repositories.farm_repository import FarmRepository
+from app.db.repositories.plantation_repository import PlantationRepository
+from app.db.repositories.productor_repository import ProductorRepository
+from app.db.repositories.season_repository import SeasonRepository
+from app.db.session import get_db
+from app.schemas.farm import Farm, FarmFilters, FarmSortField, SortOrder
+from app.schemas.plantation import Plantation
+from app.schemas.productor import Productor
+from app.schemas.season import Season
+from app.utils.serialization import row_encoder
+from benchmarks.common import create_bench_engine, measure, report, seed
+from main import app
+
+SERVICES = (farm_service, productor_service, plantation_service, season_service)
+
+ENDPOINTS = [
+    "/api/v1/farm/?limit=100",
+    "/api/v1/farm/?limit=100&state=SP&sort_by=total_area&order=desc",
+    "/api/v1/farm/1",
+    "/api/v1/productor/?limit=100",
+    "/api/v1/productor/1",
+    "/api/v1/plantation/?limit=100",
+    "/api/v1/season/?limit=100",
+]
+
+
+def cases():
+    """(nome, schema, método, argumentos) de cada leitura comparada."""
+    return [
+        ("list_farms limit=100", Farm, "list_farms", {"limit": 100}),
+        ("list_farms SP total_area desc", Farm, "list_farms", {
+            "limit": 100,
+            "filters": FarmFilters(state="SP"),
+            "sort_by": FarmSortField.total_area,
+            "order": SortOrder.desc,
+        }),
+        ("list_productors limit=100", Productor, "list_productors", {"limit": 100}),
+        ("list_plantations", Plantation, "list_plantations", {"limit": 100}),
+        ("list_seasons", Season, "list_seasons", {"limit": 100}),
+        ("get_farm_by_id", Farm, "get_farm_by_id", {"farm_id": 1}),
+        ("get_productor_by_id", Productor, "get_productor_by_id", {"productor_id": 1}),
+    ]
+
+
+ORM_REPOSITORIES = {
+    Farm: FarmRepository,
+    Productor: ProductorRepository,
+    Plantation: PlantationRepository,
+    Season: SeasonRepository,
+}
+
+
+def read_and_encode(engine, repository_class, schema, method, kwargs):
+    encoder = row_encoder(schema)
+
+    def run():
+        with Session(engine) as session:
+            result = getattr(repository_class(session), method)(**kwargs)
+            encoder.encode(result if isinstance(result, list) else [result])
+
+    return run
+
+
+def peak_allocation_kib(fn) -> float:
+    fn()
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def repositories(engine, repeat: int):
+    for name, schema, method, kwargs in cases():
+        print(f"\n{name}")
+        for label, repository_class in (
+            ("ORM", ORM_REPOSITORIES[schema]),
+            ("Core", CoreReadRepository),
+        ):
+            fn = read_and_encode(engine, repository_class, schema, method, kwargs)
+            fn()
+            report(f"  {label}", *measure(fn, repeat))
+            print(f"  {'':<38} pico alocado {peak_allocation_kib(fn):9.1f} KiB")
+
+
+def requests(client: TestClient, repeat: int):
+    for core in (False, True):
+        for module in SERVICES:
+            module.CORE_READ_PATH = core
+        print(f"\nCORE_READ_PATH={str(core).lower()}")
+        for path in ENDPOINTS:
+            client.get(path).raise_for_status()
+            report(f"  {path}", *measure(
+                lambda: client.get(path).raise_for_status(), repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--farms", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = create_bench_engine()
+    seed(engine, farms=args.farms)
+    print(f"{args.farms} fazendas")
+
+    print("\n== repositório + serialização ==")
+    repositories(engine, args.repeat)
+
+    def override_get_db():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    print("\n== requisição completa ==")
+    requests(TestClient(app), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Compara as cinco chamadas de relatório feitas pelo front end com uma única
+chamada a ``/reports/dashboard`` (sem cache, para medir o cálculo).
+
+    python -m benchmarks.bench_dashboard --farms 200000
+"""
+
+import argparse
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.db.session import get_db
+from benchmarks.common import (
+    count_statements,
+    create_bench_engine,
+    measure,
+    report,
+    seed,
+)
+from main import app
+
+REPORT_ENDPOINTS = [
+    "total-farms",
+    "total-area",
+    "state-statistics",
+    "plantation-statistics",
+    "ground-use-statistics",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--farms", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_bench_engine()
+    seed(engine, farms=args.farms)
+    print(f"{args.farms} fazendas")
+
+    def override_get_db():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    client = TestClient(app)
+    params = {"use_cache": False}
+
+    def five_calls():
+        for endpoint in REPORT_ENDPOINTS:
+            client.get(f"/api/v1/reports/{endpoint}", params=params).raise_for_status()
+
+    def dashboard():
+        client.get("/api/v1/reports/dashboard", params=params).raise_for_status()
+
+    with count_statements(engine) as statements:
+        five_calls()
+    report("5 endpoints", *measure(five_calls, args.repeat), queries=len(statements))
+
+    with count_statements(engine) as statements:
+        dashboard()
+    report("/reports/dashboard", *measure(dashboard, args.repeat),
+           queries=len(statements))
+
+
+if __name__ == "__main__":
+    main()
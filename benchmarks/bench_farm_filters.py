@@ -0,0 +1,117 @@
+"""
+Mostra o plano de execução e a latência dos filtros de ``GET /farm/`` com e
+sem os índices das migrações ``c5f83a1d9e02`` e ``b8e21f6d4a97``.
+
+    python -m benchmarks.bench_farm_filters --farms 1000000
+    BENCH_DATABASE_URL=postgresql://... python -m benchmarks.bench_farm_filters
+"""
+
+import argparse
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.db.models.farm import Farm
+from app.db.repositories.farm_repository import FarmRepository
+from app.schemas.farm import FarmFilters, FarmSortField, SortOrder
+from benchmarks.common import create_bench_engine, measure, report, seed
+
+SCENARIOS = {
+    "state": dict(filters=FarmFilters(state="SP")),
+    "state + city": dict(filters=FarmFilters(state="SP", city="Cidade 7")),
+    "city": dict(filters=FarmFilters(city="Cidade 7")),
+    "productor_id": dict(filters=FarmFilters(productor_id=123)),
+    "faixa de total_area": dict(
+        filters=FarmFilters(min_total_area=500, max_total_area=510)),
+    "ordenação total_area desc": dict(
+        sort_by=FarmSortField.total_area, order=SortOrder.desc),
+    "cursor total_area (página profunda)": dict(
+        sort_by=FarmSortField.total_area, after=(900.0, 0)),
+    "ordenação name": dict(sort_by=FarmSortField.name),
+    "cursor city (página profunda)": dict(
+        sort_by=FarmSortField.city, after=("Cidade 150", 0)),
+}
+
+FARM_LIST_INDEXES = {
+    "ix_farms_state_city",
+    "ix_farms_name",
+    "ix_farms_state",
+    "ix_farms_city_id",
+    "ix_farms_productor_id",
+    "ix_farms_total_area",
+    "ix_farms_arable_area",
+    "ix_farms_vegetation_area",
+}
+
+
+@contextmanager
+def capture_statement(engine):
+    """Guarda o último comando SQL (e parâmetros) enviado ao banco."""
+    captured = {}
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        captured["statement"] = statement
+        captured["parameters"] = parameters
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield captured
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def explain(engine, statement, parameters, label: str) -> str:
+    """Resume o plano de execução de um comando."""
+    with engine.connect() as connection:
+        if engine.dialect.name == "sqlite":
+            # O cache de statements do sqlite3 devolveria o plano anterior ao
+            # DROP INDEX; o comentário torna o texto único em cada fase.
+            rows = connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN /* {label} */ " + statement, parameters).all()
+            return "; ".join(row[-1] for row in rows)
+        rows = connection.exec_driver_sql(
+            "EXPLAIN " + statement, parameters).all()
+        return "; ".join(row[0].strip() for row in rows[:3])
+
+
+def run(engine, repeat: int, label: str):
+    with Session(engine) as session:
+        repo = FarmRepository(session)
+        for name, kwargs in SCENARIOS.items():
+            def list_farms():
+                return repo.list_farms(limit=100, **kwargs)
+
+            with capture_statement(engine) as captured:
+                list_farms()
+            report(name, *measure(list_farms, repeat))
+            plan = explain(
+                engine, captured["statement"], captured["parameters"], label)
+            print(f"    plano: {plan}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--farms", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_bench_engine()
+    seed(engine, farms=args.farms, crops_per_farm=0)
+    with engine.begin() as connection:
+        connection.exec_driver_sql("ANALYZE")
+    print(f"{args.farms} fazendas")
+
+    print("\ncom índices")
+    run(engine, args.repeat, "com índices")
+
+    with engine.begin() as connection:
+        for index in Farm.__table__.indexes:
+            if index.name in FARM_LIST_INDEXES:
+                index.drop(connection)
+    print("\nsem índices")
+    run(engine, args.repeat, "sem índices")
+
+
+if __name__ == "__main__":
+    main()
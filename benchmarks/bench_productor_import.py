@@ -0,0 +1,75 @@
+"""
+Mede a importação de produtores (``POST /productor/import``): linhas por
+segundo, comandos SQL e pico de memória do processo, para verificar que o
+consumo não cresce com o tamanho do arquivo.
+
+    python -m benchmarks.bench_productor_import --rows 1000000
+"""
+
+import argparse
+import os
+import random
+import resource
+import tempfile
+import time
+
+from sqlalchemy.orm import Session
+from validate_docbr import CNPJ, CPF
+
+from app.schemas.productor import ImportFormat
+from app.services.productor_service import ProductorService
+from benchmarks.common import count_statements, create_bench_engine
+
+
+def write_csv(path: str, rows: int, duplicate_ratio: float, seed_value: int = 42):
+    """Gera um CSV com documentos válidos, inválidos e repetidos."""
+    rng = random.Random(seed_value)
+    cpf, cnpj = CPF(), CNPJ()
+    written = []
+    with open(path, "w") as csv_file:
+        csv_file.write("name,cpf_cnpj,birthdate\n")
+        for i in range(rows):
+            if written and rng.random() < duplicate_ratio:
+                document = rng.choice(written)
+            elif rng.random() < 0.01:
+                document = "000.000.000-01"
+            else:
+                document = cpf.generate(mask=True) if i % 2 else cnpj.generate()
+                if len(written) < 10_000:
+                    written.append(document)
+            csv_file.write(f"Produtor {i},{document},1970-01-01\n")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--duplicates", type=float, default=0.05)
+    args = parser.parse_args()
+
+    engine = create_bench_engine()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "productors.csv")
+        write_csv(path, args.rows, args.duplicates)
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        created = failed = 0
+        with Session(engine) as session, open(path, newline="") as source:
+            service = ProductorService(session)
+            started = time.perf_counter()
+            with count_statements(engine) as statements:
+                for chunk in service.import_productors(source, ImportFormat.csv):
+                    created += chunk.count('"status_code":201')
+                    failed += chunk.count('"status_code":4')
+            elapsed = time.perf_counter() - started
+
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"linhas      {args.rows}")
+    print(f"criados     {created}")
+    print(f"falhas      {failed}")
+    print(f"tempo       {elapsed:.2f} s ({args.rows / elapsed:,.0f} linhas/s)")
+    print(f"comandos    {len(statements)}")
+    print(f"pico RSS    {rss_before / 1024:.0f} MB -> {rss_after / 1024:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Compara, por endpoint, a serialização pelo ``response_model`` do FastAPI
+(validação + dump do pydantic, e o caminho json da stdlib) com o caminho
+rápido de ``app.utils.serialization`` (RowEncoder/orjson).
+
+    python -m benchmarks.bench_serialization --farms 20000
+
+A primeira parte mede só a serialização de uma página de 100 linhas e dos
+relatórios; a segunda mede a requisição completa, com FAST_JSON_RESPONSES
+ligado e desligado.
+"""
+
+import argparse
+import json
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+import app.utils.serialization as serialization
+from app.db.repositories.farm_repository import FarmRepository
+from app.db.repositories.plantation_repository import PlantationRepository
+from app.db.repositories.productor_repository import ProductorRepository
+from app.db.repositories.season_repository import SeasonRepository
+from app.db.session import get_db
+from app.schemas.farm import Farm
+from app.schemas.plantation import Plantation
+from app.schemas.productor import Productor
+from app.schemas.reports import (
+    Dashboard,
+    GroundUseStatistics,
+    PlantationStatistics,
+    StateStatistics,
+)
+from app.schemas.season import Season
+from app.services.reports_service import ReportsService
+from app.utils.serialization import dumps, row_encoder, type_adapter
+from benchmarks.common import create_bench_engine, measure, report, seed
+from main import app
+
+ENDPOINTS = [
+    "/api/v1/farm/?limit=100",
+    "/api/v1/productor/?limit=100",
+    "/api/v1/plantation/?limit=100",
+    "/api/v1/season/?limit=100",
+    "/api/v1/reports/state-statistics",
+    "/api/v1/reports/plantation-statistics",
+    "/api/v1/reports/ground-use-statistics",
+    "/api/v1/reports/dashboard",
+]
+
+
+def serialization_only(session: Session, repeat: int):
+    pages = {
+        "farm": (Farm, FarmRepository(session).list_farms(limit=100)),
+        "productor": (Productor, ProductorRepository(session).list_productors(limit=100)),
+        "plantation": (Plantation, PlantationRepository(session).list_plantations(limit=100)),
+        "season": (Season, SeasonRepository(session).list_seasons(limit=100)),
+    }
+    for name, (schema, rows) in pages.items():
+        adapter = type_adapter(list[schema])
+        encoder = row_encoder(schema)
+        print(f"\n{name} ({len(rows)} linhas)")
+        report("  response_model (pydantic)", *measure(
+            lambda: adapter.dump_json(
+                adapter.validate_python(rows, from_attributes=True)), repeat))
+        report("  json da stdlib", *measure(
+            lambda: json.dumps(jsonable_encoder(
+                adapter.validate_python(rows, from_attributes=True))).encode(),
+            repeat))
+        report("  RowEncoder + orjson", *measure(lambda: encoder.encode(rows), repeat))
+
+    service = ReportsService(db=session, use_cache=False)
+    reports = {
+        "state-statistics": (list[StateStatistics], service.get_state_statistics()),
+        "plantation-statistics": (
+            list[PlantationStatistics], service.get_plantation_statistics()),
+        "ground-use-statistics": (
+            GroundUseStatistics, service.get_ground_use_statistics()),
+        "dashboard": (Dashboard, service.get_dashboard()),
+    }
+    for name, (schema, content) in reports.items():
+        adapter = type_adapter(schema)
+        print(f"\n{name}")
+        report("  response_model (pydantic)", *measure(
+            lambda: adapter.dump_json(adapter.validate_python(content)), repeat))
+        report("  orjson sem revalidação", *measure(lambda: dumps(content), repeat))
+
+
+def requests(client: TestClient, repeat: int):
+    for fast in (False, True):
+        serialization.FAST_JSON_RESPONSES = fast
+        print(f"\nFAST_JSON_RESPONSES={str(fast).lower()}")
+        for path in ENDPOINTS:
+            # A primeira chamada preenche o cache dos relatórios
+            client.get(path).raise_for_status()
+            report(f"  {path}", *measure(
+                lambda: client.get(path).raise_for_status(), repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--farms", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = create_bench_engine()
+    seed(engine, farms=args.farms)
+    print(f"{args.farms} fazendas")
+
+    print("\n== só serialização ==")
+    with Session(engine) as session:
+        serialization_only(session, args.repeat)
+
+    def override_get_db():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    print("\n== requisição completa ==")
+    requests(TestClient(app), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
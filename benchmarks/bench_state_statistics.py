@@ -0,0 +1,89 @@
+"""
+Compara o caminho antigo de ``/reports/state-statistics`` (sete consultas e
+buscas lineares por estado) com a agregação em passada única e com a leitura
+das tabelas de rollup.
+
+    python -m benchmarks.bench_state_statistics --farms 200000
+"""
+
+import argparse
+
+from sqlalchemy.orm import Session
+
+from app.db.repositories.farm_repository import FarmRepository
+from app.db.repositories.report_rollup_repository import ReportRollupRepository
+from app.services.reports_service import ReportsService
+from benchmarks.common import (
+    count_statements,
+    create_bench_engine,
+    measure,
+    report,
+    seed,
+)
+
+
+def legacy_state_statistics(service: ReportsService):
+    """Reproduz a implementação anterior, baseada em varreduras de listas."""
+    repo = service.farm_repo
+    state_statistics = {}
+    total_farms = repo.get_total_farms()
+    farms_by_state = repo.get_total_farms_by_state()
+    total_plantations = repo.get_total_plantations()
+    total_area_by_state = repo.get_total_area_by_state()
+    vegetation_area_by_state = repo.get_vegetation_area_by_state()
+    arable_area_by_state = repo.get_arable_area_by_state()
+    plantations_by_state = repo.get_plantations_by_state()
+    for state, state_amount in farms_by_state:
+        state_total_area = [x[1] for x in total_area_by_state if x[0] == state][0]
+        state_vegetation_area = [
+            x[1] for x in vegetation_area_by_state if x[0] == state][0]
+        state_arable_area = [x[1] for x in arable_area_by_state if x[0] == state][0]
+        state_plantations_total = [
+            total for st, total in plantations_by_state if st == state][0]
+        state_statistics[state] = (
+            service.get_percent(total_farms, state_amount),
+            service.get_percent(total_plantations, state_plantations_total),
+            service.get_percent(state_total_area, state_vegetation_area),
+            service.get_percent(state_total_area, state_arable_area),
+        )
+    return list(state_statistics.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--farms", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_bench_engine()
+    seed(engine, farms=args.farms)
+    print(f"{args.farms} fazendas")
+
+    with Session(engine) as session:
+        service = ReportsService(session)
+        assert FarmRepository(session).get_total_farms() == args.farms
+
+        with count_statements(engine) as statements:
+            legacy_state_statistics(service)
+        report("legado (7 consultas + scans)",
+               *measure(lambda: legacy_state_statistics(service), args.repeat),
+               queries=len(statements))
+
+        with count_statements(engine) as statements:
+            service.get_state_statistics()
+        report("passada única",
+               *measure(service.get_state_statistics, args.repeat),
+               queries=len(statements))
+
+        ReportRollupRepository(session).rebuild()
+        rollup_service = ReportsService(session, source="rollup")
+        assert rollup_service.get_state_statistics() == service.get_state_statistics()
+        with count_statements(engine) as statements:
+            rollup_service.get_state_statistics()
+        report("rollup",
+               *measure(rollup_service.get_state_statistics, args.repeat),
+               queries=len(statements))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Utilitários compartilhados pelos benchmarks.
+
+Os benchmarks rodam contra o banco apontado por ``BENCH_DATABASE_URL``
+(padrão: SQLite em memória), para que possam ser executados sem o Postgres
+do docker-compose. Execute-os a partir da raiz do projeto, por exemplo:
+
+    python -m benchmarks.bench_state_statistics --farms 200000
+"""
+
+import logging
+import os
+import random
+import statistics
+import time
+from contextlib import contextmanager
+from datetime import date
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.db.init_db import Base
+from app.db.models.farm import Farm
+from app.db.models.farm_plantation_season import FarmPlantationSeason
+from app.db.models.plantation import Plantation
+from app.db.models.productor import Productor
+from app.db.models.season import Season
+
+# Os logs de cada chamada dos serviços distorcem as medições.
+logging.getLogger("app.core.logger").setLevel(logging.WARNING)
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+BENCH_DATABASE_URL = os.getenv("BENCH_DATABASE_URL", "sqlite://")
+
+STATES = ["AC", "AL", "AM", "BA", "CE", "DF", "ES", "GO", "MA", "MG", "MS",
+          "MT", "PA", "PB", "PE", "PI", "PR", "RJ", "RN", "RO", "RR", "RS",
+          "SC", "SE", "SP", "TO"]
+
+
+def create_bench_engine(url: str = BENCH_DATABASE_URL):
+    """Cria a engine de benchmark e o schema completo."""
+    if url.startswith("sqlite"):
+        engine = create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    else:
+        engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def seed(engine, farms: int, plantations: int = 20, seasons: int = 5,
+         crops_per_farm: int = 2, batch: int = 10_000, seed_value: int = 42):
+    """Popula o banco com dados sintéticos em lotes."""
+    rng = random.Random(seed_value)
+    with Session(engine) as session:
+        productors = max(1, farms // 10)
+        session.execute(insert(Productor), [
+            {"name": f"Produtor {i}", "cpf_cnpj": f"{i:011d}",
+             "birthdate": date(1970, 1, 1)}
+            for i in range(1, productors + 1)
+        ])
+        session.execute(insert(Plantation), [
+            {"name": f"Cultura {i}", "description": ""}
+            for i in range(1, plantations + 1)
+        ])
+        session.execute(insert(Season), [
+            {"description": f"Safra {2000 + i}", "year": 2000 + i}
+            for i in range(1, seasons + 1)
+        ])
+        for start in range(0, farms, batch):
+            rows = []
+            for _ in range(start, min(start + batch, farms)):
+                total = rng.uniform(10, 1000)
+                arable = rng.uniform(0, total / 2)
+                rows.append({
+                    "name": "Fazenda", "city": f"Cidade {rng.randint(1, 200)}",
+                    "state": rng.choice(STATES),
+                    "total_area": total, "arable_area": arable,
+                    "vegetation_area": rng.uniform(0, total - arable),
+                    "productor_id": rng.randint(1, productors),
+                })
+            session.execute(insert(Farm), rows)
+        crops = []
+        for farm_id in range(1, farms + 1):
+            for plantation_id in rng.sample(range(1, plantations + 1),
+                                            crops_per_farm):
+                crops.append({"farm_id": farm_id,
+                              "plantation_id": plantation_id,
+                              "season_id": rng.randint(1, seasons)})
+            if len(crops) >= batch:
+                session.execute(insert(FarmPlantationSeason), crops)
+                crops = []
+        if crops:
+            session.execute(insert(FarmPlantationSeason), crops)
+        session.commit()
+
+
+@contextmanager
+def count_statements(engine):
+    """Conta os comandos SQL enviados ao banco dentro do bloco."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def measure(fn, repeat: int = 5):
+    """Executa ``fn`` ``repeat`` vezes e retorna (mediana, mínimo) em ms."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), min(timings)
+
+
+def report(name: str, median_ms: float, best_ms: float, queries: int = None):
+    line = f"{name:<40} median {median_ms:9.2f} ms   best {best_ms:9.2f} ms"
+    if queries is not None:
+        line += f"   queries {queries}"
+    print(line)
@@ -0,0 +1,169 @@
+"""
+Executa ``EXPLAIN ANALYZE`` (Postgres) ou ``EXPLAIN QUERY PLAN`` com a
+latência medida (SQLite) em cada consulta de leitura dos repositórios.
+
+Sem ``--url``, popula um banco sintético (``BENCH_DATABASE_URL``) e compara
+os planos antes e depois dos índices da migração ``f7d3a2b8c640``:
+
+    python -m benchmarks.explain_queries --farms 200000
+    BENCH_DATABASE_URL=postgresql://... python -m benchmarks.explain_queries
+
+Com ``--url``, só lê os planos do banco informado, sem alterá-lo. Rode antes
+e depois de ``alembic upgrade head`` e compare as saídas:
+
+    python -m benchmarks.explain_queries --url postgresql://... > antes.txt
+    alembic upgrade head
+    python -m benchmarks.explain_queries --url postgresql://... > depois.txt
+"""
+
+import argparse
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+
+from app.db.models.farm import Farm
+from app.db.models.farm_plantation_season import FarmPlantationSeason
+from app.db.repositories.farm_repository import FarmRepository
+from app.db.repositories.plantation_repository import PlantationRepository
+from app.db.repositories.productor_repository import ProductorRepository
+from app.db.repositories.report_rollup_repository import ReportRollupRepository
+from app.db.repositories.season_repository import SeasonRepository
+from app.schemas.farm import FarmFilters
+from benchmarks.common import create_bench_engine, measure, seed
+
+# Índices criados pela migração f7d3a2b8c640 e o índice que ela substitui
+PACK_INDEXES = {"ix_farms_state_areas", "ix_farm_plantation_season_season_plantation"}
+REPLACED_INDEX = (
+    "CREATE INDEX ix_farm_plantation_season_season_id "
+    "ON farm_plantation_season (season_id)"
+)
+
+
+def repository_queries(session: Session) -> dict:
+    """Consultas de leitura dos repositórios, por nome."""
+    farms = FarmRepository(session)
+    plantations = PlantationRepository(session)
+    productors = ProductorRepository(session)
+    seasons = SeasonRepository(session)
+    rollups = ReportRollupRepository(session)
+    return {
+        "farm.get_farm_by_id": lambda: farms.get_farm_by_id(1),
+        "farm.get_farm_with_plantations": lambda: farms.get_farm_with_plantations(1),
+        "farm.list_farms": lambda: farms.list_farms(limit=100),
+        "farm.list_farms (state)": lambda: farms.list_farms(
+            limit=100, filters=FarmFilters(state="SP")),
+        "farm.get_total_farms": farms.get_total_farms,
+        "farm.get_total_area_by_state": lambda: farms.get_total_area_by_state().all(),
+        "farm.get_total_plantations": farms.get_total_plantations,
+        "farm.get_plantations_by_state": farms.get_plantations_by_state,
+        "farm.get_state_aggregates": farms.get_state_aggregates,
+        "farm.get_global_aggregates": farms.get_global_aggregates,
+        "plantation.list_plantations": lambda: plantations.list_plantations(limit=100),
+        "plantation.get_plantations_statistics": lambda: (
+            plantations.get_plantations_statistics().all()),
+        "plantation.get_plantations_statistics (safra)": lambda: (
+            plantations.get_plantations_statistics(season_from=3, season_to=3).all()),
+        "plantation.plantation_exists": lambda: plantations.plantation_exists(1),
+        "productor.list_productors": lambda: productors.list_productors(limit=100),
+        "productor.get_productor_by_cpf_cnpj": lambda: (
+            productors.get_productor_by_cpf_cnpj("00000000001")),
+        "season.list_seasons": lambda: seasons.list_seasons(limit=100),
+        "season.get_season_with_plantations": lambda: (
+            seasons.get_season_with_plantations(1)),
+        "season.season_exists": lambda: seasons.season_exists(1),
+        "rollup.get_state_aggregates": rollups.get_state_aggregates,
+        "rollup.get_plantations_statistics": lambda: (
+            rollups.get_plantations_statistics()),
+    }
+
+
+def capture_selects(engine, fn) -> list[tuple]:
+    """Executa ``fn`` e retorna os SELECTs (comando, parâmetros) enviados."""
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return captured
+
+
+def explain(engine, statement, parameters, label: str, repeat: int) -> list[str]:
+    with engine.connect() as connection:
+        if engine.dialect.name == "sqlite":
+            # O comentário evita que o cache de statements do sqlite3 devolva
+            # o plano anterior à troca dos índices.
+            rows = connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN /* {label} */ " + statement, parameters).all()
+            median_ms, _ = measure(
+                lambda: connection.exec_driver_sql(statement, parameters).all(),
+                repeat,
+            )
+            return [row[-1] for row in rows] + [f"Execution Time: {median_ms:.3f} ms"]
+        rows = connection.exec_driver_sql(
+            "EXPLAIN (ANALYZE, BUFFERS) " + statement, parameters).all()
+        return [row[0] for row in rows]
+
+
+def run(engine, label: str, repeat: int):
+    print(f"\n===== {label} =====")
+    with Session(engine) as session:
+        for name, fn in repository_queries(session).items():
+            for statement, parameters in capture_selects(engine, fn):
+                print(f"\n--- {name}")
+                for line in explain(engine, statement, parameters, label, repeat):
+                    print(f"    {line}")
+            session.expunge_all()
+
+
+def set_pack_indexes(engine, present: bool):
+    """Cria os índices da migração (depois) ou volta ao estado anterior (antes)."""
+    indexes = [
+        index
+        for table in (Farm.__table__, FarmPlantationSeason.__table__)
+        for index in table.indexes
+        if index.name in PACK_INDEXES
+    ]
+    with engine.begin() as connection:
+        if present:
+            connection.execute(
+                text("DROP INDEX IF EXISTS ix_farm_plantation_season_season_id"))
+            for index in indexes:
+                index.create(connection, checkfirst=True)
+        else:
+            for index in indexes:
+                index.drop(connection, checkfirst=True)
+            connection.execute(text(REPLACED_INDEX))
+        connection.exec_driver_sql("ANALYZE")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", help="banco existente, apenas leitura dos planos")
+    parser.add_argument("--farms", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.url:
+        run(create_engine(args.url), "banco informado", args.repeat)
+        return
+
+    engine = create_bench_engine()
+    seed(engine, farms=args.farms)
+    with Session(engine) as session:
+        ReportRollupRepository(session).rebuild()
+    print(f"{args.farms} fazendas")
+
+    set_pack_indexes(engine, present=False)
+    run(engine, "antes", args.repeat)
+    set_pack_indexes(engine, present=True)
+    run(engine, "depois", args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,44 @@
+import os
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from app.api.endpoints import metrics
 from app.api.routers import router
+from app.core.config import FAST_STARTUP
 from app.core.logger import logger
+from app.core.metrics import mark_process_dead, metrics_middleware
+from app.core.openapi import load_openapi
 from app.db.init_db import init_db
+from app.db.instrumentation import sql_stats_middleware
+from app.db.replica import read_after_write_middleware
+from app.db.startup import fast_startup
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    if FAST_STARTUP:
+        await fast_startup()
     logger.info("Servidor iniciado com sucesso!")
     yield
+    mark_process_dead(os.getpid())
     logger.info("Servidor encerrado.")
 
 
-init_db()
+# No modo de inicialização rápida o schema é responsabilidade do Alembic
+if not FAST_STARTUP:
+    init_db()
 
 app = FastAPI(lifespan=lifespan)
 
+app.middleware("http")(read_after_write_middleware)
+app.middleware("http")(sql_stats_middleware)
+app.middleware("http")(metrics_middleware)
 app.include_router(router, prefix="/api/v1")
+app.include_router(metrics.router)
+
+if FAST_STARTUP:
+    load_openapi(app)
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,114 @@
+"""Integration Tests for Season Partitioning (Postgres)"""
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.db.models.farm import Farm
+from app.db.models.farm_plantation_season import FarmPlantationSeason
+from app.db.models.plantation import Plantation
+from app.db.models.productor import Productor
+from app.db.models.season import Season
+from app.db import partitioning
+from app.db.partitioning import (
+    convert,
+    detach,
+    is_partitioned,
+    list_partitions,
+    partition_name,
+)
+
+
+@pytest.mark.postgres
+def test_convert_insert_and_detach_on_postgres(postgres_engine):
+    with Session(postgres_engine) as session:
+        productor = Productor(
+            name="Produtor", cpf_cnpj="111.444.777-35", birthdate=date(1970, 1, 1))
+        farm = Farm(name="Fazenda", city="Campinas", state="SP", total_area=100,
+                    arable_area=50, vegetation_area=30, productor=productor)
+        plantation = Plantation(name="Soja", description="Soja")
+        old_season = Season(year=2022, description="Safra 2022")
+        session.add_all([farm, plantation, old_season])
+        session.flush()
+        session.add(FarmPlantationSeason(
+            farm_id=farm.id, plantation_id=plantation.id, season_id=old_season.id))
+        session.commit()
+        farm_id, plantation_id, old_season_id = farm.id, plantation.id, old_season.id
+
+    convert(postgres_engine)
+    with postgres_engine.connect() as connection:
+        assert is_partitioned(connection)
+        assert [p["partition"] for p in list_partitions(connection)] == [
+            partition_name(old_season_id)]
+
+    # A safra nova ganha a partição no próprio cadastro
+    with Session(postgres_engine) as session:
+        new_season = Season(year=2023, description="Safra 2023")
+        session.add(new_season)
+        session.flush()
+        session.add(FarmPlantationSeason(
+            farm_id=farm_id, plantation_id=plantation_id, season_id=new_season.id))
+        session.commit()
+        new_season_id = new_season.id
+        assert session.query(FarmPlantationSeason).count() == 2
+
+    assert detach(postgres_engine, old_season_id) == partition_name(old_season_id)
+    with Session(postgres_engine) as session:
+        assert [p["partition"] for p in list_partitions(session.connection())] == [
+            partition_name(new_season_id)]
+        assert session.query(FarmPlantationSeason.season_id).all() == [(new_season_id,)]
+        assert session.execute(
+            text(f"SELECT count(*) FROM {partition_name(old_season_id)}")
+        ).scalar() == 1
+
+
+@pytest.mark.postgres
+def test_convert_replicates_writes_during_copy(postgres_engine, monkeypatch):
+    with Session(postgres_engine) as session:
+        productor = Productor(
+            name="Produtor", cpf_cnpj="111.444.777-35", birthdate=date(1970, 1, 1))
+        farm = Farm(name="Fazenda", city="Campinas", state="SP", total_area=100,
+                    arable_area=50, vegetation_area=30, productor=productor)
+        plantations = [
+            Plantation(name=f"Cultura {index}", description="Cultura")
+            for index in range(3)
+        ]
+        season = Season(year=2022, description="Safra 2022")
+        session.add_all([farm, season, *plantations])
+        session.flush()
+        rows = [
+            FarmPlantationSeason(
+                farm_id=farm.id, plantation_id=plantation.id, season_id=season.id)
+            for plantation in plantations[:2]
+        ]
+        session.add_all(rows)
+        session.commit()
+        removed_id = rows[0].id
+        kept = (farm.id, plantations[1].id, season.id)
+        added = (farm.id, plantations[2].id, season.id)
+
+    copy_rows = partitioning._copy_rows
+
+    def copy_rows_with_writes(engine, batch_size):
+        # Escritas da API entre a criação do trigger e a cópia em lotes
+        with Session(engine) as session:
+            session.query(FarmPlantationSeason).filter_by(id=removed_id).delete()
+            session.add(FarmPlantationSeason(
+                farm_id=added[0], plantation_id=added[1], season_id=added[2]))
+            session.commit()
+        return copy_rows(engine, batch_size=1)
+
+    monkeypatch.setattr(partitioning, "_copy_rows", copy_rows_with_writes)
+    convert(postgres_engine)
+
+    with Session(postgres_engine) as session:
+        assert is_partitioned(session.connection())
+        assert sorted(session.query(
+            FarmPlantationSeason.farm_id,
+            FarmPlantationSeason.plantation_id,
+            FarmPlantationSeason.season_id,
+        ).all()) == sorted([kept, added])
+        assert session.execute(text(
+            "SELECT count(*) FROM pg_trigger WHERE tgname = :name"
+        ), {"name": partitioning.SYNC_TRIGGER}).scalar() == 0
@@ -0,0 +1,183 @@
+"""
+Async Stack Unit Tests
+"""
+import asyncio
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.api.routers import build_router
+from app.db.async_session import get_async_db, to_async_url
+from app.db.session import Base
+from app.services.async_reports_service import AsyncReportsService
+from app.services.reports_service import reports_cache
+
+
+@pytest.fixture()
+def async_client(tmp_path):
+    url = f"sqlite:///{tmp_path}/async.db"
+    sync_engine = create_engine(url)
+    Base.metadata.create_all(bind=sync_engine)
+    sync_engine.dispose()
+
+    # NullPool: cada TestClient roda em um event loop próprio, e conexões
+    # aiosqlite não podem ser reaproveitadas entre loops.
+    async_engine = create_async_engine(to_async_url(url), poolclass=NullPool)
+    session_factory = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with session_factory() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(build_router(async_database=True), prefix="/api/v1")
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    with TestClient(app) as client:
+        yield client
+
+
+def test_to_async_url():
+    assert (
+        to_async_url("postgresql://user:password@db:5432/dbname")
+        == "postgresql+asyncpg://user:password@db:5432/dbname"
+    )
+    assert to_async_url("sqlite:///./test_db.db") == "sqlite+aiosqlite:///./test_db.db"
+
+
+def test_async_productor_crud(async_client, user_payload, user_payload_updated):
+    response = async_client.post("/api/v1/productor/", json=user_payload)
+    assert response.status_code == 200
+    productor_id = response.json()["id"]
+
+    response = async_client.post("/api/v1/productor/", json=user_payload)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "CPF/CNPJ já cadastrado"
+
+    response = async_client.get(f"/api/v1/productor/{productor_id}")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    response = async_client.get(
+        f"/api/v1/productor/{productor_id}", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    response = async_client.put(
+        f"/api/v1/productor/{productor_id}", json=user_payload_updated
+    )
+    assert response.json()["name"] == "John McDonald da Silva"
+    assert async_client.get(f"/api/v1/productor/{productor_id}/farms").json() == []
+
+    response = async_client.delete(f"/api/v1/productor/{productor_id}")
+    assert response.status_code == 200
+    response = async_client.delete(f"/api/v1/productor/{productor_id}")
+    assert response.status_code == 404
+
+
+def test_async_list_pagination(async_client, season_data):
+    for year in range(2020, 2025):
+        async_client.post("/api/v1/season/", json={**season_data, "year": year})
+
+    response = async_client.get("/api/v1/season/?limit=3")
+    assert [season["year"] for season in response.json()] == [2020, 2021, 2022]
+    cursor = response.headers["X-Next-Cursor"]
+    response = async_client.get(f"/api/v1/season/?limit=3&cursor={cursor}")
+    assert [season["year"] for season in response.json()] == [2023, 2024]
+
+
+def test_async_plantation_not_found(async_client, plantation_data):
+    response = async_client.post("/api/v1/plantation/", json=plantation_data)
+    plantation_id = response.json()["id"]
+    assert async_client.get(f"/api/v1/plantation/{plantation_id}").status_code == 200
+    response = async_client.delete("/api/v1/plantation/999")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "plantation not found"
+
+
+def test_async_farm_and_reports(async_client, user_payload, farm_payload):
+    productor_id = async_client.post(
+        "/api/v1/productor/", json=user_payload).json()["id"]
+    farm_payload["productor_id"] = productor_id
+    response = async_client.post("/api/v1/farm/", json=farm_payload)
+    assert response.status_code == 200
+    farm_id = response.json()["id"]
+
+    response = async_client.post(
+        "/api/v1/farm/bulk",
+        json=[{**farm_payload, "state": "MG"}, {**farm_payload, "productor_id": 999}],
+    )
+    assert [item["status_code"] for item in response.json()["items"]] == [201, 404]
+
+    response = async_client.get(f"/api/v1/farm/{farm_id}")
+    etag = response.headers["ETag"]
+    response = async_client.get(
+        f"/api/v1/farm/{farm_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    response = async_client.put(
+        f"/api/v1/farm/{farm_id}", json={**farm_payload, "name": "Fazenda Nova"})
+    assert response.json()["name"] == "Fazenda Nova"
+    assert async_client.get(f"/api/v1/farm/{farm_id}/plantations").json() == []
+    assert len(async_client.get("/api/v1/farm/?state=MG").json()) == 1
+
+    response = async_client.get(
+        "/api/v1/reports/total-farms", params={"use_cache": False})
+    assert response.json() == {"total_farms": 2}
+    response = async_client.get(
+        "/api/v1/reports/dashboard",
+        params={"use_cache": False, "sections": ["state_statistics"]},
+    )
+    assert {state["state"] for state in response.json()["state_statistics"]} == {
+        farm_payload["state"], "MG"}
+
+    assert async_client.delete(f"/api/v1/farm/{farm_id}").status_code == 200
+    assert async_client.get(f"/api/v1/farm/{farm_id}").status_code == 404
+
+
+def test_async_router_keeps_sync_only_routes(async_client):
+    # /farm/export só tem versão síncrona e precisa vir antes de /farm/{farm_id}
+    response = async_client.get("/api/v1/farm/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+
+def test_async_reports_coalesce_concurrent_misses(tmp_path):
+    url = f"sqlite:///{tmp_path}/async.db"
+    sync_engine = create_engine(url)
+    Base.metadata.create_all(bind=sync_engine)
+    sync_engine.dispose()
+
+    async def concurrent_misses():
+        async_engine = create_async_engine(to_async_url(url), poolclass=NullPool)
+        session_factory = async_sessionmaker(bind=async_engine)
+
+        async def state_statistics():
+            async with session_factory() as session:
+                reports_service = AsyncReportsService(session, use_cache=True)
+                return await reports_service.get_state_statistics()
+
+        try:
+            return await asyncio.gather(state_statistics(), state_statistics())
+        finally:
+            await async_engine.dispose()
+
+    reports_cache.clear()
+    before = reports_cache.stats()
+    results = []
+    # Um miss aguardando dentro do run_sync trava o event loop (nem o
+    # asyncio.wait_for dispara): o loop roda em outra thread, com limite
+    thread = threading.Thread(
+        target=lambda: results.append(asyncio.run(concurrent_misses())),
+        daemon=True,
+    )
+    thread.start()
+    thread.join(timeout=30)
+    assert not thread.is_alive()
+    assert results == [[[], []]]
+    stats = reports_cache.stats()
+    assert stats["misses"] - before["misses"] == 1
+    assert stats["coalesced"] - before["coalesced"] == 1
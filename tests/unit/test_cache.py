@@ -0,0 +1,55 @@
+"""Versioned Cache Unit Tests"""
+
+import threading
+import time
+
+from app.core.cache import VersionedCache
+
+
+def test_cache_hit_until_version_changes():
+    version = [1]
+    cache = VersionedCache(version=lambda: version[0])
+
+    assert cache.get_or_compute("key", lambda: "a") == "a"
+    assert cache.get_or_compute("key", lambda: "b") == "a"
+    version[0] = 2
+    assert cache.get_or_compute("key", lambda: "c") == "c"
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_cache_ttl_and_max_entries():
+    cache = VersionedCache(version=lambda: 1, max_entries=2, ttl=0)
+    assert cache.get_or_compute("key", lambda: "a") == "a"
+    # TTL expirado: recalcula mesmo sem mudança de versão
+    assert cache.get_or_compute("key", lambda: "b") == "b"
+
+    cache = VersionedCache(version=lambda: 1, max_entries=2)
+    for key in ["a", "b", "c"]:
+        cache.get_or_compute(key, lambda: key)
+    assert cache.stats()["entries"] == 2
+    # A entrada mais antiga foi descartada
+    assert cache.get_or_compute("a", lambda: "recalculado") == "recalculado"
+
+
+def test_cache_coalesces_concurrent_misses():
+    cache = VersionedCache(version=lambda: 1)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return "valor"
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(cache.get_or_compute("key", compute)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["valor"] * 8
+    assert len(calls) == 1
@@ -0,0 +1,126 @@
+"""
+Core Read Path Unit Tests
+"""
+import pytest
+
+import app.services.farm_service as farm_service
+import app.services.plantation_service as plantation_service
+import app.services.productor_service as productor_service
+import app.services.season_service as season_service
+from app.db.repositories.core_read_repository import CoreReadRepository
+from app.db.repositories.farm_repository import FarmRepository
+from app.schemas.farm import Farm, FarmFilters, FarmSortField, SortOrder
+
+
+@pytest.fixture()
+def seeded(test_client, user_payload, farm_payload, plantation_data, season_data):
+    productor_id = test_client.post("/api/v1/productor/", json=user_payload).json()["id"]
+    farm_ids = []
+    for index, state in enumerate(["SP", "MG", "SP"]):
+        payload = dict(
+            farm_payload,
+            productor_id=productor_id,
+            state=state,
+            total_area=farm_payload["total_area"] + index,
+        )
+        farm_ids.append(test_client.post("/api/v1/farm/", json=payload).json()["id"])
+    plantation_id = test_client.post(
+        "/api/v1/plantation/", json=plantation_data).json()["id"]
+    season_id = test_client.post("/api/v1/season/", json=season_data).json()["id"]
+    return {
+        "productor": productor_id,
+        "farm": farm_ids[0],
+        "plantation": plantation_id,
+        "season": season_id,
+    }
+
+
+def test_core_rows_match_orm_objects(db_session, seeded):
+    core = CoreReadRepository(db_session)
+    orm = FarmRepository(db_session)
+    cases = [
+        {},
+        {"limit": 2},
+        {"after": (seeded["farm"],)},
+        {"filters": FarmFilters(state="SP")},
+        {"sort_by": FarmSortField.total_area, "order": SortOrder.desc},
+        {
+            "sort_by": FarmSortField.total_area,
+            "after": (1e9, 0),
+            "order": SortOrder.desc,
+        },
+    ]
+    for kwargs in cases:
+        expected = [Farm.model_validate(farm, from_attributes=True)
+                    for farm in orm.list_farms(**kwargs)]
+        rows = core.list_farms(**kwargs)
+        assert [Farm.model_validate(row, from_attributes=True)
+                for row in rows] == expected, kwargs
+
+    row = core.get_farm_by_id(seeded["farm"])
+    farm = orm.get_farm_by_id(seeded["farm"])
+    assert (row.id, row.name, row.version) == (farm.id, farm.name, farm.version)
+    assert core.get_farm_by_id(0) is None
+
+
+def test_core_lookups_do_not_touch_identity_map(db_session, seeded):
+    db_session.expunge_all()
+    core = CoreReadRepository(db_session)
+    core.list_farms()
+    core.list_productors()
+    core.list_plantations()
+    core.list_seasons()
+    for name in ("farm", "productor", "plantation", "season"):
+        assert getattr(core, f"get_{name}_by_id")(seeded[name]).id == seeded[name]
+    assert len(db_session.identity_map) == 0
+
+
+def test_core_lookup_reuses_cached_statement(db_session, seeded, count_queries):
+    core = CoreReadRepository(db_session)
+    for name in ("farm", "productor", "plantation", "season"):
+        lookup = getattr(core, f"get_{name}_by_id")
+        assert lookup(seeded[name]).id == seeded[name]
+        assert lookup(0) is None
+    # Um comando por busca; o ID vai como parâmetro, e o SQL compilado da
+    # lambda é o mesmo para qualquer ID
+    assert len(count_queries) == 8
+    assert count_queries[0::2] == count_queries[1::2]
+
+
+@pytest.mark.parametrize("module", [
+    farm_service, productor_service, plantation_service, season_service
+])
+def test_read_path_switch(module, monkeypatch, db_session):
+    service_class = next(
+        value for name, value in vars(module).items()
+        if name.endswith("Service") and isinstance(value, type)
+    )
+    monkeypatch.setattr(module, "CORE_READ_PATH", True)
+    assert isinstance(service_class(db_session).read_repo, CoreReadRepository)
+    monkeypatch.setattr(module, "CORE_READ_PATH", False)
+    assert not isinstance(service_class(db_session).read_repo, CoreReadRepository)
+
+
+def test_endpoints_match_orm_path(test_client, seeded, monkeypatch):
+    paths = [
+        "/api/v1/farm/",
+        "/api/v1/farm/?state=SP&sort_by=total_area&order=desc",
+        "/api/v1/farm/?limit=1",
+        f"/api/v1/farm/{seeded['farm']}",
+        "/api/v1/productor/",
+        f"/api/v1/productor/{seeded['productor']}",
+        "/api/v1/plantation/",
+        f"/api/v1/plantation/{seeded['plantation']}",
+        "/api/v1/season/",
+        f"/api/v1/season/{seeded['season']}",
+    ]
+    core = {path: test_client.get(path) for path in paths}
+
+    for module in (farm_service, productor_service, plantation_service, season_service):
+        monkeypatch.setattr(module, "CORE_READ_PATH", False)
+    for path in paths:
+        response = test_client.get(path)
+        assert response.status_code == core[path].status_code == 200
+        assert response.content == core[path].content, path
+        for header in ("ETag", "X-Next-Cursor"):
+            assert response.headers.get(header) == core[path].headers.get(header)
@@ -1,5 +1,17 @@
 """Farms Unit Tests"""
 
+import json
+
+from sqlalchemy import update
+
+from app.core.config import BULK_MAX_ITEMS
+from app.db.models.farm import Farm
+from app.db.repositories.farm_repository import FarmRepository
+from app.db.repositories.plantation_repository import PlantationRepository
+from app.db.repositories.report_rollup_repository import ReportRollupRepository
+from app.db.repositories.season_repository import SeasonRepository
+from app.utils.pagination import encode_cursor
+
 
 def test_create_farm(test_client, user_payload, farm_payload):
     productor_response = test_client.post(
@@ -137,3 +149,442 @@ def test_get_farm_seasons(test_client, user_payload, farm_payload, plantation_da
     get_seasons_response = test_client.get(f"/api/v1/farm/{farm_id}/seasons")
     assert get_seasons_response.status_code == 200
     assert len(get_seasons_response.json()) > 0
+
+
+def test_get_farm_conditional(test_client, user_payload, farm_payload, farm_payload_updated):
+    productor_response = test_client.post(
+        "/api/v1/productor/", json=user_payload)
+    productor_id = productor_response.json()["id"]
+    farm_payload["productor_id"] = productor_id
+    farm_id = test_client.post("/api/v1/farm/", json=farm_payload).json()["id"]
+
+    response = test_client.get(f"/api/v1/farm/{farm_id}")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    # Mesmo ETag: 304 sem corpo
+    response = test_client.get(
+        f"/api/v1/farm/{farm_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    # A atualização incrementa a versão da fazenda
+    farm_payload_updated["productor_id"] = productor_id
+    test_client.put(f"/api/v1/farm/{farm_id}", json=farm_payload_updated)
+    response = test_client.get(
+        f"/api/v1/farm/{farm_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["name"] == "Fazenda Tiao Atualizada"
+
+
+def test_list_farms_filters_and_sort(test_client, user_payload, farm_payload):
+    productor_response = test_client.post(
+        "/api/v1/productor/", json=user_payload)
+    productor_id = productor_response.json()["id"]
+    farm_payload["productor_id"] = productor_id
+
+    # Três fazendas em SP/Campinas com áreas diferentes e uma em MG
+    for total_area in [300.0, 100.0, 200.0]:
+        farm_payload.update(
+            {"state": "SP", "city": "Campinas", "total_area": total_area})
+        test_client.post("/api/v1/farm/", json=farm_payload)
+    farm_payload.update(
+        {"state": "MG", "city": "Uberaba", "total_area": 500.0})
+    test_client.post("/api/v1/farm/", json=farm_payload)
+
+    filters = {"productor_id": productor_id, "state": "SP", "city": "Campinas"}
+    response = test_client.get(
+        "/api/v1/farm/",
+        params={**filters, "sort_by": "total_area", "order": "desc"})
+    assert response.status_code == 200
+    assert [farm["total_area"] for farm in response.json()] == [300.0, 200.0, 100.0]
+
+    response = test_client.get(
+        "/api/v1/farm/",
+        params={"productor_id": productor_id, "min_total_area": 150,
+                "max_total_area": 400, "sort_by": "total_area"})
+    assert [farm["total_area"] for farm in response.json()] == [200.0, 300.0]
+
+    # O cursor preserva a ordenação escolhida entre as páginas
+    params = {**filters, "sort_by": "total_area", "order": "desc", "limit": 2}
+    first_page = test_client.get("/api/v1/farm/", params=params)
+    assert [farm["total_area"] for farm in first_page.json()] == [300.0, 200.0]
+    cursor = first_page.headers["X-Next-Cursor"]
+    second_page = test_client.get(
+        "/api/v1/farm/", params={**params, "cursor": cursor})
+    assert [farm["total_area"] for farm in second_page.json()] == [100.0]
+    assert "X-Next-Cursor" not in second_page.headers
+
+    response = test_client.get("/api/v1/farm/", params={"sort_by": "unknown"})
+    assert response.status_code == 422
+
+    # Os valores do cursor precisam ter o tipo do campo de ordenação
+    for sort_by, key in [
+        ("total_area", [{"a": 1}, 5]),
+        ("total_area", ["100", 5]),
+        ("total_area", [True, 5]),
+        ("name", [1, 5]),
+        ("total_area", [100.0, "5"]),
+    ]:
+        response = test_client.get("/api/v1/farm/", params={
+            "sort_by": sort_by, "cursor": encode_cursor(*key)})
+        assert response.status_code == 400, (sort_by, key)
+    response = test_client.get("/api/v1/farm/", params={
+        "sort_by": "total_area", "cursor": encode_cursor(100, 5)})
+    assert response.status_code == 200
+
+
+def test_list_next_cursor_documented(test_client):
+    paths = test_client.get("/openapi.json").json()["paths"]
+    for path in ("/api/v1/farm/", "/api/v1/productor/",
+                 "/api/v1/plantation/", "/api/v1/season/"):
+        headers = paths[path]["get"]["responses"]["200"]["headers"]
+        assert "X-Next-Cursor" in headers
+
+
+def test_export_farms(test_client, user_payload, farm_payload, plantation_data, season_data):
+    productor_response = test_client.post(
+        "/api/v1/productor/", json=user_payload)
+    productor_id = productor_response.json()["id"]
+    farm_payload["productor_id"] = productor_id
+
+    farm_ids = []
+    for state in ["SP", "MG"]:
+        farm_payload["state"] = state
+        farm_ids.append(
+            test_client.post("/api/v1/farm/", json=farm_payload).json()["id"])
+    plantation_id = test_client.post(
+        "/api/v1/plantation/", json=plantation_data).json()["id"]
+    season_id = test_client.post(
+        "/api/v1/season/", json=season_data).json()["id"]
+    test_client.put(
+        f"/api/v1/farm/{farm_ids[0]}/add-plantation",
+        json={"plantation_id": plantation_id, "season_id": season_id},
+    )
+
+    response = test_client.get(
+        "/api/v1/farm/export",
+        params={"productor_id": productor_id, "include_productor": True,
+                "include_plantations": True},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == farm_ids
+    assert rows[0]["productor_name"] == user_payload["name"]
+    assert rows[0]["plantations"] == plantation_data["name"]
+    assert rows[1]["plantations"] is None
+
+    response = test_client.get(
+        "/api/v1/farm/export",
+        params={"format": "csv", "productor_id": productor_id, "state": "MG"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    lines = response.text.splitlines()
+    assert lines[0] == (
+        "id,name,city,state,total_area,arable_area,vegetation_area,productor_id")
+    assert len(lines) == 2
+    assert lines[1].startswith(f"{farm_ids[1]},")
+
+
+def test_create_farms_bulk(test_client, user_payload, farm_payload, farm_payload_invalid_area, count_queries):
+    productor_response = test_client.post(
+        "/api/v1/productor/", json=user_payload)
+    productor_id = productor_response.json()["id"]
+
+    farms = []
+    for state, name in [("SP", "A"), ("SP", "B"), ("MG", "A")]:
+        farms.append({**farm_payload, "name": name, "state": state,
+                      "productor_id": productor_id})
+    farms.append({**farm_payload_invalid_area, "productor_id": productor_id})
+    farms.append({**farm_payload, "productor_id": 888})
+
+    count_queries.clear()
+    response = test_client.post("/api/v1/farm/bulk", json=farms)
+    assert response.status_code == 200
+    # Produtores, INSERT das fazendas, um upsert de rollup por estado e o
+    # incremento da versão dos dados
+    assert len(count_queries) == 5
+
+    result = response.json()
+    assert result["created"] == 3
+    assert result["failed"] == 2
+    items = result["items"]
+    assert [item["status_code"] for item in items] == [201, 201, 201, 400, 404]
+    assert items[3]["detail"] == (
+        "The total area is less than the combined area of vegetation and arable land")
+    assert items[4]["detail"] == "Productor not found"
+    assert items[4]["id"] is None
+
+    for item, farm in zip(items[:3], farms):
+        farm_response = test_client.get(f"/api/v1/farm/{item['id']}")
+        assert farm_response.status_code == 200
+        assert farm_response.json()["state"] == farm["state"]
+        assert farm_response.json()["name"] == farm["name"]
+
+    total_farms = test_client.get(
+        "/api/v1/reports/total-farms", params={"use_cache": False})
+    assert total_farms.json()["total_farms"] >= 3
+
+
+def test_add_plantations_bulk(test_client, db_session, user_payload, farm_payload, plantation_data, season_data, count_queries):
+    productor_response = test_client.post(
+        "/api/v1/productor/", json=user_payload)
+    farm_payload["productor_id"] = productor_response.json()["id"]
+    farm_ids = []
+    for state in ["SP", "MG"]:
+        farm_payload["state"] = state
+        farm_ids.append(
+            test_client.post("/api/v1/farm/", json=farm_payload).json()["id"])
+    plantation_id = test_client.post(
+        "/api/v1/plantation/", json=plantation_data).json()["id"]
+    season_id = test_client.post(
+        "/api/v1/season/", json=season_data).json()["id"]
+    test_client.put(
+        f"/api/v1/farm/{farm_ids[0]}/add-plantation",
+        json={"plantation_id": plantation_id, "season_id": season_id},
+    )
+
+    payload = [
+        # Já cadastrada pelo endpoint unitário
+        {"farm_id": farm_ids[0], "plantation_id": plantation_id, "season_id": season_id},
+        {"farm_id": farm_ids[1], "plantation_id": plantation_id, "season_id": season_id},
+        # Repetida dentro do próprio lote
+        {"farm_id": farm_ids[1], "plantation_id": plantation_id, "season_id": season_id},
+        {"farm_id": 888888, "plantation_id": plantation_id, "season_id": season_id},
+        {"farm_id": farm_ids[1], "plantation_id": 888888, "season_id": season_id},
+        {"farm_id": farm_ids[1], "plantation_id": plantation_id, "season_id": 888888},
+    ]
+    count_queries.clear()
+    response = test_client.post("/api/v1/farm/bulk/add-plantation", json=payload)
+    assert response.status_code == 200
+    # Fazendas, culturas, safras, relações existentes, INSERT, rollup e
+    # versão dos dados
+    assert len(count_queries) == 7
+
+    result = response.json()
+    assert result["created"] == 1
+    assert result["failed"] == 5
+    assert [(item["status_code"], item["detail"]) for item in result["items"]] == [
+        (400, "Plantation already exists in this season"),
+        (201, None),
+        (400, "Plantation already exists in this season"),
+        (404, "Farm not found"),
+        (404, "Plantation not found"),
+        (404, "Season not found"),
+    ]
+
+    plantations = test_client.get(f"/api/v1/farm/{farm_ids[1]}/plantations")
+    assert [plantation["id"] for plantation in plantations.json()] == [plantation_id]
+
+    # O rollup acompanha a inserção em lote
+    assert ReportRollupRepository(db_session).verify() == []
+
+
+def test_farm_plantations_constant_queries(test_client, user_payload, farm_payload, plantation_data, season_data, count_queries):
+    productor_response = test_client.post(
+        "/api/v1/productor/", json=user_payload)
+    farm_payload["productor_id"] = productor_response.json()["id"]
+    farm_id = test_client.post("/api/v1/farm/", json=farm_payload).json()["id"]
+
+    query_counts = {"plantations": [], "seasons": []}
+    for _ in range(2):
+        # Acrescenta três culturas em duas safras novas a cada rodada
+        season_ids = [
+            test_client.post("/api/v1/season/", json=season_data).json()["id"]
+            for _ in range(2)
+        ]
+        for _ in range(3):
+            plantation_id = test_client.post(
+                "/api/v1/plantation/", json=plantation_data).json()["id"]
+            for season_id in season_ids:
+                test_client.put(
+                    f"/api/v1/farm/{farm_id}/add-plantation",
+                    json={"plantation_id": plantation_id, "season_id": season_id},
+                )
+        for view in query_counts:
+            count_queries.clear()
+            response = test_client.get(f"/api/v1/farm/{farm_id}/{view}")
+            assert response.status_code == 200
+            query_counts[view].append(len(count_queries))
+
+    assert query_counts == {"plantations": [1, 1], "seasons": [1, 1]}
+    plantations = test_client.get(f"/api/v1/farm/{farm_id}/plantations").json()
+    assert len(plantations) == 6
+    assert all(len(plantation["seasons"]) == 2 for plantation in plantations)
+
+
+def test_add_plantation_single_statement(test_client, db_session, user_payload, farm_payload, plantation_data, season_data, count_queries):
+    productor_response = test_client.post(
+        "/api/v1/productor/", json=user_payload)
+    farm_payload["productor_id"] = productor_response.json()["id"]
+    farm_id = test_client.post("/api/v1/farm/", json=farm_payload).json()["id"]
+    plantation_id = test_client.post(
+        "/api/v1/plantation/", json=plantation_data).json()["id"]
+    season_id = test_client.post(
+        "/api/v1/season/", json=season_data).json()["id"]
+    payload = {"plantation_id": plantation_id, "season_id": season_id}
+
+    count_queries.clear()
+    response = test_client.put(
+        f"/api/v1/farm/{farm_id}/add-plantation", json=payload)
+    assert response.status_code == 200
+    assert response.json()["farm_id"] == farm_id
+    # INSERT ... ON CONFLICT DO NOTHING RETURNING, o upsert do rollup e a
+    # versão dos dados
+    assert len(count_queries) == 3
+
+    count_queries.clear()
+    response = test_client.put(
+        f"/api/v1/farm/{farm_id}/add-plantation", json=payload)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Plantation already exists in this season"
+    # INSERT sem linhas e a consulta que identifica o motivo
+    assert len(count_queries) == 2
+
+    for farm, plantation, season, detail in [
+        (888888, plantation_id, season_id, "Farm not found"),
+        (farm_id, 888888, season_id, "Plantation not found"),
+        (farm_id, plantation_id, 888888, "Season not found"),
+    ]:
+        response = test_client.put(
+            f"/api/v1/farm/{farm}/add-plantation",
+            json={"plantation_id": plantation, "season_id": season},
+        )
+        assert response.status_code == 404
+        assert response.json()["detail"] == detail
+
+    assert ReportRollupRepository(db_session).verify() == []
+
+
+def test_delete_guards(test_client, db_session, user_payload, farm_payload, plantation_data, season_data, count_queries):
+    productor_id = test_client.post(
+        "/api/v1/productor/", json=user_payload).json()["id"]
+    farm_payload["productor_id"] = productor_id
+    farm_ids = [
+        test_client.post("/api/v1/farm/", json=farm_payload).json()["id"]
+        for _ in range(2)
+    ]
+    plantation_id = test_client.post(
+        "/api/v1/plantation/", json=plantation_data).json()["id"]
+    season_id = test_client.post(
+        "/api/v1/season/", json=season_data).json()["id"]
+    test_client.put(
+        f"/api/v1/farm/{farm_ids[0]}/add-plantation",
+        json={"plantation_id": plantation_id, "season_id": season_id},
+    )
+
+    # Registros com dependentes: DELETE sem linhas e a verificação de existência
+    for url, detail in [
+        (f"/api/v1/farm/{farm_ids[0]}",
+         "Cannot delete farm because it has related records"),
+        (f"/api/v1/productor/{productor_id}",
+         "Cannot delete productor because it has related records"),
+        (f"/api/v1/plantation/{plantation_id}",
+         "Cannot delete plantation because it has related records"),
+        (f"/api/v1/season/{season_id}",
+         "Não é possível deletar a safra porque há registros relacionados"),
+    ]:
+        count_queries.clear()
+        response = test_client.delete(url)
+        assert response.status_code == 400
+        assert response.json()["detail"] == detail
+        assert len(count_queries) == 2
+
+    # Fazenda sem culturas: DELETE ... RETURNING, o delta do rollup e a
+    # versão dos dados
+    count_queries.clear()
+    response = test_client.delete(f"/api/v1/farm/{farm_ids[1]}")
+    assert response.status_code == 200
+    assert response.json()["id"] == farm_ids[1]
+    assert len(count_queries) == 3
+    assert ReportRollupRepository(db_session).verify() == []
+
+    response = test_client.delete(f"/api/v1/farm/{farm_ids[1]}")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Farm not found"
+
+
+def test_update_farm_concurrent_conflict(
+    test_client, user_payload, farm_payload, farm_payload_updated, monkeypatch
+):
+    productor_id = test_client.post("/api/v1/productor/", json=user_payload).json()["id"]
+    farm_payload["productor_id"] = productor_id
+    farm_payload_updated["productor_id"] = productor_id
+    farm_id = test_client.post("/api/v1/farm/", json=farm_payload).json()["id"]
+
+    get_farm_by_id = FarmRepository.get_farm_by_id
+
+    def get_then_concurrent_update(self, farm_id):
+        farm = get_farm_by_id(self, farm_id)
+        # Outra requisição atualiza a fazenda entre a leitura e o UPDATE
+        farms = Farm.__table__
+        self.db.execute(
+            update(farms)
+            .where(farms.c.id == farm_id)
+            .values(version=farms.c.version + 1)
+        )
+        return farm
+
+    monkeypatch.setattr(FarmRepository, "get_farm_by_id", get_then_concurrent_update)
+    response = test_client.put(f"/api/v1/farm/{farm_id}", json=farm_payload_updated)
+    assert response.status_code == 409
+    assert response.json()["detail"] == "Farm was modified by another request"
+
+
+def test_create_farms_bulk_limit(test_client, farm_payload):
+    farms = [{**farm_payload, "productor_id": 1}] * (BULK_MAX_ITEMS + 1)
+    response = test_client.post("/api/v1/farm/bulk", json=farms)
+    assert response.status_code == 422
+
+
+def test_existing_farm_ids_chunked(
+    test_client, db_session, user_payload, farm_payload, count_queries
+):
+    productor_id = test_client.post("/api/v1/productor/", json=user_payload).json()["id"]
+    farm_payload["productor_id"] = productor_id
+    farm_ids = [
+        test_client.post("/api/v1/farm/", json=farm_payload).json()["id"]
+        for _ in range(3)
+    ]
+
+    count_queries.clear()
+    existing = FarmRepository(db_session).get_existing_farm_ids(
+        farm_ids + [0, -1], chunk_size=2)
+    assert existing == set(farm_ids)
+    assert len(count_queries) == 3
+
+
+def test_add_plantations_bulk_limit(test_client):
+    farm_plantations = [
+        {"farm_id": 1, "plantation_id": 1, "season_id": 1}
+    ] * (BULK_MAX_ITEMS + 1)
+    response = test_client.post(
+        "/api/v1/farm/bulk/add-plantation", json=farm_plantations)
+    assert response.status_code == 422
+
+
+def test_existing_plantation_and_season_ids_chunked(
+    test_client, db_session, plantation_data, season_data, count_queries
+):
+    plantation_ids = []
+    season_ids = []
+    for index in range(3):
+        plantation_ids.append(test_client.post(
+            "/api/v1/plantation/",
+            json={**plantation_data, "name": f"{plantation_data['name']} {index}"},
+        ).json()["id"])
+        season_ids.append(test_client.post(
+            "/api/v1/season/",
+            json={**season_data, "year": season_data["year"] + index},
+        ).json()["id"])
+
+    count_queries.clear()
+    assert PlantationRepository(db_session).get_existing_plantation_ids(
+        plantation_ids + [0], chunk_size=2) == set(plantation_ids)
+    assert SeasonRepository(db_session).get_existing_season_ids(
+        season_ids + [0], chunk_size=2) == set(season_ids)
+    assert len(count_queries) == 4
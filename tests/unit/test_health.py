@@ -1,5 +1,8 @@
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc
 
+from app.db.pool import InstrumentedQueuePool, pool_status
 from main import app
 
 client = TestClient(app)
@@ -11,3 +14,62 @@ def test_health_check():
     assert response.status_code == 200
 
     assert response.json() == {"status": "ok"}
+
+
+def test_pool_stats():
+    response = client.get("/api/v1/health/pool")
+
+    assert response.status_code == 200
+    stats = response.json()["sync"]
+    assert stats["pool_class"] == "InstrumentedQueuePool"
+    assert {"size", "in_use", "overflow", "overflow_events", "timeouts", "wait_ms"} <= stats.keys()
+
+
+def test_pool_metrics_overflow_and_timeout(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path}/pool.db",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05,
+    )
+    first = engine.connect()
+    second = engine.connect()
+    stats = pool_status(engine.pool)
+    assert stats["in_use"] == 2
+    assert stats["overflow"] == 1
+    assert stats["overflow_events"] == 1
+
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+    assert pool_status(engine.pool)["timeouts"] == 1
+
+    first.close()
+    second.close()
+    stats = pool_status(engine.pool)
+    assert stats["in_use"] == 0
+    assert stats["checkouts"] == 2
+    assert stats["wait_ms"]["max"] >= 0
+    engine.dispose()
+
+
+def test_pool_metrics_survive_dispose(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path}/pool.db",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+    )
+    engine.connect().close()
+    # dispose() troca o pool por um recreate(); métricas e eventos continuam
+    engine.dispose()
+    engine.dispose()
+    first = engine.connect()
+    second = engine.connect()
+    stats = pool_status(engine.pool)
+    assert stats["checkouts"] == 3
+    assert stats["overflow_events"] == 1
+    assert stats["max_overflow"] == 1
+    first.close()
+    second.close()
+    engine.dispose()
@@ -0,0 +1,69 @@
+"""
+SQL Instrumentation Unit Tests
+"""
+from datetime import date
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import app.db.instrumentation as instrumentation
+from app.db.instrumentation import NPlusOneError, sql_stats_middleware
+from app.db.models.farm import Farm
+from app.db.models.productor import Productor
+
+
+@pytest.fixture()
+def n_plus_one_client(db_session):
+    productor = Productor(
+        name="Produtor", cpf_cnpj="111.444.777-35", birthdate=date(1970, 1, 1))
+    db_session.add(productor)
+    db_session.flush()
+    for index in range(3):
+        db_session.add(Farm(
+            name=f"Fazenda {index}",
+            city="Cidade",
+            state="SP",
+            total_area=10,
+            arable_area=5,
+            vegetation_area=5,
+            productor_id=productor.id,
+        ))
+    db_session.flush()
+    db_session.expunge_all()
+
+    app = FastAPI()
+    app.middleware("http")(sql_stats_middleware)
+
+    @app.get("/farms/plantations")
+    def farm_plantations():
+        # Um lazy load de farm_plantations por fazenda
+        return [len(farm.farm_plantations) for farm in db_session.query(Farm)]
+
+    return TestClient(app)
+
+
+def test_sql_stats_headers(test_client, monkeypatch, user_payload):
+    monkeypatch.setattr(instrumentation, "SQL_STATS_HEADERS", True)
+    test_client.post("/api/v1/productor/", json=user_payload)
+
+    response = test_client.get("/api/v1/productor/")
+    assert response.headers["X-SQL-Count"] == "1"
+    assert float(response.headers["X-SQL-Time-Ms"]) >= float(
+        response.headers["X-SQL-Slowest-Ms"])
+    assert "X-SQL-N-Plus-One" not in response.headers
+
+
+def test_n_plus_one_raises(n_plus_one_client):
+    with pytest.raises(NPlusOneError, match="Farm.farm_plantations"):
+        n_plus_one_client.get("/farms/plantations")
+
+
+def test_n_plus_one_warns(n_plus_one_client, monkeypatch):
+    monkeypatch.setattr(instrumentation, "SQL_N_PLUS_ONE", "warn")
+    monkeypatch.setattr(instrumentation, "SQL_STATS_HEADERS", True)
+    response = n_plus_one_client.get("/farms/plantations")
+    assert response.json() == [0, 0, 0]
+    assert response.headers["X-SQL-Count"] == "4"
+    # O lazy load e o comando idêntico repetido
+    assert response.headers["X-SQL-N-Plus-One"] == "2"
@@ -0,0 +1,27 @@
+"""
+Metrics Unit Tests
+"""
+
+
+def test_metrics_endpoint(test_client, user_payload):
+    test_client.post("/api/v1/productor/", json=user_payload)
+    test_client.get("/api/v1/productor/1")
+    test_client.get("/api/v1/reports/total-farms")
+    test_client.get("/api/v1/reports/total-farms")
+
+    response = test_client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+
+    # Rótulo com o template da rota, não com o ID
+    assert (
+        'http_requests_total{method="GET",route="/api/v1/productor/{productor_id}",'
+        'status="200"}' in body
+    )
+    assert 'http_request_duration_seconds_bucket{le="0.005",method="POST",route="/api/v1/productor/"}' in body
+    assert 'http_requests_in_progress{method="GET"}' in body
+    assert 'report_compute_duration_seconds_count{report="total_farms",source="live"}' in body
+    assert 'report_cache_requests_total{report="total_farms",result="hit"}' in body
+    assert "report_cache_hit_ratio" in body
+    assert 'db_pool_connections_in_use{engine="primary"}' in body
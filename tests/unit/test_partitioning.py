@@ -0,0 +1,166 @@
+"""
+Season Partitioning Unit Tests
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
+
+from app.db.models.report_season_plantation_rollup import ReportSeasonPlantationRollup
+from app.db.partitioning import (
+    COPY_BATCH,
+    SWAP_LOCKS,
+    build_statements,
+    cleanup_statements,
+    convert,
+    detach_statement,
+    partition_ddl,
+    partition_name,
+    swap_statements,
+    sync_statements,
+)
+from app.db.repositories.report_rollup_repository import ReportRollupRepository
+
+
+def test_convert_statements():
+    build = build_statements(partitioned=True)
+    # Restos de uma conversão interrompida saem primeiro, o trigger antes
+    # da tabela nova
+    assert build[:3] == cleanup_statements()
+    assert build[0] == (
+        "DROP TRIGGER IF EXISTS farm_plantation_season_new_sync "
+        "ON farm_plantation_season"
+    )
+    assert build[2] == "DROP TABLE IF EXISTS farm_plantation_season_new"
+    assert build[3].endswith("PARTITION BY LIST (season_id)")
+    assert "PRIMARY KEY (id, season_id)" in build[4]
+    # Os índices são criados com a tabela ainda vazia
+    assert (
+        "CREATE INDEX ix_farm_plantation_season_season_plantation_new ON "
+        "farm_plantation_season_new (season_id, plantation_id) INCLUDE (farm_id)"
+    ) in build
+    assert not any("LOCK" in statement for statement in build)
+    assert partition_ddl(1, parent="farm_plantation_season_new") == (
+        "CREATE TABLE IF NOT EXISTS farm_plantation_season_s1 PARTITION OF "
+        "farm_plantation_season_new FOR VALUES IN (1)"
+    )
+
+    # As escritas durante a cópia são replicadas pelo trigger, que cria a
+    # partição de safras novas
+    function, trigger = sync_statements(partitioned=True)
+    assert "DELETE FROM farm_plantation_season_new WHERE id = OLD.id" in function
+    assert "PARTITION OF farm_plantation_season_new" in function
+    assert trigger == (
+        "CREATE TRIGGER farm_plantation_season_new_sync AFTER INSERT OR UPDATE "
+        "OR DELETE ON farm_plantation_season FOR EACH ROW EXECUTE FUNCTION "
+        "farm_plantation_season_new_sync()"
+    )
+    assert "PARTITION" not in sync_statements(partitioned=False)[0]
+
+    # A cópia é feita em lotes pela chave primária, sem lock de tabela
+    assert "WHERE id > :after" in COPY_BATCH
+    assert "LIMIT :batch_size" in COPY_BATCH
+    assert "ON CONFLICT DO NOTHING" in COPY_BATCH
+    assert "LOCK TABLE" not in COPY_BATCH
+
+    assert SWAP_LOCKS[-1] == (
+        "LOCK TABLE farm_plantation_season IN ACCESS EXCLUSIVE MODE")
+    swap = swap_statements("public.fps_id_seq")
+    # Sob o lock exclusivo, nenhuma linha é copiada
+    assert not any(statement.startswith("INSERT") for statement in swap)
+    assert swap.index("DROP TABLE farm_plantation_season") > 0
+    assert (
+        "ALTER INDEX ux_farm_plantation_season_new RENAME TO ux_farm_plantation_season"
+    ) in swap
+    assert swap[-1] == "DROP FUNCTION farm_plantation_season_new_sync()"
+
+
+def test_revert_statements_recreate_plain_table():
+    statements = build_statements(partitioned=False)
+
+    assert "PARTITION" not in " ".join(statements)
+    assert "PRIMARY KEY (id)" in statements[4]
+
+
+def test_detach_statement():
+    assert detach_statement(3, concurrently=True) == (
+        "ALTER TABLE farm_plantation_season DETACH PARTITION "
+        "farm_plantation_season_s3 CONCURRENTLY"
+    )
+    assert not detach_statement(3, concurrently=False).endswith("CONCURRENTLY")
+
+
+def test_partitioning_requires_postgres(tmp_path):
+    with pytest.raises(NotImplementedError):
+        convert(create_engine(f"sqlite:///{tmp_path}/partitioning.db"))
+
+
+def test_remove_season_from_rollup(test_client, db_session, user_payload, farm_payload, plantation_data, season_data):
+    productor_id = test_client.post("/api/v1/productor/", json=user_payload).json()["id"]
+    farm_payload["productor_id"] = productor_id
+    farm_id = test_client.post("/api/v1/farm/", json=farm_payload).json()["id"]
+    plantation_id = test_client.post(
+        "/api/v1/plantation/", json=plantation_data).json()["id"]
+    season_ids = [
+        test_client.post("/api/v1/season/", json=season_data).json()["id"]
+        for _ in range(2)
+    ]
+    for season_id in season_ids:
+        response = test_client.put(
+            f"/api/v1/farm/{farm_id}/add-plantation",
+            json={"plantation_id": plantation_id, "season_id": season_id},
+        )
+        assert response.status_code == 200
+
+    ReportRollupRepository(db_session).remove_season(season_ids[0])
+
+    remaining = db_session.query(ReportSeasonPlantationRollup.season_id).all()
+    assert [season_id for (season_id,) in remaining] == [season_ids[1]]
+
+
+
+def test_season_partition_hook_registered_with_model():
+    # Processos que só importam o modelo (FAST_STARTUP, scripts, workers)
+    # também criam a partição das novas safras
+    code = (
+        "import sys\n"
+        "from sqlalchemy import event\n"
+        "from app.db.models import season\n"
+        "assert event.contains(\n"
+        "    season.Season, 'after_insert', season._create_season_partition)\n"
+        "assert 'app.db.partitioning' not in sys.modules\n"
+    )
+    env = {**os.environ, "DATABASE_URL": "sqlite://"}
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+
+class MissingPartition(Exception):
+    pgcode = "23514"
+
+    def __str__(self):
+        return (
+            'no partition of relation "farm_plantation_season" found for row'
+        )
+
+
+def test_add_plantation_without_partition(test_client, db_session, monkeypatch, user_payload, farm_payload, plantation_data, season_data):
+    productor_id = test_client.post("/api/v1/productor/", json=user_payload).json()["id"]
+    farm_payload["productor_id"] = productor_id
+    farm_id = test_client.post("/api/v1/farm/", json=farm_payload).json()["id"]
+    plantation_id = test_client.post(
+        "/api/v1/plantation/", json=plantation_data).json()["id"]
+    season_id = test_client.post("/api/v1/season/", json=season_data).json()["id"]
+
+    def scalars(*args, **kwargs):
+        raise IntegrityError("INSERT", {}, MissingPartition())
+
+    monkeypatch.setattr(db_session, "scalars", scalars)
+    response = test_client.put(
+        f"/api/v1/farm/{farm_id}/add-plantation",
+        json={"plantation_id": plantation_id, "season_id": season_id},
+    )
+    assert response.status_code == 409
+    assert response.json()["detail"] == f"No partition for season {season_id}"
@@ -1,4 +1,5 @@
 """Plantation Unit Tests"""
+from app.services.plantation_service import PlantationService
 
 
 # Teste de Listagem de Plantations
@@ -68,3 +69,38 @@ def test_delete_plantation(test_client, plantation_data):
     # Verifica se a plantation foi realmente deletada
     get_response = test_client.get(f"/api/v1/plantation/{plantation_id}")
     assert get_response.status_code == 404
+
+
+def test_get_plantation_seasons_constant_queries(test_client, db_session, user_payload, farm_payload, plantation_data, season_data, count_queries):
+    """
+    Testa que as safras de uma cultura são carregadas em uma única consulta,
+    independentemente da quantidade de safras.
+    """
+    productor_response = test_client.post(
+        "/api/v1/productor/", json=user_payload)
+    farm_payload["productor_id"] = productor_response.json()["id"]
+    farm_id = test_client.post("/api/v1/farm/", json=farm_payload).json()["id"]
+    plantation_id = test_client.post(
+        "/api/v1/plantation/", json=plantation_data).json()["id"]
+
+    query_counts = []
+    years = []
+    for round_ in range(2):
+        for index in range(3):
+            year = season_data["year"] + round_ * 3 + index
+            years.append(year)
+            season_id = test_client.post(
+                "/api/v1/season/", json={**season_data, "year": year}).json()["id"]
+            test_client.put(
+                f"/api/v1/farm/{farm_id}/add-plantation",
+                json={"plantation_id": plantation_id, "season_id": season_id},
+            )
+        db_session.expunge_all()
+        count_queries.clear()
+        farm_plantations = PlantationService(db_session).get_plantation_seasons(
+            plantation_id)
+        seasons = sorted(fps.season.year for fps in farm_plantations)
+        query_counts.append(len(count_queries))
+
+    assert query_counts == [1, 1]
+    assert seasons == years
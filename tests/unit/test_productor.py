@@ -1,6 +1,13 @@
 """
 Productor Unit Tests
 """
+import json
+
+from sqlalchemy import update
+
+from app.db.models.productor import Productor
+from app.db.repositories.productor_repository import ProductorRepository
+from app.utils.documents import submit_normalize_cpf_cnpjs
 
 
 def test_create_productor(test_client, user_payload):
@@ -83,3 +90,106 @@ def test_delete_productor(test_client, user_payload):
     # Check Deleted
     get_response = test_client.get(f"/api/v1/productor/{productor_id}")
     assert get_response.status_code == 404
+
+
+def test_get_productor_conditional(test_client, user_payload, user_payload_updated):
+    create_response = test_client.post("/api/v1/productor/", json=user_payload)
+    productor_id = create_response.json()["id"]
+
+    response = test_client.get(f"/api/v1/productor/{productor_id}")
+    etag = response.headers["ETag"]
+    response = test_client.get(
+        f"/api/v1/productor/{productor_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    test_client.put(
+        f"/api/v1/productor/{productor_id}", json=user_payload_updated)
+    response = test_client.get(
+        f"/api/v1/productor/{productor_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["name"] == "John McDonald da Silva"
+
+
+def test_import_productors(test_client, user_payload, count_queries):
+    test_client.post("/api/v1/productor/", json=user_payload)
+    body = "\n".join(
+        [
+            "name,cpf_cnpj,birthdate",
+            "Maria,111.444.777-35,1970-01-01",
+            "Fazendas SA,11222333000181,1990-03-10",
+            "John,12345678909,1950-05-02",
+            "Maria de novo,11144477735,1970-01-01",
+            "Inválido,123.456.789-89,1970-01-01",
+            "Sem data,529.982.247-25,",
+        ]
+    )
+    count_queries.clear()
+    response = test_client.post(
+        "/api/v1/productor/import?format=csv",
+        content=body,
+        headers={"Content-Type": "text/csv"},
+    )
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    items, summary = lines[:-1], lines[-1]
+    assert [item["index"] for item in items] == [0, 1, 2, 3, 4, 5]
+    assert [item["status_code"] for item in items] == [201, 201, 400, 400, 400, 422]
+    assert items[2]["detail"] == "CPF/CNPJ já cadastrado"
+    assert items[3]["detail"] == "CPF/CNPJ já cadastrado"
+    assert items[4]["detail"] == "CPF/CNPJ inválido"
+    assert summary == {"created": 2, "failed": 4}
+    # Um lote: uma consulta IN, um INSERT de várias linhas e a versão dos dados
+    assert len(count_queries) == 3
+
+    created = test_client.get(f"/api/v1/productor/{items[1]['id']}").json()
+    assert created["cpf_cnpj"] == "11.222.333/0001-81"
+
+
+def test_import_productors_ndjson(test_client):
+    body = "\n".join(
+        [
+            json.dumps(
+                {"name": "Maria", "cpf_cnpj": "11144477735", "birthdate": "1970-01-01"}
+            ),
+            "{nao e json",
+            "",
+            json.dumps({"name": "Sem documento", "birthdate": "1970-01-01"}),
+        ]
+    )
+    response = test_client.post("/api/v1/productor/import", content=body)
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [item["status_code"] for item in lines[:-1]] == [201, 422, 422]
+    assert lines[1]["detail"] == "JSON inválido"
+    assert lines[-1] == {"created": 1, "failed": 2}
+
+
+def test_normalize_cpf_cnpjs_in_pool():
+    values = ["111.444.777-35", "11222333000181", "123.456.789-89"] * 100
+    documents = submit_normalize_cpf_cnpjs(values, workers=2).result()
+    assert documents == ["111.444.777-35", "11.222.333/0001-81", None] * 100
+
+
+def test_update_productor_concurrent_conflict(
+    test_client, user_payload, user_payload_updated, monkeypatch
+):
+    productor_id = test_client.post("/api/v1/productor/", json=user_payload).json()["id"]
+
+    get_productor_by_id = ProductorRepository.get_productor_by_id
+
+    def get_then_concurrent_update(self, productor_id):
+        productor = get_productor_by_id(self, productor_id)
+        # Outra requisição atualiza o produtor entre a leitura e o UPDATE
+        productors = Productor.__table__
+        self.db.execute(
+            update(productors)
+            .where(productors.c.id == productor_id)
+            .values(version=productors.c.version + 1)
+        )
+        return productor
+
+    monkeypatch.setattr(
+        ProductorRepository, "get_productor_by_id", get_then_concurrent_update
+    )
+    response = test_client.put(
+        f"/api/v1/productor/{productor_id}", json=user_payload_updated)
+    assert response.status_code == 409
@@ -0,0 +1,116 @@
+"""
+Read Replica Routing Unit Tests
+"""
+import time
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import app.db.replica as replica
+from app.db.models.productor import Productor
+from app.db.replica import READ_PRIMARY_COOKIE, ReplicaRouter
+from app.db.session import Base
+from app.services.reports_service import reports_cache
+
+
+class LaggingReplicaRouter(ReplicaRouter):
+    def __init__(self, engine, lag):
+        super().__init__(engine, max_lag=5, check_interval=0)
+        self.fake_lag = lag
+
+    def measure_lag(self):
+        if self.fake_lag is None:
+            raise ConnectionError("réplica indisponível")
+        return self.fake_lag
+
+
+@pytest.fixture()
+def replica_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/replica.db")
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as session:
+        session.add(Productor(
+            name="Produtor da Réplica",
+            cpf_cnpj="111.444.777-35",
+            birthdate=date(1970, 1, 1),
+        ))
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def use_replica(monkeypatch, replica_engine):
+    def configure(lag=0.0):
+        router = LaggingReplicaRouter(replica_engine, lag)
+        monkeypatch.setattr(replica, "replica_router", router)
+        return router
+
+    return configure
+
+
+def list_names(test_client, **kwargs):
+    response = test_client.get("/api/v1/productor/", **kwargs)
+    return [productor["name"] for productor in response.json()]
+
+
+def test_reads_without_replica_use_primary(test_client, user_payload):
+    test_client.post("/api/v1/productor/", json=user_payload)
+    assert list_names(test_client) == ["John McDonald"]
+
+
+def test_list_reads_from_replica(test_client, use_replica):
+    router = use_replica()
+    assert list_names(test_client) == ["Produtor da Réplica"]
+    assert router.replica_reads == 1
+
+
+def test_read_after_write_uses_primary(test_client, use_replica, user_payload):
+    use_replica()
+    response = test_client.post("/api/v1/productor/", json=user_payload)
+    assert float(response.cookies[READ_PRIMARY_COOKIE]) > time.time()
+    # O TestClient reenvia o cookie: a leitura vê a própria escrita
+    assert list_names(test_client) == ["John McDonald"]
+
+    test_client.cookies.clear()
+    assert list_names(test_client) == ["Produtor da Réplica"]
+
+
+def test_lagging_replica_falls_back_to_primary(test_client, use_replica):
+    router = use_replica(lag=30.0)
+    assert list_names(test_client) == []
+    assert router.primary_fallbacks == 1
+
+    router.fake_lag = None
+    assert list_names(test_client) == []
+    assert router.stats()["lag_seconds"] is None
+
+
+def test_writes_and_single_reads_use_primary(test_client, use_replica):
+    use_replica()
+    response = test_client.get("/api/v1/productor/1")
+    assert response.status_code == 404
+
+
+def test_report_cache_is_separate_for_replica(
+    test_client, use_replica, user_payload, farm_payload
+):
+    use_replica()
+    reports_cache.clear()
+    productor_id = test_client.post("/api/v1/productor/", json=user_payload).json()["id"]
+    test_client.post("/api/v1/farm/", json={**farm_payload, "productor_id": productor_id})
+
+    # Logo após a escrita o cliente lê do primário, que já tem a fazenda
+    primary = test_client.get("/api/v1/reports/total-farms")
+    assert primary.json()["total_farms"] >= 1
+
+    # A réplica não tem fazendas; o resultado do primário em cache não serve
+    test_client.cookies.clear()
+    replica_response = test_client.get("/api/v1/reports/total-farms")
+    assert replica_response.json() == {"total_farms": 0}
+    assert replica_response.headers["ETag"] != primary.headers["ETag"]
+
+    test_client.cookies.set(READ_PRIMARY_COOKIE, str(time.time() + 60))
+    assert test_client.get("/api/v1/reports/total-farms").json() == primary.json()
@@ -1,4 +1,14 @@
 """Reports Unit Tests"""
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.db.session import DATA_VERSION_BUMP, get_data_version
+from app.services.reports_service import ReportsService, reports_cache
+from app.utils.serialization import dumps
+
 
 def test_get_total_farms(test_client, user_payload, farm_payload):
     # Cria um produtor
@@ -15,6 +25,7 @@ def test_get_total_farms(test_client, user_payload, farm_payload):
     assert response.status_code == 200
     assert response.json()["total_farms"] == 1
 
+
 def test_get_total_area(test_client, user_payload, farm_payload):
     # Cria um produtor
     productor_response = test_client.post(
@@ -30,6 +41,7 @@ def test_get_total_area(test_client, user_payload, farm_payload):
     assert response.status_code == 200
     assert response.json()["total_area"] == 100.0
 
+
 def test_get_state_statistics(test_client, user_payload, farm_payload):
     # Cria um produtor
     productor_response = test_client.post(
@@ -80,6 +92,7 @@ def test_get_state_statistics(test_client, user_payload, farm_payload):
         assert ground_use_stats["arable_area_total"] == 50.0  # Área cultivável
         assert ground_use_stats["arable_area_percent"] == 50.0  # 50% de área cultivável
 
+
 def test_get_plantation_statistics(test_client, user_payload, farm_payload, plantation_data, season_data, farm_plantation_season_data):
     # Cria um produtor
     productor_response = test_client.post(
@@ -133,6 +146,7 @@ def test_get_plantation_statistics(test_client, user_payload, farm_payload, plan
             assert plantation_stat["total_plantations"] == 1  # Apenas uma plantation foi adicionada
             assert plantation_stat["percent"] == 100.0  # 100% das plantações são dessa plantation
 
+
 def test_get_ground_use_statistics(test_client, user_payload, farm_payload):
     # Cria um produtor
     productor_response = test_client.post(
@@ -149,3 +163,334 @@ def test_get_ground_use_statistics(test_client, user_payload, farm_payload):
     assert response.json()["total_area"] == 100.0
     assert response.json()["vegetation_area_total"] == 30.0
     assert response.json()["arable_area_total"] == 50.0
+
+
+def test_get_state_statistics_multiple_states(test_client, user_payload, farm_payload, plantation_data, season_data, count_queries):
+    # Cria um produtor
+    productor_response = test_client.post(
+        "/api/v1/productor/", json=user_payload)
+    productor_id = productor_response.json()["id"]
+    farm_payload["productor_id"] = productor_id
+
+    # Cria duas fazendas em SP e uma em MG
+    farm_ids = []
+    for state in ["SP", "SP", "MG"]:
+        farm_payload["state"] = state
+        farm_response = test_client.post("/api/v1/farm/", json=farm_payload)
+        farm_ids.append(farm_response.json()["id"])
+
+    # Adiciona duas culturas na primeira fazenda de SP
+    season_id = test_client.post(
+        "/api/v1/season/", json=season_data).json()["id"]
+    for _ in range(2):
+        plantation_id = test_client.post(
+            "/api/v1/plantation/", json=plantation_data).json()["id"]
+        test_client.put(
+            f"/api/v1/farm/{farm_ids[0]}/add-plantation",
+            json={"plantation_id": plantation_id, "season_id": season_id},
+        )
+
+    count_queries.clear()
+    response = test_client.get("/api/v1/reports/state-statistics")
+    assert response.status_code == 200
+    # Versão dos dados, uma consulta agrupada por estado e uma linha de
+    # totais globais
+    assert len(count_queries) == 3
+
+    state_statistics = {item["state"]: item for item in response.json()}
+    assert state_statistics["SP"]["farms_total"] == 2
+    assert state_statistics["SP"]["farms_percent"] == 66.67
+    assert state_statistics["SP"]["plantation_statistics"] == {
+        "state_total": 2, "percent": 100.0}
+    assert state_statistics["SP"]["ground_use_statistics"]["total_area"] == 200.0
+    assert state_statistics["MG"]["farms_total"] == 1
+    assert state_statistics["MG"]["farms_percent"] == 33.33
+    assert state_statistics["MG"]["plantation_statistics"] == {
+        "state_total": 0, "percent": 0.0}
+    assert state_statistics["MG"]["ground_use_statistics"]["arable_area_percent"] == 50.0
+
+
+def test_get_plantation_statistics_multiple_seasons(test_client, user_payload, farm_payload, plantation_data, season_data, updated_season_data, count_queries):
+    # Cria um produtor e duas fazendas
+    productor_response = test_client.post(
+        "/api/v1/productor/", json=user_payload)
+    farm_payload["productor_id"] = productor_response.json()["id"]
+    farm_ids = [
+        test_client.post("/api/v1/farm/", json=farm_payload).json()["id"]
+        for _ in range(2)
+    ]
+
+    # Safra de 2023 com duas culturas e safra de 2024 com uma
+    season_ids = [
+        test_client.post("/api/v1/season/", json=data).json()["id"]
+        for data in (season_data, updated_season_data)
+    ]
+    plantation_ids = [
+        test_client.post("/api/v1/plantation/", json=plantation_data).json()["id"]
+        for _ in range(2)
+    ]
+    for farm_id, season_id, plantation_id in [
+        (farm_ids[0], season_ids[0], plantation_ids[0]),
+        (farm_ids[0], season_ids[0], plantation_ids[1]),
+        (farm_ids[1], season_ids[0], plantation_ids[1]),
+        (farm_ids[0], season_ids[1], plantation_ids[0]),
+    ]:
+        test_client.put(
+            f"/api/v1/farm/{farm_id}/add-plantation",
+            json={"plantation_id": plantation_id, "season_id": season_id},
+        )
+
+    count_queries.clear()
+    response = test_client.get("/api/v1/reports/plantation-statistics")
+    assert response.status_code == 200
+    # Versão dos dados; contagens e totais por safra vêm de uma única consulta
+    assert len(count_queries) == 2
+
+    statistics = {season["season_id"]: season for season in response.json()}
+    assert statistics[season_ids[0]]["season_plantations_total"] == 3
+    assert statistics[season_ids[0]]["statistics"] == [
+        {"plantation_id": plantation_ids[0], "total_plantations": 1, "percent": 33.33},
+        {"plantation_id": plantation_ids[1], "total_plantations": 2, "percent": 66.67},
+    ]
+    assert statistics[season_ids[1]]["season_plantations_total"] == 1
+
+    # Filtros por ano e por intervalo de safras
+    response = test_client.get(
+        "/api/v1/reports/plantation-statistics", params={"year_from": 2024})
+    assert [season["season_id"] for season in response.json()] == [season_ids[1]]
+    response = test_client.get(
+        "/api/v1/reports/plantation-statistics",
+        params={"season_to": season_ids[0]})
+    assert [season["season_id"] for season in response.json()] == [season_ids[0]]
+
+
+def test_rollup_reports_match_live(test_client, db_session, user_payload, farm_payload, plantation_data, season_data):
+    from app.db.repositories.report_rollup_repository import ReportRollupRepository
+    from app.services.reports_service import ReportsService
+
+    # Cria um produtor
+    productor_response = test_client.post(
+        "/api/v1/productor/", json=user_payload)
+    farm_payload["productor_id"] = productor_response.json()["id"]
+
+    # Cria fazendas em SP, PR e MG
+    farm_ids = []
+    for state in ["SP", "PR", "MG"]:
+        farm_payload["state"] = state
+        farm_response = test_client.post("/api/v1/farm/", json=farm_payload)
+        farm_ids.append(farm_response.json()["id"])
+
+    # Adiciona culturas às duas primeiras fazendas
+    season_id = test_client.post(
+        "/api/v1/season/", json=season_data).json()["id"]
+    plantation_id = test_client.post(
+        "/api/v1/plantation/", json=plantation_data).json()["id"]
+    for farm_id in farm_ids[:2]:
+        test_client.put(
+            f"/api/v1/farm/{farm_id}/add-plantation",
+            json={"plantation_id": plantation_id, "season_id": season_id},
+        )
+
+    # Move a fazenda de SP para MG, alterando as áreas, e remove a de MG
+    farm_payload.update(state="MG", total_area=300.0, arable_area=100.0)
+    test_client.put(f"/api/v1/farm/{farm_ids[0]}", json=farm_payload)
+    test_client.delete(f"/api/v1/farm/{farm_ids[2]}")
+
+    live = ReportsService(db_session, source="live")
+    rollup = ReportsService(db_session, source="rollup")
+    assert rollup.get_total_farms() == live.get_total_farms() == {"total_farms": 2}
+    assert rollup.get_total_area() == live.get_total_area()
+    assert rollup.get_state_statistics() == live.get_state_statistics()
+    assert rollup.get_plantation_statistics() == live.get_plantation_statistics()
+    assert rollup.get_ground_use_statistics() == live.get_ground_use_statistics()
+
+    rollup_repo = ReportRollupRepository(db_session)
+    assert rollup_repo.verify() == []
+    rollup_repo.rebuild()
+    assert rollup_repo.verify() == []
+    assert rollup.get_state_statistics() == live.get_state_statistics()
+
+
+def test_reports_cache_invalidated_by_writes(test_client, user_payload, farm_payload):
+    # Cria um produtor e uma fazenda
+    productor_response = test_client.post(
+        "/api/v1/productor/", json=user_payload)
+    farm_payload["productor_id"] = productor_response.json()["id"]
+    test_client.post("/api/v1/farm/", json=farm_payload)
+
+    hits = test_client.get("/api/v1/health/cache").json()["reports"]["hits"]
+    assert test_client.get("/api/v1/reports/total-farms").json()["total_farms"] == 1
+    assert test_client.get("/api/v1/reports/total-farms").json()["total_farms"] == 1
+    assert test_client.get("/api/v1/health/cache").json()["reports"]["hits"] == hits + 1
+
+    # Uma nova fazenda incrementa a versão dos dados e invalida o cache
+    test_client.post("/api/v1/farm/", json=farm_payload)
+    assert test_client.get("/api/v1/reports/total-farms").json()["total_farms"] == 2
+
+    # use_cache=false ignora o cache
+    stats = test_client.get("/api/v1/health/cache").json()["reports"]
+    response = test_client.get(
+        "/api/v1/reports/total-farms", params={"use_cache": False})
+    assert response.json()["total_farms"] == 2
+    after = test_client.get("/api/v1/health/cache").json()["reports"]
+    assert (after["hits"], after["misses"]) == (stats["hits"], stats["misses"])
+
+
+def test_data_version_shared_between_workers(test_client, db_session, user_payload, farm_payload):
+    productor_response = test_client.post(
+        "/api/v1/productor/", json=user_payload)
+    farm_payload["productor_id"] = productor_response.json()["id"]
+
+    # A versão fica no banco e muda na mesma transação da escrita
+    version = get_data_version(db_session)
+    test_client.post("/api/v1/farm/", json=farm_payload)
+    assert get_data_version(db_session) == version + 1
+
+    rollup = ReportsService(db_session, source="rollup", use_cache=True)
+    assert rollup.get_total_farms() == {"total_farms": 1}
+
+    # Escrita de outro worker: não passa pelos eventos desta sessão, mas
+    # incrementa a mesma linha de data_version e invalida o cache deste
+    db_session.execute(
+        text("UPDATE report_state_rollup SET farms_total = farms_total + 1"))
+    db_session.connection().execute(DATA_VERSION_BUMP)
+    rollup = ReportsService(db_session, source="rollup", use_cache=True)
+    assert rollup.get_total_farms() == {"total_farms": 2}
+    assert get_data_version(db_session) == version + 2
+
+
+def test_reports_conditional(test_client, user_payload, farm_payload, count_queries):
+    productor_response = test_client.post(
+        "/api/v1/productor/", json=user_payload)
+    farm_payload["productor_id"] = productor_response.json()["id"]
+    test_client.post("/api/v1/farm/", json=farm_payload)
+
+    response = test_client.get("/api/v1/reports/ground-use-statistics")
+    etag = response.headers["ETag"]
+
+    # O 304 só consulta a versão dos dados, mesmo sem o cache: o relatório
+    # não é calculado nem serializado
+    for params in [{}, {"use_cache": False}]:
+        count_queries.clear()
+        response = test_client.get(
+            "/api/v1/reports/ground-use-statistics",
+            params=params,
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == 304
+        assert count_queries == ["SELECT version FROM data_version WHERE id = 1"]
+
+    test_client.post("/api/v1/farm/", json=farm_payload)
+    response = test_client.get(
+        "/api/v1/reports/ground-use-statistics", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["total_area"] == 200.0
+
+
+def test_reports_etag_is_shared_between_workers(test_client, user_payload, farm_payload):
+    productor_response = test_client.post(
+        "/api/v1/productor/", json=user_payload)
+    farm_payload["productor_id"] = productor_response.json()["id"]
+    test_client.post("/api/v1/farm/", json=farm_payload)
+    etag = test_client.get("/api/v1/reports/dashboard").headers["ETag"]
+
+    # Outro worker tem o próprio cache; com os mesmos dados, o ETag é o mesmo
+    reports_cache.clear()
+    response = test_client.get(
+        "/api/v1/reports/dashboard", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_get_dashboard(test_client, user_payload, farm_payload, plantation_data, season_data, count_queries):
+    productor_response = test_client.post(
+        "/api/v1/productor/", json=user_payload)
+    farm_payload["productor_id"] = productor_response.json()["id"]
+    farm_id = test_client.post("/api/v1/farm/", json=farm_payload).json()["id"]
+    farm_payload["state"] = "MG"
+    test_client.post("/api/v1/farm/", json=farm_payload)
+
+    season_id = test_client.post(
+        "/api/v1/season/", json=season_data).json()["id"]
+    plantation_id = test_client.post(
+        "/api/v1/plantation/", json=plantation_data).json()["id"]
+    test_client.put(
+        f"/api/v1/farm/{farm_id}/add-plantation",
+        json={"plantation_id": plantation_id, "season_id": season_id},
+    )
+
+    count_queries.clear()
+    response = test_client.get("/api/v1/reports/dashboard")
+    assert response.status_code == 200
+    dashboard = response.json()
+    # Versão dos dados, totais globais, agregados por estado e uma consulta
+    # de culturas
+    assert len(count_queries) == 4
+
+    endpoints = {
+        "total_farms": "total-farms",
+        "total_area": "total-area",
+        "state_statistics": "state-statistics",
+        "plantation_statistics": "plantation-statistics",
+        "ground_use_statistics": "ground-use-statistics",
+    }
+    for section, endpoint in endpoints.items():
+        assert dashboard[section] == test_client.get(
+            f"/api/v1/reports/{endpoint}").json()
+
+
+def test_get_dashboard_sections(test_client, user_payload, farm_payload):
+    productor_response = test_client.post(
+        "/api/v1/productor/", json=user_payload)
+    farm_payload["productor_id"] = productor_response.json()["id"]
+    test_client.post("/api/v1/farm/", json=farm_payload)
+
+    response = test_client.get(
+        "/api/v1/reports/dashboard",
+        params={"sections": ["total_farms", "ground_use_statistics"]},
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "total_farms": {"total_farms": 1},
+        "ground_use_statistics": {
+            "vegetation_area_percent": 30.0,
+            "vegetation_area_total": 30.0,
+            "arable_area_percent": 50.0,
+            "arable_area_total": 50.0,
+            "total_area": 100.0,
+        },
+    }
+
+    response = test_client.get(
+        "/api/v1/reports/dashboard", params={"sections": ["unknown"]})
+    assert response.status_code == 422
+
+
+def test_plantation_statistics_with_decimal_totals(db_session):
+    # No Postgres, a soma em janela chega como Decimal
+    rows = [(1, 10, Decimal("1"), Decimal("2")), (1, 11, 1, Decimal("2"))]
+    statistics = ReportsService(db_session)._build_plantation_statistics(rows)
+
+    assert statistics == [{
+        "season_id": 1,
+        "season_plantations_total": 2,
+        "statistics": [
+            {"plantation_id": 10, "total_plantations": 1, "percent": 50.0},
+            {"plantation_id": 11, "total_plantations": 1, "percent": 50.0},
+        ],
+    }]
+    assert all(
+        type(item["percent"]) is float for item in statistics[0]["statistics"])
+    assert b'"percent":50.0' in dumps(statistics)
+
+
+@pytest.mark.postgres
+def test_dashboard_snapshot_with_open_transaction(postgres_engine):
+    with Session(postgres_engine) as session:
+        reports_service = ReportsService(session, use_cache=False)
+        # A leitura da versão dos dados já abriu a transação da sessão
+        reports_service.data_version()
+        with reports_service._snapshot() as snapshot:
+            isolation = snapshot.db.execute(
+                text("SHOW transaction_isolation")).scalar()
+        assert isolation == "repeatable read"
+        assert reports_service.get_dashboard()["total_farms"] == {"total_farms": 0}
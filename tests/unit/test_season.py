@@ -1,5 +1,8 @@
 """Seasons Unit Tests"""
 
+from app.services.season_service import SeasonService
+
+
 def test_create_season(test_client, season_data):
     """
     Testa a criação de uma nova safra.
@@ -35,6 +38,44 @@ def test_list_seasons(test_client, season_data):
     assert list_response.status_code == 200
     assert len(list_response.json()) > 0
 
+def test_list_seasons_with_cursor(test_client, season_data):
+    """
+    Testa a paginação por cursor da listagem de safras.
+    """
+    created_ids = [
+        test_client.post("/api/v1/season/", json=season_data).json()["id"]
+        for _ in range(5)
+    ]
+
+    # Percorre as páginas seguindo o cabeçalho X-Next-Cursor
+    listed_ids = []
+    params = {"limit": 2}
+    while True:
+        response = test_client.get("/api/v1/season/", params=params)
+        assert response.status_code == 200
+        listed_ids.extend(season["id"] for season in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        params = {"limit": 2, "cursor": cursor}
+
+    assert listed_ids == sorted(listed_ids)
+    assert set(created_ids) <= set(listed_ids)
+    assert len(listed_ids) == len(set(listed_ids))
+
+    # O offset continua funcionando e equivale à mesma ordem
+    offset_response = test_client.get(
+        "/api/v1/season/", params={"offset": 2, "limit": 2})
+    assert [season["id"] for season in offset_response.json()] == listed_ids[2:4]
+
+def test_list_seasons_invalid_cursor(test_client):
+    """
+    Testa que um cursor inválido retorna 400.
+    """
+    response = test_client.get("/api/v1/season/", params={"cursor": "inválido"})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Cursor inválido"}
+
 def test_update_season(test_client, season_data, updated_season_data):
     """
     Testa a atualização de uma safra existente.
@@ -67,3 +108,33 @@ def test_delete_season(test_client, season_data):
     # Verifica se a safra foi realmente deletada
     get_response = test_client.get(f"/api/v1/season/{season_id}")
     assert get_response.status_code == 404
+
+def test_get_season_plantations_constant_queries(test_client, db_session, user_payload, farm_payload, plantation_data, season_data, count_queries):
+    """
+    Testa que as culturas de uma safra são carregadas em uma única consulta,
+    independentemente da quantidade de culturas.
+    """
+    productor_response = test_client.post(
+        "/api/v1/productor/", json=user_payload)
+    farm_payload["productor_id"] = productor_response.json()["id"]
+    farm_id = test_client.post("/api/v1/farm/", json=farm_payload).json()["id"]
+    season_id = test_client.post(
+        "/api/v1/season/", json=season_data).json()["id"]
+
+    query_counts = []
+    for _ in range(2):
+        for _ in range(3):
+            plantation_id = test_client.post(
+                "/api/v1/plantation/", json=plantation_data).json()["id"]
+            test_client.put(
+                f"/api/v1/farm/{farm_id}/add-plantation",
+                json={"plantation_id": plantation_id, "season_id": season_id},
+            )
+        db_session.expunge_all()
+        count_queries.clear()
+        farm_plantations = SeasonService(db_session).get_season_plantations(season_id)
+        names = [fps.plantation.name for fps in farm_plantations]
+        query_counts.append(len(count_queries))
+
+    assert query_counts == [1, 1]
+    assert names == [plantation_data["name"]] * 6
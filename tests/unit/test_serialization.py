@@ -0,0 +1,71 @@
+"""
+Fast JSON Serialization Unit Tests
+"""
+from decimal import Decimal
+
+import pytest
+
+import app.utils.serialization as serialization
+from app.schemas.farm import Farm
+from app.schemas.farm_plantation_season import PlantationSeason
+from app.utils.pagination import NEXT_CURSOR_HEADER
+from app.utils.serialization import dumps, row_encoder
+
+FAST_PATHS = [
+    "/api/v1/farm/",
+    "/api/v1/farm/?limit=1",
+    "/api/v1/productor/",
+    "/api/v1/plantation/",
+    "/api/v1/season/",
+    "/api/v1/reports/total-farms",
+    "/api/v1/reports/total-area",
+    "/api/v1/reports/state-statistics",
+    "/api/v1/reports/plantation-statistics",
+    "/api/v1/reports/ground-use-statistics",
+    "/api/v1/reports/dashboard",
+    "/api/v1/reports/dashboard?sections=total_area",
+]
+
+
+@pytest.fixture()
+def seeded(test_client, user_payload, farm_payload, plantation_data, season_data):
+    productor_id = test_client.post("/api/v1/productor/", json=user_payload).json()["id"]
+    farm_payload["productor_id"] = productor_id
+    farm_ids = [
+        test_client.post("/api/v1/farm/", json=farm_payload).json()["id"]
+        for _ in range(2)
+    ]
+    plantation_id = test_client.post(
+        "/api/v1/plantation/", json=plantation_data).json()["id"]
+    season_id = test_client.post("/api/v1/season/", json=season_data).json()["id"]
+    test_client.put(
+        f"/api/v1/farm/{farm_ids[0]}/add-plantation",
+        json={"plantation_id": plantation_id, "season_id": season_id},
+    )
+    return productor_id
+
+
+def test_fast_responses_match_response_model(test_client, seeded, monkeypatch):
+    paths = FAST_PATHS + [f"/api/v1/productor/{seeded}/farms"]
+    fast = {path: test_client.get(path) for path in paths}
+
+    monkeypatch.setattr(serialization, "FAST_JSON_RESPONSES", False)
+    for path in paths:
+        response = test_client.get(path)
+        assert response.status_code == fast[path].status_code == 200
+        # Mesmos bytes que a validação e serialização pelo response_model
+        assert fast[path].content == response.content, path
+        assert fast[path].headers["content-type"] == "application/json"
+
+    # Cabeçalhos do Response injetado são preservados
+    assert NEXT_CURSOR_HEADER in fast["/api/v1/farm/?limit=1"].headers
+    assert "ETag" in fast["/api/v1/reports/dashboard"].headers
+
+
+def test_row_encoder_falls_back_to_type_adapter_for_nested_schemas():
+    assert row_encoder(Farm).trusted
+    assert not row_encoder(PlantationSeason).trusted
+
+
+def test_dumps_converts_postgres_numeric_sums():
+    assert dumps({"total": Decimal("3"), "area": Decimal("1.5")}) == b'{"total":3,"area":1.5}'
@@ -0,0 +1,71 @@
+"""
+Fast Startup Unit Tests
+"""
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.config import OPENAPI_FILE
+from app.core.openapi import build_openapi, load_openapi
+from app.db.pool import InstrumentedQueuePool
+from app.db.startup import (
+    SchemaRevisionError,
+    alembic_heads,
+    check_schema_revision,
+    warm_pool,
+)
+from main import app
+
+
+def test_shipped_openapi_is_up_to_date():
+    with open(OPENAPI_FILE, encoding="utf-8") as file:
+        shipped = json.load(file)
+
+    # Se falhar, gere o arquivo novamente com: python -m app.core.openapi
+    assert shipped == build_openapi(app)
+
+
+def test_load_openapi_serves_pregenerated_document(tmp_path):
+    path = tmp_path / "openapi.json"
+    path.write_text(json.dumps({"openapi": "3.1.0", "info": {"title": "Pré-gerado"}}))
+    fresh_app = FastAPI()
+
+    assert load_openapi(fresh_app, path)
+    response = TestClient(fresh_app).get("/openapi.json")
+
+    assert response.json()["info"]["title"] == "Pré-gerado"
+    assert not load_openapi(FastAPI(), tmp_path / "missing.json")
+
+
+def test_check_schema_revision(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/startup.db")
+
+    with pytest.raises(SchemaRevisionError):
+        check_schema_revision(engine)
+
+    heads = alembic_heads()
+    with engine.begin() as connection:
+        connection.execute(
+            text("CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)"))
+        for head in heads:
+            connection.execute(
+                text("INSERT INTO alembic_version VALUES (:head)"), {"head": head})
+
+    assert check_schema_revision(engine) == heads
+    engine.dispose()
+
+
+def test_warm_pool_is_limited_to_pool_size(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path}/warm.db",
+        poolclass=InstrumentedQueuePool,
+        pool_size=3,
+        max_overflow=5,
+    )
+
+    assert warm_pool(engine, 10) == 3
+    assert engine.pool.checkedin() == 3
+    engine.dispose()